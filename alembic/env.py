@@ -1,16 +1,13 @@
 import asyncio
 import os
-from dotenv import load_dotenv
 from app.core.config import DATABASE_URL
 from logging.config import fileConfig
 from sqlalchemy import pool
 from sqlalchemy.engine import Connection
 from sqlalchemy.ext.asyncio import async_engine_from_config
-from app.core.database import Base
+from app.core.database import Base, CONNECT_ARGS
 from alembic import context
 
-load_dotenv()
-
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
 config = context.config
@@ -74,6 +71,7 @@ async def run_async_migrations() -> None:
         config.get_section(config.config_ini_section, {}),
         prefix="sqlalchemy.",
         poolclass=pool.NullPool,
+        connect_args=CONNECT_ARGS,
     )
 
     async with connectable.connect() as connection:
@@ -0,0 +1,33 @@
+"""document audit meta gin usage
+
+Revision ID: 210ee52828c7
+Revises: 57818f80542f
+Create Date: 2026-10-17 11:20:05.773901
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa  # noqa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '210ee52828c7'
+down_revision: Union[str, Sequence[str], None] = '57818f80542f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(
+        """
+        COMMENT ON INDEX audit.ix_audit_logs_meta_gin IS
+        'jsonb_path_ops: only containment is indexed. Filter with meta @> ''{"k": "v"}''::jsonb, not meta->>''k'' = ''v''.'
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("COMMENT ON INDEX audit.ix_audit_logs_meta_gin IS NULL")
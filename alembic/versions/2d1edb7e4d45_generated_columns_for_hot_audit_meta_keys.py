@@ -0,0 +1,48 @@
+"""generated columns for hot audit meta keys
+
+Revision ID: 2d1edb7e4d45
+Revises: 210ee52828c7
+Create Date: 2026-10-17 12:04:19.286431
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa  # noqa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2d1edb7e4d45'
+down_revision: Union[str, Sequence[str], None] = '210ee52828c7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(
+        """
+        ALTER TABLE audit.audit_logs
+            ADD COLUMN IF NOT EXISTS session_id text GENERATED ALWAYS AS (meta->>'sid') STORED,
+            ADD COLUMN IF NOT EXISTS event_ticket_type_id bigint GENERATED ALWAYS AS (
+                CASE WHEN jsonb_typeof(meta->'event_ticket_type_id') = 'number'
+                     THEN (meta->>'event_ticket_type_id')::bigint
+                END
+            ) STORED
+        """
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_audit_logs_session_ts ON audit.audit_logs (session_id, ts_utc DESC) "
+        "WHERE session_id IS NOT NULL"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_audit_logs_ett_ts ON audit.audit_logs (event_ticket_type_id, ts_utc DESC) "
+        "WHERE event_ticket_type_id IS NOT NULL"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP INDEX IF EXISTS audit.ix_audit_logs_ett_ts")
+    op.execute("DROP INDEX IF EXISTS audit.ix_audit_logs_session_ts")
+    op.execute("ALTER TABLE audit.audit_logs DROP COLUMN IF EXISTS event_ticket_type_id, DROP COLUMN IF EXISTS session_id")
@@ -0,0 +1,59 @@
+"""covering audit actor index
+
+Revision ID: 3f18609c7d1a
+Revises: 2d1edb7e4d45
+Create Date: 2026-10-17 12:37:52.904166
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa  # noqa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f18609c7d1a'
+down_revision: Union[str, Sequence[str], None] = '2d1edb7e4d45'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _set_partition_options(options: str) -> None:
+    # Storage parameters can't be set on a partitioned parent, so apply them to every leaf
+    # and to the pg_partman template used for future children.
+    op.execute(
+        f"""
+        DO $$
+        DECLARE
+            r record;
+        BEGIN
+            FOR r IN
+                SELECT relid FROM pg_partition_tree('audit.audit_logs') WHERE isleaf
+                UNION ALL
+                SELECT template_table::regclass FROM partman.part_config
+                 WHERE parent_table = 'audit.audit_logs' AND template_table IS NOT NULL
+            LOOP
+                EXECUTE format('ALTER TABLE %s {options}', r.relid);
+            END LOOP;
+        END $$
+        """
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("DROP INDEX IF EXISTS audit.ix_audit_logs_actor_ts")
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_audit_logs_actor_ts ON audit.audit_logs (actor_user_id, ts_utc DESC) "
+        "INCLUDE (action, scope, status, object_type, object_id)"
+    )
+    _set_partition_options(
+        "SET (autovacuum_vacuum_scale_factor = 0.02, autovacuum_vacuum_insert_scale_factor = 0.02)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _set_partition_options("RESET (autovacuum_vacuum_scale_factor, autovacuum_vacuum_insert_scale_factor)")
+    op.execute("DROP INDEX IF EXISTS audit.ix_audit_logs_actor_ts")
+    op.execute("CREATE INDEX IF NOT EXISTS ix_audit_logs_actor_ts ON audit.audit_logs (actor_user_id, ts_utc DESC)")
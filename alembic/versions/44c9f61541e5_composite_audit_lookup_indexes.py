@@ -0,0 +1,74 @@
+"""composite audit lookup indexes
+
+Revision ID: 44c9f61541e5
+Revises: d84642608149
+Create Date: 2026-10-17 10:41:08.118530
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa  # noqa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '44c9f61541e5'
+down_revision: Union[str, Sequence[str], None] = 'd84642608149'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("DROP INDEX IF EXISTS audit.ix_audit_logs_ts")
+    op.execute("DROP INDEX IF EXISTS audit.ix_audit_logs_id")
+    op.execute("DROP INDEX IF EXISTS audit.ix_audit_logs_obj")
+    op.execute("DROP INDEX IF EXISTS audit.ix_audit_logs_order")
+    op.execute("DROP INDEX IF EXISTS audit.ix_audit_logs_payment")
+    op.execute("DROP INDEX IF EXISTS audit.ix_audit_logs_event")
+    op.execute("DROP INDEX IF EXISTS audit.ix_audit_logs_invoice")
+    op.execute("DROP INDEX IF EXISTS audit.ix_audit_logs_organizer")
+
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_audit_logs_obj_ts ON audit.audit_logs (object_type, object_id, ts_utc DESC) "
+        "WHERE object_id IS NOT NULL"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_audit_logs_order_ts ON audit.audit_logs (order_id, ts_utc DESC) "
+        "WHERE order_id IS NOT NULL"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_audit_logs_payment_ts ON audit.audit_logs (payment_id, ts_utc DESC) "
+        "WHERE payment_id IS NOT NULL"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_audit_logs_event_ts ON audit.audit_logs (event_id, ts_utc DESC) "
+        "WHERE event_id IS NOT NULL"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_audit_logs_invoice_ts ON audit.audit_logs (invoice_id, ts_utc DESC) "
+        "WHERE invoice_id IS NOT NULL"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_audit_logs_organizer_ts ON audit.audit_logs (organizer_id, ts_utc DESC) "
+        "WHERE organizer_id IS NOT NULL"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP INDEX IF EXISTS audit.ix_audit_logs_organizer_ts")
+    op.execute("DROP INDEX IF EXISTS audit.ix_audit_logs_invoice_ts")
+    op.execute("DROP INDEX IF EXISTS audit.ix_audit_logs_event_ts")
+    op.execute("DROP INDEX IF EXISTS audit.ix_audit_logs_payment_ts")
+    op.execute("DROP INDEX IF EXISTS audit.ix_audit_logs_order_ts")
+    op.execute("DROP INDEX IF EXISTS audit.ix_audit_logs_obj_ts")
+
+    op.execute("CREATE INDEX IF NOT EXISTS ix_audit_logs_ts ON audit.audit_logs (ts_utc DESC)")
+    op.execute("CREATE INDEX IF NOT EXISTS ix_audit_logs_obj ON audit.audit_logs (object_type, object_id)")
+    op.execute("CREATE INDEX IF NOT EXISTS ix_audit_logs_order ON audit.audit_logs (order_id)")
+    op.execute("CREATE INDEX IF NOT EXISTS ix_audit_logs_payment ON audit.audit_logs (payment_id)")
+    op.execute("CREATE INDEX IF NOT EXISTS ix_audit_logs_event ON audit.audit_logs (event_id)")
+    op.execute("CREATE INDEX IF NOT EXISTS ix_audit_logs_invoice ON audit.audit_logs (invoice_id)")
+    op.execute("CREATE INDEX IF NOT EXISTS ix_audit_logs_organizer ON audit.audit_logs (organizer_id)")
+    op.execute("CREATE INDEX IF NOT EXISTS ix_audit_logs_id ON audit.audit_logs (id)")
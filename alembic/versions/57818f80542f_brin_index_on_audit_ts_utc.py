@@ -0,0 +1,32 @@
+"""brin index on audit ts_utc
+
+Revision ID: 57818f80542f
+Revises: 44c9f61541e5
+Create Date: 2026-10-17 11:02:47.530214
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa  # noqa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '57818f80542f'
+down_revision: Union[str, Sequence[str], None] = '44c9f61541e5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("DROP INDEX IF EXISTS audit.ix_audit_logs_ts")
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_audit_logs_ts_brin ON audit.audit_logs "
+        "USING BRIN (ts_utc) WITH (pages_per_range = 32)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP INDEX IF EXISTS audit.ix_audit_logs_ts_brin")
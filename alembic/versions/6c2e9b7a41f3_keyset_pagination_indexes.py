@@ -0,0 +1,37 @@
+"""keyset pagination indexes
+
+Revision ID: 6c2e9b7a41f3
+Revises: d881e0cd752e
+Create Date: 2026-10-17 15:41:08.527116
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa  # noqa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6c2e9b7a41f3'
+down_revision: Union[str, Sequence[str], None] = 'd881e0cd752e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE INDEX IF NOT EXISTS ix_events_event_start_id ON events (event_start DESC, id DESC)")
+    op.execute("CREATE INDEX IF NOT EXISTS ix_orders_created_id ON orders (created_at DESC, id DESC)")
+    op.execute("CREATE INDEX IF NOT EXISTS ix_orders_user_created_id ON orders (user_id, created_at DESC, id DESC)")
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_invoices_issued_id ON invoices (issued_at DESC, id DESC) "
+        "WHERE issued_at IS NOT NULL"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP INDEX IF EXISTS ix_invoices_issued_id")
+    op.execute("DROP INDEX IF EXISTS ix_orders_user_created_id")
+    op.execute("DROP INDEX IF EXISTS ix_orders_created_id")
+    op.execute("DROP INDEX IF EXISTS ix_events_event_start_id")
@@ -0,0 +1,77 @@
+"""freeze closed audit partitions
+
+Revision ID: a502791de513
+Revises: cae0d7346494
+Create Date: 2026-10-17 14:21:09.538712
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa  # noqa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a502791de513'
+down_revision: Union[str, Sequence[str], None] = 'cae0d7346494'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION audit.freeze_partition(p regclass) RETURNS void
+        LANGUAGE plpgsql AS $$
+        DECLARE
+            v_index name;
+        BEGIN
+            SELECT c.relname INTO v_index
+              FROM pg_inherits i
+              JOIN pg_index x ON x.indexrelid = i.inhrelid
+              JOIN pg_class c ON c.oid = i.inhrelid
+             WHERE i.inhparent = 'audit.ix_audit_logs_actor_ts'::regclass
+               AND x.indrelid = p;
+
+            IF v_index IS NOT NULL THEN
+                EXECUTE format('CLUSTER %s USING %I', p, v_index);
+            END IF;
+            EXECUTE format('ANALYZE %s', p);
+            EXECUTE format('ALTER TABLE %s SET (autovacuum_enabled = false)', p);
+        END
+        $$
+        """
+    )
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION audit.freeze_closed_partitions() RETURNS void
+        LANGUAGE plpgsql AS $$
+        DECLARE
+            r record;
+        BEGIN
+            FOR r IN
+                SELECT relid FROM pg_partition_tree('audit.audit_logs')
+                 WHERE isleaf AND relid::text NOT LIKE '%\\_default'
+            LOOP
+                IF (SELECT child_end_time
+                      FROM partman.show_partition_info(r.relid::text, p_parent_table := 'audit.audit_logs'))
+                   = date_trunc('month', now()) THEN
+                    PERFORM audit.freeze_partition(r.relid);
+                END IF;
+            END LOOP;
+        END
+        $$
+        """
+    )
+    # VACUUM can't run inside a function, so the visibility map refresh after CLUSTER is its own job.
+    op.execute("SELECT cron.schedule('audit-freeze', '0 3 1 * *', 'SELECT audit.freeze_closed_partitions()')")
+    op.execute("SELECT cron.schedule('audit-vacuum', '0 5 1 * *', 'VACUUM (FREEZE, ANALYZE) audit.audit_logs')")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("SELECT cron.unschedule('audit-vacuum')")
+    op.execute("SELECT cron.unschedule('audit-freeze')")
+    op.execute("DROP FUNCTION IF EXISTS audit.freeze_closed_partitions()")
+    op.execute("DROP FUNCTION IF EXISTS audit.freeze_partition(regclass)")
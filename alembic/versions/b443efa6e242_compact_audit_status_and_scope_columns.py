@@ -0,0 +1,78 @@
+"""compact audit status and scope columns
+
+Revision ID: b443efa6e242
+Revises: 3f18609c7d1a
+Create Date: 2026-10-17 13:15:40.661920
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa  # noqa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b443efa6e242'
+down_revision: Union[str, Sequence[str], None] = '3f18609c7d1a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SCOPES = [
+    (1, 'AUTH'),
+    (2, 'USERS'),
+    (3, 'ADDRESSES'),
+    (4, 'ORGANIZERS'),
+    (5, 'VENUES'),
+    (6, 'SECTORS'),
+    (7, 'SEATS'),
+    (8, 'EVENTS'),
+    (9, 'EVENT_SECTORS'),
+    (10, 'TICKET_TYPES'),
+    (11, 'EVENT_TICKET_TYPES'),
+    (12, 'BOOKING'),
+    (13, 'CART'),
+    (14, 'PAYMENT_METHODS'),
+    (15, 'PAYMENTS'),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(
+        """
+        CREATE TABLE IF NOT EXISTS audit.scope_lookup(
+            id smallint PRIMARY KEY,
+            name text NOT NULL UNIQUE
+        )
+        """
+    )
+    values = ", ".join(f"({scope_id}, '{name}')" for scope_id, name in SCOPES)
+    op.execute(f"INSERT INTO audit.scope_lookup (id, name) VALUES {values} ON CONFLICT (id) DO NOTHING")
+
+    op.execute("ALTER TABLE audit.audit_logs DROP CONSTRAINT IF EXISTS chk_audit_status")
+    op.execute("ALTER TABLE audit.audit_logs ALTER COLUMN status TYPE boolean USING status = 'SUCCESS'")
+    op.execute("ALTER TABLE audit.audit_logs RENAME COLUMN status TO success")
+
+    cases = " ".join(f"WHEN '{name}' THEN {scope_id}" for scope_id, name in SCOPES)
+    op.execute(f"ALTER TABLE audit.audit_logs ALTER COLUMN scope TYPE smallint USING CASE scope {cases} END")
+    op.execute(
+        "ALTER TABLE audit.audit_logs ADD CONSTRAINT fk_audit_logs_scope "
+        "FOREIGN KEY (scope) REFERENCES audit.scope_lookup(id)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("ALTER TABLE audit.audit_logs DROP CONSTRAINT IF EXISTS fk_audit_logs_scope")
+    cases = " ".join(f"WHEN {scope_id} THEN '{name}'" for scope_id, name in SCOPES)
+    op.execute(f"ALTER TABLE audit.audit_logs ALTER COLUMN scope TYPE text USING CASE scope {cases} END")
+
+    op.execute("ALTER TABLE audit.audit_logs RENAME COLUMN success TO status")
+    op.execute(
+        "ALTER TABLE audit.audit_logs ALTER COLUMN status TYPE text "
+        "USING CASE WHEN status THEN 'SUCCESS' ELSE 'FAIL' END"
+    )
+    op.execute(
+        "ALTER TABLE audit.audit_logs ADD CONSTRAINT chk_audit_status CHECK (status IN ('SUCCESS','FAIL'))"
+    )
+    op.execute("DROP TABLE IF EXISTS audit.scope_lookup")
@@ -0,0 +1,83 @@
+"""tune audit partition storage
+
+Revision ID: cae0d7346494
+Revises: b443efa6e242
+Create Date: 2026-10-17 13:48:26.117093
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa  # noqa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'cae0d7346494'
+down_revision: Union[str, Sequence[str], None] = 'b443efa6e242'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+STORAGE_OPTIONS = (
+    "fillfactor = 100, toast_tuple_target = 8160, "
+    "autovacuum_freeze_min_age = 0, autovacuum_freeze_max_age = 200000000"
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Children are append-only: freeze eagerly, keep wide meta rows inline and stop autovacuum
+    # on months that are already closed (anti-wraparound vacuum still runs regardless).
+    op.execute(
+        f"""
+        DO $$
+        DECLARE
+            r record;
+            v_end timestamptz;
+        BEGIN
+            FOR r IN
+                SELECT relid FROM pg_partition_tree('audit.audit_logs') WHERE isleaf
+                UNION ALL
+                SELECT template_table::regclass FROM partman.part_config
+                 WHERE parent_table = 'audit.audit_logs' AND template_table IS NOT NULL
+            LOOP
+                EXECUTE format('ALTER TABLE %s SET ({STORAGE_OPTIONS})', r.relid);
+            END LOOP;
+
+            FOR r IN
+                SELECT relid FROM pg_partition_tree('audit.audit_logs')
+                 WHERE isleaf AND relid::text NOT LIKE '%\\_default'
+            LOOP
+                SELECT child_end_time INTO v_end
+                  FROM partman.show_partition_info(r.relid::text, p_parent_table := 'audit.audit_logs');
+                IF v_end <= date_trunc('month', now()) THEN
+                    EXECUTE format('ALTER TABLE %s SET (autovacuum_enabled = false)', r.relid);
+                END IF;
+            END LOOP;
+        END $$
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute(
+        """
+        DO $$
+        DECLARE
+            r record;
+        BEGIN
+            FOR r IN
+                SELECT relid FROM pg_partition_tree('audit.audit_logs') WHERE isleaf
+                UNION ALL
+                SELECT template_table::regclass FROM partman.part_config
+                 WHERE parent_table = 'audit.audit_logs' AND template_table IS NOT NULL
+            LOOP
+                EXECUTE format(
+                    'ALTER TABLE %s RESET (fillfactor, toast_tuple_target, autovacuum_freeze_min_age, '
+                    'autovacuum_freeze_max_age, autovacuum_enabled)',
+                    r.relid
+                );
+            END LOOP;
+        END $$
+        """
+    )
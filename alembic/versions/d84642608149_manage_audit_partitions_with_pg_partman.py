@@ -0,0 +1,70 @@
+"""manage audit partitions with pg_partman
+
+Revision ID: d84642608149
+Revises: e0e5040a2a43
+Create Date: 2026-10-17 10:12:31.402117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa  # noqa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd84642608149'
+down_revision: Union[str, Sequence[str], None] = 'e0e5040a2a43'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE SCHEMA IF NOT EXISTS partman")
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_partman SCHEMA partman")
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_cron")
+
+    # Rows that already spilled past the static 2025 ranges live in the old DEFAULT partition.
+    # Detach it so pg_partman can create its monthly children, then route the rows back through the parent.
+    op.execute("ALTER TABLE audit.audit_logs DETACH PARTITION audit.audit_logs_default")
+    op.execute("ALTER TABLE audit.audit_logs_default RENAME TO audit_logs_legacy_default")
+
+    op.execute(
+        """
+        SELECT partman.create_parent(
+            p_parent_table := 'audit.audit_logs',
+            p_control := 'ts_utc',
+            p_interval := '1 month',
+            p_premake := 4,
+            p_start_partition := to_char(
+                GREATEST(
+                    TIMESTAMPTZ '2026-01-01 00:00:00+00',
+                    date_trunc('month', COALESCE((SELECT min(ts_utc) FROM audit.audit_logs_legacy_default), now()))
+                ),
+                'YYYY-MM-DD HH24:MI:SS'
+            )
+        )
+        """
+    )
+    op.execute(
+        """
+        UPDATE partman.part_config
+           SET retention = '12 months',
+               retention_keep_table = false,
+               infinite_time_partitions = true
+         WHERE parent_table = 'audit.audit_logs'
+        """
+    )
+
+    op.execute("INSERT INTO audit.audit_logs OVERRIDING SYSTEM VALUE SELECT * FROM audit.audit_logs_legacy_default")
+    op.execute("DROP TABLE audit.audit_logs_legacy_default")
+
+    op.execute("SELECT cron.schedule('audit-partman', '0 2 * * *', 'CALL partman.run_maintenance_proc()')")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("SELECT cron.unschedule('audit-partman')")
+    op.execute("DELETE FROM partman.part_config WHERE parent_table = 'audit.audit_logs'")
+    op.execute("DROP EXTENSION IF EXISTS pg_partman")
+    op.execute("DROP SCHEMA IF EXISTS partman CASCADE")
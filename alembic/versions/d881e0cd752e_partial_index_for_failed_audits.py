@@ -0,0 +1,28 @@
+"""partial index for failed audits
+
+Revision ID: d881e0cd752e
+Revises: a502791de513
+Create Date: 2026-10-17 15:02:33.870254
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa  # noqa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd881e0cd752e'
+down_revision: Union[str, Sequence[str], None] = 'a502791de513'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE INDEX IF NOT EXISTS ix_audit_logs_fail_ts ON audit.audit_logs (ts_utc DESC) WHERE NOT success")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP INDEX IF EXISTS audit.ix_audit_logs_fail_ts")
@@ -1,11 +1,22 @@
+import orjson
+from typing import Any
 from fastapi import FastAPI, Request, status
 from fastapi.responses import JSONResponse
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from app.domain.exceptions import AppError, NotFound, Conflict, Unprocessable, Unauthorized, InvalidInput, Forbidden, \
     InternalError
 from app.core.ctx import REQUEST_ID_CTX
 
 MEDIA_TYPE = "application/problem+json"
 
+
+class ProblemResponse(JSONResponse):
+    media_type = MEDIA_TYPE
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
+
+
 _STATUS_BY_CLASS: dict[type[AppError], int] = {
     NotFound: status.HTTP_404_NOT_FOUND,
     Unauthorized: status.HTTP_401_UNAUTHORIZED,
@@ -28,39 +39,24 @@ _TITLES: dict[type[AppError], str] = {
     InternalError: "Internal Server Error",
 }
 
-def _www_authenticate_header(
-        scheme: str = "Bearer",
-        realm: str | None = "api",
-        error: str | None = "invalid_token",
-        error_description: str | None = None,
-) -> str:
-    parts = [scheme]
-    attributes = []
-    if realm:
-        attributes.append(f'realm="{realm}"')
-    if error:
-        attributes.append(f'error="{error}"')
-    if error_description:
-        attributes.append(f'error_description="{error_description}"')
-    if attributes:
-        parts.append(" " + ", ".join(attributes))
-    return "".join(parts)
-
-
-def _status_for(exc: AppError) -> int:
-    for cls in type(exc).mro():
-        if cls in _STATUS_BY_CLASS:
-            return _STATUS_BY_CLASS[cls]
+
+def _status_for(cls: type[AppError]) -> int:
+    for c in cls.__mro__:
+        if c in _STATUS_BY_CLASS:
+            return _STATUS_BY_CLASS[c]
     return status.HTTP_400_BAD_REQUEST
 
 
-def _title_for(exc: AppError) -> str:
-    for cls in type(exc).mro():
-        if cls in _TITLES:
-            return _TITLES[cls]
+def _title_for(cls: type[AppError]) -> str:
+    for c in cls.__mro__:
+        if c in _TITLES:
+            return _TITLES[c]
     return "Application Error"
 
 
+_BASE_WWW_AUTH = 'Bearer realm="api", error="invalid_token"'
+
+
 def _problem(
     request: Request,
     *,
@@ -69,7 +65,7 @@ def _problem(
     detail: str | None = None,
     extra: dict | None = None,
     headers: dict[str, str] | None = None,
-) -> JSONResponse:
+) -> ProblemResponse:
     body = {
         "status": http_status,
         "title": title,
@@ -81,30 +77,49 @@ def _problem(
         body["trace_id"] = req_id
     if extra:
         body.update({k: v for k, v in extra.items() if v is not None})
-    return JSONResponse(status_code=http_status, content=body, media_type=MEDIA_TYPE, headers=headers or {})
+    return ProblemResponse(status_code=http_status, content=body, headers=headers or {})
 
 
-def register_error_handler(app: FastAPI) -> None:
-    @app.exception_handler(AppError)
-    async def _app_error_handler(request: Request, exc: AppError):
-        status_code = _status_for(exc)
-        title = _title_for(exc)
+def _make_handler(http_status: int, title: str, www_authenticate: bool):
+    async def _app_error_handler(request: Request, exc: AppError) -> ProblemResponse:
         detail = str(exc) or None
-        extra = {"context": getattr(exc, "ctx", None)} if getattr(exc, "ctx", None) else None
+        extra = {"context": exc.ctx} if exc.ctx else None
 
         headers: dict[str, str] | None = None
-        if isinstance(exc, Unauthorized):
+        if www_authenticate:
             headers = {
-                "WWW-Authenticate": _www_authenticate_header(
-                    scheme="Bearer", realm="api", error="invalid_token", error_description=detail
-                )
+                "WWW-Authenticate": f'{_BASE_WWW_AUTH}, error_description="{detail}"' if detail else _BASE_WWW_AUTH
             }
 
         return _problem(
             request,
-            http_status=status_code,
+            http_status=http_status,
             title=title,
             detail=detail,
             extra=extra,
             headers=headers
         )
+
+    return _app_error_handler
+
+
+_POOL_RETRY_AFTER_SECONDS = "1"
+
+
+async def _pool_timeout_handler(request: Request, exc: PoolTimeoutError) -> ProblemResponse:
+    # Every pooled connection stayed busy for DB_POOL_TIMEOUT: shed the request so clients back off.
+    return _problem(
+        request,
+        http_status=status.HTTP_503_SERVICE_UNAVAILABLE,
+        title="Service Unavailable",
+        detail="Database is busy, retry shortly",
+        headers={"Retry-After": _POOL_RETRY_AFTER_SECONDS}
+    )
+
+
+def register_error_handler(app: FastAPI) -> None:
+    for cls in _STATUS_BY_CLASS:
+        app.add_exception_handler(
+            cls, _make_handler(_status_for(cls), _title_for(cls), issubclass(cls, Unauthorized))
+        )
+    app.add_exception_handler(PoolTimeoutError, _pool_timeout_handler)
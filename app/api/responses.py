@@ -0,0 +1,77 @@
+import hashlib
+from typing import Any, AsyncIterable, AsyncIterator, Awaitable, Callable
+from fastapi import Request, Response, status
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, TypeAdapter
+from app.core.cache import get_or_set
+
+JSON_MEDIA_TYPE = "application/json"
+
+
+def json_response(content: str | bytes, *, status_code: int = status.HTTP_200_OK) -> Response:
+    return Response(content=content, status_code=status_code, media_type=JSON_MEDIA_TYPE)
+
+
+def dto_response(dto: BaseModel, *, exclude_none: bool = False, status_code: int = status.HTTP_200_OK) -> Response:
+    return json_response(dto.model_dump_json(exclude_none=exclude_none), status_code=status_code)
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = {c.strip().removeprefix("W/") for c in header.split(",")}
+    return etag in candidates or "*" in candidates
+
+
+def _dump_with_adapter(adapter: TypeAdapter, value: Any, *, exclude_none: bool = False) -> str:
+    return adapter.dump_json(adapter.validate_python(value, from_attributes=True), exclude_none=exclude_none).decode()
+
+
+def etag_json_response(request: Request, body: str) -> Response:
+    etag = f'"{hashlib.blake2b(body.encode(), digest_size=16).hexdigest()}"'
+    # no-cache: clients keep the copy but revalidate every time, so a change is never served stale.
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if _etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type=JSON_MEDIA_TYPE, headers=headers)
+
+
+def etag_dto_response(request: Request, dto: BaseModel, *, exclude_none: bool = False) -> Response:
+    return etag_json_response(request, dto.model_dump_json(exclude_none=exclude_none))
+
+
+def etag_list_response(request: Request, adapter: TypeAdapter, items: Any, *, exclude_none: bool = False) -> Response:
+    return etag_json_response(request, _dump_with_adapter(adapter, items, exclude_none=exclude_none))
+
+
+async def cached_dto_response(
+        namespace: str,
+        params: BaseModel | None,
+        build: Callable[[], Awaitable[Any]],
+        *,
+        adapter: TypeAdapter | None = None,
+        exclude_none: bool = False
+) -> Response:
+    async def _render() -> str:
+        value = await build()
+        if adapter is not None:
+            return _dump_with_adapter(adapter, value, exclude_none=exclude_none)
+        return value.model_dump_json(exclude_none=exclude_none)
+
+    params_key = params.model_dump_json() if params is not None else ""
+    return json_response(await get_or_set(namespace, params_key, _render))
+
+
+async def _json_array_chunks(batches: AsyncIterable[list[BaseModel]]) -> AsyncIterator[bytes]:
+    yield b"["
+    sep = ""
+    async for batch in batches:
+        if batch:
+            yield (sep + ",".join(dto.model_dump_json() for dto in batch)).encode()
+            sep = ","
+    yield b"]"
+
+
+def streaming_array_response(batches: AsyncIterable[list[BaseModel]]) -> StreamingResponse:
+    return StreamingResponse(_json_array_chunks(batches), media_type=JSON_MEDIA_TYPE)
@@ -1,9 +1,9 @@
-from fastapi import APIRouter, status, Depends, Response
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, status, Depends, Response, Query
+from app.api.responses import dto_response
 from app.domain.addresses.models import Address
-from app.core.database import get_db
+from app.core.database import db_dependency
 from app.core.pagination import PageDTO
-from app.core.dependencies.auth import get_current_user_with_roles
+from app.core.dependencies.auth import REQUIRE_ANY_ROLE, REQUIRE_ADMIN_OR_ORGANIZER
 from app.core.dependencies.addresses import require_authorized_address
 from app.services import address_service
 from app.domain.addresses.schemas import AddressCreateDTO, AddressReadDTO, AddressPutDTO, AddressesQueryDTO
@@ -11,19 +11,18 @@ from typing import Annotated
 
 
 router = APIRouter(prefix='/addresses', tags=['addresses'])
-db_dependency = Annotated[AsyncSession, Depends(get_db)]
+_LOC_PREFIX_B = (router.prefix + "/").encode()
 
 
 @router.post(
     "",
     status_code=status.HTTP_201_CREATED,
     response_model=AddressReadDTO,
-    response_model_exclude_none=True,
-    dependencies=[Depends(get_current_user_with_roles("ADMIN", "ORGANIZER"))]
+    dependencies=[REQUIRE_ADMIN_OR_ORGANIZER]
 )
 async def create_address(schema: AddressCreateDTO, db: db_dependency, response: Response):
     address = await address_service.create_address(db, schema)
-    response.headers["Location"] = f"{router.prefix}/{address.id}"
+    response.raw_headers.append((b"location", _LOC_PREFIX_B + str(address.id).encode()))
     return address
 
 
@@ -31,22 +30,22 @@ async def create_address(schema: AddressCreateDTO, db: db_dependency, response:
     "",
     status_code=status.HTTP_200_OK,
     response_model=PageDTO[AddressReadDTO],
-    dependencies=[Depends(get_current_user_with_roles('ADMIN', 'ORGANIZER', 'CUSTOMER'))]
+    dependencies=[REQUIRE_ANY_ROLE]
 )
-async def list_addresses(db: db_dependency, query: Annotated[AddressesQueryDTO, Depends()]):
+async def list_addresses(db: db_dependency, query: Annotated[AddressesQueryDTO, Query()]):
     addresses = await address_service.list_addresses(db, query)
-    return addresses
+    return dto_response(addresses)
 
 
 @router.get(
     "/{address_id}",
     status_code=status.HTTP_200_OK,
     response_model=AddressReadDTO,
-    dependencies=[Depends(get_current_user_with_roles('ADMIN', 'ORGANIZER', 'CUSTOMER'))]
+    dependencies=[REQUIRE_ANY_ROLE]
 )
 async def get_address(address_id: int, db: db_dependency):
     address = await address_service.get_address(db, address_id)
-    return address
+    return dto_response(AddressReadDTO.model_validate(address))
 
 
 @router.put(
@@ -1,8 +1,6 @@
-from fastapi import APIRouter, Depends, status, Query
-from typing import Annotated
-from sqlalchemy.ext.asyncio import AsyncSession
-from app.core.database import get_db
-from app.core.dependencies.auth import get_current_user_with_roles
+from fastapi import APIRouter, status, Query
+from app.core.database import db_dependency
+from app.core.dependencies.auth import REQUIRE_ADMIN
 from app.services.booking_service import cleanup_expired_reservations
 from pydantic import BaseModel
 
@@ -14,14 +12,13 @@ class CleanupStatsDTO(BaseModel):
 
 
 router = APIRouter(prefix="/admin/maintenance", tags=["admin-maintenance"])
-db_dependency = Annotated[AsyncSession, Depends(get_db)]
 
 
 @router.post(
     "/cleanup-expired",
     status_code=status.HTTP_200_OK,
     response_model=CleanupStatsDTO,
-    dependencies=[Depends(get_current_user_with_roles("ADMIN"))]
+    dependencies=[REQUIRE_ADMIN]
 )
 async def cleanup(db: db_dependency, limit: int = Query(500, ge=1, le=5000)):
     return await cleanup_expired_reservations(db, limit=limit)
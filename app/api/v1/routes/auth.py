@@ -1,8 +1,7 @@
 from fastapi import APIRouter, Depends, status, Response, Request
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.ext.asyncio import AsyncSession
-from app.core.database import get_db
-from app.core.dependencies.auth import get_current_user_with_roles
+from app.core.database import db_dependency
+from app.core.dependencies.auth import ANY_ROLE
 from app.core.ctx import get_client_ip
 from app.domain.users.schemas import UserCreateDTO, UserReadDTO
 from app.domain.auth.schemas import LoginResponse, RefreshRequest, LogoutRequest
@@ -12,17 +11,16 @@ from typing import Annotated
 
 
 router = APIRouter(prefix='/auth', tags=['auth'])
-db_dependency = Annotated[AsyncSession, Depends(get_db)]
+_ME_LOCATION = (b"location", b"/users/me")
 
 @router.post(
     '/register',
     status_code=status.HTTP_201_CREATED,
-    response_model=UserReadDTO,
-    response_model_exclude_none=True
+    response_model=UserReadDTO
 )
 async def register(db: db_dependency, model: UserCreateDTO, response: Response):
     user = await create_user(model, db)
-    response.headers['Location'] = f"/users/me"
+    response.raw_headers.append(_ME_LOCATION)
     return UserReadDTO.model_validate(user)
 
 
@@ -46,6 +44,6 @@ async def logout(schema: LogoutRequest, db: db_dependency):
 @router.post("/logout-all", status_code=status.HTTP_204_NO_CONTENT)
 async def logout_all_sessions(
     db: db_dependency,
-    user: Annotated[User, Depends(get_current_user_with_roles("CUSTOMER", "ORGANIZER", "ADMIN"))]
+    user: Annotated[User, ANY_ROLE]
 ):
     await logout_all(db, user)
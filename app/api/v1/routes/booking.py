@@ -1,28 +1,26 @@
-from fastapi import APIRouter, Depends, Response, status, Request
+from fastapi import APIRouter, Response, status, Request
 from typing import Annotated
-from sqlalchemy.ext.asyncio import AsyncSession
-from app.core.database import get_db
-from app.core.dependencies.auth import get_current_user_with_roles
+from app.core.database import db_dependency
+from app.core.dependencies.auth import CUSTOMER_OR_ADMIN
 from app.domain.users.models import User
 from app.services import booking_service
 from app.domain.booking.schemas import ReserveTicketRequestDTO, ReserveTicketReadDTO
 
 
 router = APIRouter(prefix="/events/{event_id}/reservations", tags=["booking"])
-db_dependency = Annotated[AsyncSession, Depends(get_db)]
+_ORDER_LOC_PREFIX_B = b"/users/me/orders/"
 
 
 @router.post(
     "",
     status_code=status.HTTP_201_CREATED,
     response_model=ReserveTicketReadDTO,
-    response_model_exclude_none=True,
 )
 async def reserve_ticket(
         event_id: int,
         schema: ReserveTicketRequestDTO,
         db: db_dependency,
-        user: Annotated[User, Depends(get_current_user_with_roles("CUSTOMER", "ADMIN"))],
+        user: Annotated[User, CUSTOMER_OR_ADMIN],
         response: Response
 ):
     order, ticket_instance = await booking_service.reserve_ticket(
@@ -33,7 +31,7 @@ async def reserve_ticket(
         seat_id=schema.seat_id
     )
 
-    response.headers["Location"] = f"/users/me/orders/{order.id}"
+    response.raw_headers.append((b"location", _ORDER_LOC_PREFIX_B + str(order.id).encode()))
 
     return ReserveTicketReadDTO(
         order_id=order.id,
@@ -1,8 +1,10 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, status
 from typing import Annotated
-from sqlalchemy.ext.asyncio import AsyncSession
-from app.core.database import get_db
-from app.core.dependencies.auth import get_current_user_with_roles
+from pydantic import TypeAdapter
+from app.api.responses import dto_response, cached_dto_response
+from app.core.cache import ACTIVE_PAYMENT_METHODS_CACHE
+from app.core.database import db_dependency
+from app.core.dependencies.auth import CUSTOMER_ONLY
 from app.domain.payments.schemas import PaymentMethodReadDTO
 from app.domain.users.models import User
 from app.services import booking_service, payment_service
@@ -11,19 +13,18 @@ from app.domain.booking.schemas import OrderDetailsDTO, TicketHolderReadDTO, Tic
 
 
 router = APIRouter(prefix="/users/me/cart", tags=["cart"])
-db_dependency = Annotated[AsyncSession, Depends(get_db)]
-user_dependency = Annotated[User, Depends(get_current_user_with_roles("CUSTOMER"))]
+user_dependency = Annotated[User, CUSTOMER_ONLY]
+_PAYMENT_METHODS_ADAPTER = TypeAdapter(list[PaymentMethodReadDTO])
 
 
 @router.get(
     "",
     status_code=status.HTTP_200_OK,
-    response_model=OrderDetailsDTO,
-    response_model_exclude_none=True
+    response_model=OrderDetailsDTO
 )
 async def get_cart(db: db_dependency, user: user_dependency):
     order = await booking_service.get_user_pending_order(db, user)
-    return order
+    return dto_response(OrderDetailsDTO.model_validate(order))
 
 
 @router.delete(
@@ -37,8 +38,7 @@ async def remove_item(ticket_instance_id: int, db: db_dependency, user: user_dep
 @router.put(
     "/items/{ticket_instance_id}/holder",
     status_code=status.HTTP_200_OK,
-    response_model=TicketHolderReadDTO,
-    response_model_exclude_none=True
+    response_model=TicketHolderReadDTO
 )
 async def upsert_ticket_holder(
         ticket_instance_id: int,
@@ -61,8 +61,7 @@ async def set_invoice_requested(schema: InvoiceRequestDTO, db: db_dependency, us
 @router.put(
     "/invoice",
     status_code=status.HTTP_200_OK,
-    response_model=InvoiceReadDTO,
-    response_model_exclude_none=True
+    response_model=InvoiceReadDTO
 )
 async def upsert_invoice(schema: InvoiceUpsertDTO, db: db_dependency, user: user_dependency):
     invoice = await booking_service.upsert_invoice(db, schema, user)
@@ -72,8 +71,7 @@ async def upsert_invoice(schema: InvoiceUpsertDTO, db: db_dependency, user: user
 @router.post(
     "/checkout",
     status_code=status.HTTP_200_OK,
-    response_model=OrderDetailsDTO,
-    response_model_exclude_none=True
+    response_model=OrderDetailsDTO
 )
 async def checkout(db: db_dependency, user: user_dependency):
     order = await booking_service.checkout(db, user)
@@ -83,8 +81,7 @@ async def checkout(db: db_dependency, user: user_dependency):
 @router.post(
     "/reopen",
     status_code=status.HTTP_200_OK,
-    response_model=OrderDetailsDTO,
-    response_model_exclude_none=True
+    response_model=OrderDetailsDTO
 )
 async def reopen_cart(db: db_dependency, user: user_dependency):
     order = await booking_service.reopen_cart(db, user)
@@ -97,4 +94,9 @@ async def reopen_cart(db: db_dependency, user: user_dependency):
     response_model=list[PaymentMethodReadDTO]
 )
 async def list_active_payment_methods(db: db_dependency, user: user_dependency):
-    return await payment_service.list_active_payment_methods(db)
+    return await cached_dto_response(
+        ACTIVE_PAYMENT_METHODS_CACHE,
+        None,
+        lambda: payment_service.list_active_payment_methods(db),
+        adapter=_PAYMENT_METHODS_ADAPTER
+    )
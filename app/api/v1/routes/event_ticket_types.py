@@ -1,23 +1,20 @@
 from fastapi import APIRouter, status, Depends, Request
 from typing import Annotated
-from sqlalchemy.ext.asyncio import AsyncSession
-from app.core.database import get_db
-from app.core.dependencies.auth import get_current_user_with_roles
+from app.core.database import db_dependency
+from app.core.dependencies.auth import REQUIRE_ANY_ROLE
 from app.core.dependencies.events import require_event_ticket_type_access, EventTicketTypeActor
 from app.domain.pricing.schemas import EventTicketTypeReadDTO, EventTicketTypeUpdateDTO
 from app.services import event_ticket_type_service
 
 
 router = APIRouter(prefix="/event-ticket-types", tags=["event-ticket-types"])
-db_dependency = Annotated[AsyncSession, Depends(get_db)]
 
 
 @router.get(
     "/{event_ticket_type_id}",
     status_code=status.HTTP_200_OK,
     response_model=EventTicketTypeReadDTO,
-    response_model_exclude_none=True,
-    dependencies=[Depends(get_current_user_with_roles("ADMIN", "ORGANIZER", "CUSTOMER"))]
+    dependencies=[REQUIRE_ANY_ROLE]
 )
 async def get_event_ticket_type(event_ticket_type_id: int, db: db_dependency):
     return await event_ticket_type_service.get_event_ticket_type(db, event_ticket_type_id)
@@ -27,7 +24,6 @@ async def get_event_ticket_type(event_ticket_type_id: int, db: db_dependency):
     "/{event_ticket_type_id}",
     status_code=status.HTTP_200_OK,
     response_model=EventTicketTypeReadDTO,
-    response_model_exclude_none=True,
 )
 async def update_event_ticket_type(
         event_ticket_type_actor: Annotated[EventTicketTypeActor, Depends(require_event_ticket_type_access)],
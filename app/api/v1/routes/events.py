@@ -1,9 +1,11 @@
-from fastapi import APIRouter, status, Depends, Response
+from fastapi import APIRouter, status, Depends, Request, Response, Query
 from typing import Annotated
-from sqlalchemy.ext.asyncio import AsyncSession
-from app.core.database import get_db
-from app.core.dependencies.events import require_event_actor, EventActor, require_organizer_member
-from app.core.dependencies.auth import get_current_user_with_roles
+from app.api.responses import dto_response, cached_dto_response, etag_dto_response
+from app.core.cache import PUBLIC_EVENTS_CACHE
+from app.core.database import db_dependency
+from app.core.dependencies.events import require_event_actor, EventActor, require_organizer_member, \
+    authorize_event_owner
+from app.core.dependencies.auth import ANY_ROLE, ADMIN_ONLY, ORGANIZER_ONLY, REQUIRE_ANY_ROLE, REQUIRE_ADMIN
 from app.core.pagination import PageDTO
 from app.domain.events.schemas import EventCreateDTO, EventReadDTO, EventUpdateDTO, EventStatusDTO, AdminEventsQueryDTO, \
     PublicEventsQueryDTO, OrganizerEventsQueryDTO
@@ -14,17 +16,18 @@ from app.services import event_service, event_sectors_service, event_ticket_type
 
 
 router = APIRouter(tags=["events"])
-db_dependency = Annotated[AsyncSession, Depends(get_db)]
+_EVENT_LOC_PREFIX_B = b"/events/"
+_EVENT_TICKET_TYPE_LOC_PREFIX_B = b"/event-ticket-types/"
 
 
 @router.get(
     "/events",
     status_code=status.HTTP_200_OK,
     response_model=PageDTO[EventReadDTO],
-    dependencies=[Depends(get_current_user_with_roles("ADMIN", "ORGANIZER", "CUSTOMER"))]
+    dependencies=[REQUIRE_ANY_ROLE]
 )
-async def list_events(db: db_dependency, query: Annotated[PublicEventsQueryDTO, Depends()]):
-    return await event_service.list_public_events(db, query)
+async def list_events(db: db_dependency, query: Annotated[PublicEventsQueryDTO, Query()]):
+    return await cached_dto_response(PUBLIC_EVENTS_CACHE, query, lambda: event_service.list_public_events(db, query))
 
 
 @router.get(
@@ -35,9 +38,10 @@ async def list_events(db: db_dependency, query: Annotated[PublicEventsQueryDTO,
 async def get_event(
         event_id: int,
         db: db_dependency,
-        user: Annotated[User, Depends(get_current_user_with_roles("ADMIN", "ORGANIZER", "CUSTOMER"))]
+        user: Annotated[User, ANY_ROLE],
+        request: Request
 ):
-    return await event_service.get_event(db, event_id, user)
+    return etag_dto_response(request, await event_service.get_event_read(db, event_id, user))
 
 
 @router.get(
@@ -47,10 +51,10 @@ async def get_event(
 )
 async def list_organizer_events(
         db: db_dependency,
-        user: Annotated[User, Depends(get_current_user_with_roles("ORGANIZER"))],
-        query: Annotated[OrganizerEventsQueryDTO, Depends()]
+        user: Annotated[User, ORGANIZER_ONLY],
+        query: Annotated[OrganizerEventsQueryDTO, Query()]
 ):
-    return await event_service.list_events_for_organizer(db, user, query)
+    return dto_response(await event_service.list_events_for_organizer(db, user, query))
 
 
 @router.post(
@@ -66,7 +70,7 @@ async def create_event(
         response: Response
 ):
     event = await event_service.create_event(db, organizer_id, schema)
-    response.headers["Location"] = f"/events/{event.id}"
+    response.raw_headers.append((b"location", _EVENT_LOC_PREFIX_B + str(event.id).encode()))
     return event
 
 
@@ -77,10 +81,10 @@ async def create_event(
 )
 async def list_admin_events(
         db: db_dependency,
-        user: Annotated[User, Depends(get_current_user_with_roles("ADMIN"))],
-        query: Annotated[AdminEventsQueryDTO, Depends()]
+        user: Annotated[User, ADMIN_ONLY],
+        query: Annotated[AdminEventsQueryDTO, Query()]
 ):
-    return await event_service.list_events_for_admin(db, query)
+    return dto_response(await event_service.list_events_for_admin(db, query))
 
 
 @router.patch(
@@ -103,7 +107,7 @@ async def patch_event(
     status_code=status.HTTP_200_OK,
     response_model=EventReadDTO,
     response_model_exclude_none=True,
-    dependencies=[Depends(get_current_user_with_roles("ADMIN"))]
+    dependencies=[REQUIRE_ADMIN]
 )
 async def patch_event_status(
         event_id: int,
@@ -118,10 +122,11 @@ async def patch_event_status(
     status_code=status.HTTP_200_OK,
     response_model=EventSectorReadDTO,
     response_model_exclude_none=True,
-    dependencies=[Depends(get_current_user_with_roles("ADMIN", "ORGANIZER", "CUSTOMER"))]
+    dependencies=[REQUIRE_ANY_ROLE]
 )
-async def get_event_sector(event_id: int, sector_id: int, db: db_dependency):
-    return await event_sectors_service.get_event_sector(db, event_id, sector_id)
+async def get_event_sector(event_id: int, sector_id: int, db: db_dependency, request: Request):
+    event_sector = await event_sectors_service.get_event_sector(db, event_id, sector_id)
+    return etag_dto_response(request, EventSectorReadDTO.model_validate(event_sector), exclude_none=True)
 
 
 @router.get(
@@ -129,7 +134,7 @@ async def get_event_sector(event_id: int, sector_id: int, db: db_dependency):
     status_code=status.HTTP_200_OK,
     response_model=list[EventSectorReadDTO],
     response_model_exclude_none=True,
-    dependencies=[Depends(get_current_user_with_roles("ADMIN", "ORGANIZER", "CUSTOMER"))]
+    dependencies=[REQUIRE_ANY_ROLE]
 )
 async def get_all_event_sectors_by_event(event_id: int, db: db_dependency):
     return await event_sectors_service.list_event_sectors(db, event_id)
@@ -149,7 +154,7 @@ async def create_event_sector_for_event(
 ):
     event = event_actor.event
     event_sector = await event_sectors_service.create_event_sector(db, schema, event)
-    response.headers["Location"] = f"/events/{event.id}/sectors/{event_sector.sector_id}"
+    response.raw_headers.append((b"location", b"/events/%d/sectors/%d" % (event.id, event_sector.sector_id)))
     return event_sector
 
 
@@ -171,23 +176,21 @@ async def bulk_add_event_sectors_for_event(
     status_code=status.HTTP_204_NO_CONTENT
 )
 async def delete_event_sector_for_event(
-        event_actor: Annotated[EventActor, Depends(require_event_actor)],
+        event_id: Annotated[int, Depends(authorize_event_owner)],
         sector_id: int,
         db: db_dependency,
 ):
-    event = event_actor.event
-    await event_sectors_service.delete_event_sector(db, event.id, sector_id)
+    await event_sectors_service.delete_event_sector(db, event_id, sector_id)
 
 
 @router.get(
     "/events/{event_id}/sectors/{sector_id}/ticket-types",
     response_model=list[EventTicketTypeReadDTO],
     status_code=status.HTTP_200_OK,
-    dependencies=[Depends(get_current_user_with_roles("ADMIN", "ORGANIZER", "CUSTOMER"))]
+    dependencies=[REQUIRE_ANY_ROLE]
 )
 async def list_ticket_types_for_event_sector(event_id: int, sector_id: int, db: db_dependency):
-    event_sector = await event_sectors_service.get_event_sector(db, event_id, sector_id)
-    return await event_ticket_type_service.list_event_sector_ticket_types(db, event_sector.id)
+    return await event_ticket_type_service.list_ticket_types_by_event_sector_keys(db, event_id, sector_id)
 
 
 @router.post(
@@ -197,15 +200,15 @@ async def list_ticket_types_for_event_sector(event_id: int, sector_id: int, db:
     response_model_exclude_none=True
 )
 async def create_event_ticket_type_for_event_sector(
-        event_actor: Annotated[EventActor, Depends(require_event_actor)],
+        event_id: Annotated[int, Depends(authorize_event_owner)],
         sector_id: int,
         schema: EventTicketTypeCreateDTO,
         db: db_dependency,
         response: Response
 ):
-    event_sector = await event_sectors_service.get_event_sector(db, event_actor.event.id, sector_id)
+    event_sector = await event_sectors_service.get_event_sector(db, event_id, sector_id)
     event_ticket_type = await event_ticket_type_service.create_event_ticket_type(db, schema, event_sector)
-    response.headers["Location"] = f"/event-ticket-types/{event_ticket_type.id}"
+    response.raw_headers.append((b"location", _EVENT_TICKET_TYPE_LOC_PREFIX_B + str(event_ticket_type.id).encode()))
     return event_ticket_type
 
 
@@ -214,10 +217,10 @@ async def create_event_ticket_type_for_event_sector(
     status_code=status.HTTP_204_NO_CONTENT
 )
 async def bulk_add_event_ticket_types_for_event_sector(
-    event_actor: Annotated[EventActor, Depends(require_event_actor)],
+    event_id: Annotated[int, Depends(authorize_event_owner)],
     sector_id: int,
     schema: EventTicketTypeBulkCreateDTO,
     db: db_dependency
 ):
-    event_sector = await event_sectors_service.get_event_sector(db, event_actor.event.id, sector_id)
+    event_sector = await event_sectors_service.get_event_sector(db, event_id, sector_id)
     await event_ticket_type_service.bulk_create_event_ticket_types(db, schema, event_sector)
@@ -1,64 +1,69 @@
 from typing import Annotated
-from fastapi import APIRouter, Depends, status
-from sqlalchemy.ext.asyncio import AsyncSession
-from app.core.database import get_db
+from fastapi import APIRouter, status, Query
+from app.api.responses import dto_response, streaming_array_response
+from app.core.database import db_dependency
 from app.domain.users.models import User
 from app.domain.booking.schemas import UserOrdersQueryDTO, OrderListItemDTO, OrderDetailsDTO, \
-    AdminOrdersQueryDTO, AdminOrderListItemDTO, AdminOrderDetailsDTO
+    AdminOrdersQueryDTO, AdminOrderListItemDTO, AdminOrderDetailsDTO, AdminOrdersExportQueryDTO
 from app.core.pagination import PageDTO
-from app.core.dependencies.auth import get_current_user_with_roles
+from app.core.dependencies.auth import CUSTOMER_ONLY, REQUIRE_ADMIN
 from app.services import orders_service
 
 
 router = APIRouter(tags=["orders"])
-db_dependency = Annotated[AsyncSession, Depends(get_db)]
 
 
 @router.get(
     "/users/me/orders",
     response_model=PageDTO[OrderListItemDTO],
-    response_model_exclude_none=True,
     status_code=status.HTTP_200_OK
 )
 async def list_user_orders(
         db: db_dependency,
-        user: Annotated[User, Depends(get_current_user_with_roles("CUSTOMER"))],
-        query: Annotated[UserOrdersQueryDTO, Depends()]
+        user: Annotated[User, CUSTOMER_ONLY],
+        query: Annotated[UserOrdersQueryDTO, Query()]
 ):
-    return await orders_service.list_user_orders(db, user, query)
+    return dto_response(await orders_service.list_user_orders(db, user, query))
 
 
 @router.get(
     "/users/me/orders/{order_id}",
     response_model=OrderDetailsDTO,
-    response_model_exclude_none=True,
     status_code=status.HTTP_200_OK
 )
 async def get_user_order(
         order_id: int,
         db: db_dependency,
-        user: Annotated[User, Depends(get_current_user_with_roles("CUSTOMER"))]
+        user: Annotated[User, CUSTOMER_ONLY]
 ):
-    return await orders_service.get_user_order(db, user, order_id)
+    return dto_response(await orders_service.get_user_order(db, user, order_id))
 
 
 @router.get(
     "/admin/orders",
     response_model=PageDTO[AdminOrderListItemDTO],
-    response_model_exclude_none=True,
     status_code=status.HTTP_200_OK,
-    dependencies=[Depends(get_current_user_with_roles("ADMIN"))]
+    dependencies=[REQUIRE_ADMIN]
 )
-async def list_orders_admin(db: db_dependency, query: Annotated[AdminOrdersQueryDTO, Depends()]):
-    return await orders_service.list_orders_admin(db, query)
+async def list_orders_admin(db: db_dependency, query: Annotated[AdminOrdersQueryDTO, Query()]):
+    return dto_response(await orders_service.list_orders_admin(db, query))
+
+
+@router.get(
+    "/admin/orders/export",
+    response_model=list[AdminOrderListItemDTO],
+    status_code=status.HTTP_200_OK,
+    dependencies=[REQUIRE_ADMIN]
+)
+async def export_orders_admin(db: db_dependency, query: Annotated[AdminOrdersExportQueryDTO, Query()]):
+    return streaming_array_response(orders_service.stream_orders_admin(db, query))
 
 
 @router.get(
     "/admin/orders/{order_id}",
     response_model=AdminOrderDetailsDTO,
-    response_model_exclude_none=True,
     status_code=status.HTTP_200_OK,
-    dependencies=[Depends(get_current_user_with_roles("ADMIN"))]
+    dependencies=[REQUIRE_ADMIN]
 )
 async def get_order_admin(order_id: int, db: db_dependency):
-    return await orders_service.get_order_admin(db, order_id)
+    return dto_response(await orders_service.get_order_admin(db, order_id))
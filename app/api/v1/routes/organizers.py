@@ -1,24 +1,24 @@
-from fastapi import APIRouter, status, Depends, Response
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, status, Depends, Request, Response, Query
+from app.api.responses import cached_dto_response, etag_dto_response
+from app.core.cache import ORGANIZERS_CACHE
 from app.domain.organizers.schemas import OrganizerCreateDTO, OrganizerReadDTO, OrganizerPutDTO, OrganizersQueryDTO
-from app.core.dependencies.auth import get_current_user_with_roles
+from app.core.dependencies.auth import REQUIRE_ANY_ROLE, REQUIRE_ADMIN
 from app.core.dependencies.events import require_organizer_member
-from app.core.database import get_db
+from app.core.database import db_dependency
 from app.core.pagination import PageDTO
 from app.services import organizer_service
 from typing import Annotated
 
 
 router = APIRouter(prefix="/organizers", tags=["organizers"])
-db_dependency = Annotated[AsyncSession, Depends(get_db)]
+_LOC_PREFIX_B = (router.prefix + "/").encode()
 
 
 @router.post(
     "",
     status_code=status.HTTP_201_CREATED,
     response_model=OrganizerReadDTO,
-    response_model_exclude_none=True,
-    dependencies=[Depends(get_current_user_with_roles("ADMIN"))]
+    dependencies=[REQUIRE_ADMIN]
 )
 async def create_organizer(
         schema: OrganizerCreateDTO,
@@ -26,7 +26,7 @@ async def create_organizer(
         response: Response
 ):
     organizer = await organizer_service.create_organizer(db, schema)
-    response.headers["Location"] = f"{router.prefix}/{organizer.id}"
+    response.raw_headers.append((b"location", _LOC_PREFIX_B + str(organizer.id).encode()))
     return organizer
 
 
@@ -34,31 +34,28 @@ async def create_organizer(
     "",
     status_code=status.HTTP_200_OK,
     response_model=PageDTO[OrganizerReadDTO],
-    response_model_exclude_none=True,
-    dependencies=[Depends(get_current_user_with_roles("ADMIN", "ORGANIZER", "CUSTOMER"))]
+    dependencies=[REQUIRE_ANY_ROLE]
 )
-async def list_organizers(db: db_dependency, query: Annotated[OrganizersQueryDTO, Depends()]):
-    organizers = await organizer_service.list_organizers(db, query)
-    return organizers
+async def list_organizers(db: db_dependency, query: Annotated[OrganizersQueryDTO, Query()]):
+    return await cached_dto_response(
+        ORGANIZERS_CACHE, query, lambda: organizer_service.list_organizers(db, query)
+    )
 
 
 @router.get(
     "/{organizer_id}",
     status_code=status.HTTP_200_OK,
     response_model=OrganizerReadDTO,
-    response_model_exclude_none=True,
-    dependencies=[Depends(get_current_user_with_roles("ADMIN", "ORGANIZER", "CUSTOMER"))]
+    dependencies=[REQUIRE_ANY_ROLE]
 )
-async def get_organizer(organizer_id: int, db: db_dependency):
-    organizer = await organizer_service.get_organizer(db, organizer_id)
-    return organizer
+async def get_organizer(organizer_id: int, db: db_dependency, request: Request):
+    return etag_dto_response(request, await organizer_service.get_organizer_read(db, organizer_id))
 
 
 @router.put(
     "/{organizer_id}",
     status_code=status.HTTP_200_OK,
-    response_model=OrganizerReadDTO,
-    response_model_exclude_none=True
+    response_model=OrganizerReadDTO
 )
 async def update_organizer(
         organizer_id: Annotated[int, Depends(require_organizer_member)],
@@ -73,7 +70,7 @@ async def update_organizer(
 @router.delete(
     "/{organizer_id}",
     status_code=status.HTTP_204_NO_CONTENT,
-    dependencies=[Depends(get_current_user_with_roles("ADMIN"))]
+    dependencies=[REQUIRE_ADMIN]
 )
 async def delete_organizer(
         organizer_id: int,
@@ -1,36 +1,42 @@
-from fastapi import APIRouter, Depends, status, Response, Request
+from fastapi import APIRouter, status, Response, Request, Query
 from typing import Annotated
-from sqlalchemy.ext.asyncio import AsyncSession
-from app.core.database import get_db
-from app.core.dependencies.auth import get_current_user_with_roles
+from app.api.responses import etag_dto_response
+from app.core.pagination import PageDTO
+from app.core.database import db_dependency
+from app.core.dependencies.auth import ADMIN_ONLY, REQUIRE_ADMIN
 from app.domain.users.models import User
-from app.domain.payments.schemas import PaymentMethodReadDTO, PaymentMethodCreateDTO, PaymentMethodUpdateDTO
+from app.domain.payments.schemas import PaymentMethodReadDTO, PaymentMethodCreateDTO, PaymentMethodUpdateDTO, \
+    PaymentMethodsQueryDTO
 from app.services import payment_service
 
 
 router = APIRouter(prefix="/payment-methods", tags=["payment-methods"])
-db_dependency = Annotated[AsyncSession, Depends(get_db)]
-admin_dependency = Depends(get_current_user_with_roles("ADMIN"))
+_LOC_PREFIX_B = (router.prefix + "/").encode()
 
 
 @router.get(
     "/{payment_method_id}",
     status_code=status.HTTP_200_OK,
     response_model=PaymentMethodReadDTO,
-    dependencies=[admin_dependency]
+    dependencies=[REQUIRE_ADMIN]
 )
-async def get_payment_method(payment_method_id: int, db: db_dependency):
-    return await payment_service.get_payment_method(db, payment_method_id)
+async def get_payment_method(payment_method_id: int, db: db_dependency, request: Request):
+    payment_method = await payment_service.get_payment_method(db, payment_method_id)
+    return etag_dto_response(request, PaymentMethodReadDTO.model_validate(payment_method))
 
 
 @router.get(
     "",
     status_code=status.HTTP_200_OK,
-    response_model=list[PaymentMethodReadDTO],
-    dependencies=[admin_dependency],
+    response_model=PageDTO[PaymentMethodReadDTO],
+    dependencies=[REQUIRE_ADMIN],
 )
-async def list_payment_methods(db: db_dependency):
-    return await payment_service.list_all_payment_methods(db)
+async def list_payment_methods(
+        db: db_dependency,
+        query: Annotated[PaymentMethodsQueryDTO, Query()],
+        request: Request
+):
+    return etag_dto_response(request, await payment_service.list_all_payment_methods(db, query))
 
 
 @router.post(
@@ -41,11 +47,11 @@ async def list_payment_methods(db: db_dependency):
 async def create_payment_method(
         schema: PaymentMethodCreateDTO,
         db: db_dependency,
-        user: Annotated[User, admin_dependency],
+        user: Annotated[User, ADMIN_ONLY],
         response: Response
 ):
     payment_method = await payment_service.create_payment_method(db, schema)
-    response.headers["Location"] = f"/payment-methods/{payment_method.id}"
+    response.raw_headers.append((b"location", _LOC_PREFIX_B + str(payment_method.id).encode()))
     return payment_method
 
 
@@ -58,6 +64,6 @@ async def update_payment_method(
         payment_method_id: int,
         schema: PaymentMethodUpdateDTO,
         db: db_dependency,
-        user: Annotated[User, admin_dependency]
+        user: Annotated[User, ADMIN_ONLY]
 ):
     return await payment_service.update_payment_method(db, payment_method_id, schema)
@@ -1,23 +1,21 @@
-from fastapi import APIRouter, Depends, status, Response, Header
+from fastapi import APIRouter, status, Response, Header
 from typing import Annotated
-from sqlalchemy.ext.asyncio import AsyncSession
-from app.core.database import get_db
-from app.core.dependencies.auth import get_current_user_with_roles
+from app.core.database import db_dependency
+from app.core.dependencies.auth import CUSTOMER_ONLY
 from app.domain.users.models import User
 from app.domain.payments.schemas import PaymentCreateDTO, PaymentReadDTO, PaymentFinalizeDTO
 from app.services import payment_service
 
 
 router = APIRouter(prefix="/users/me/cart/payments", tags=["payments"])
-db_dependency = Annotated[AsyncSession, Depends(get_db)]
-user_dependency = Annotated[User, Depends(get_current_user_with_roles("CUSTOMER"))]
+_LOC_PREFIX_B = (router.prefix + "/").encode()
+user_dependency = Annotated[User, CUSTOMER_ONLY]
 
 
 @router.post(
     "/start",
     status_code=status.HTTP_201_CREATED,
     response_model=PaymentReadDTO,
-    response_model_exclude_none=True,
 )
 async def start_payment(
         schema: PaymentCreateDTO,
@@ -27,7 +25,7 @@ async def start_payment(
         idempotency_key: Annotated[str, Header(alias="Idempotency-Key")]
 ):
     payment, redirect_url = await payment_service.start_payment(db, user, schema, idempotency_key)
-    response.headers["Location"] = f"{router.prefix}/{payment.id}"
+    response.raw_headers.append((b"location", _LOC_PREFIX_B + str(payment.id).encode()))
     return {
         "id": payment.id,
         "order_id": payment.order_id,
@@ -45,7 +43,6 @@ async def start_payment(
     "/{payment_id}/finalize",
     status_code=status.HTTP_200_OK,
     response_model=PaymentReadDTO,
-    response_model_exclude_none=True,
 )
 async def finalize_payment(
         payment_id: int,
@@ -61,7 +58,6 @@ async def finalize_payment(
     "/{payment_id}",
     status_code=status.HTTP_200_OK,
     response_model=PaymentReadDTO,
-    response_model_exclude_none=True,
 )
 async def get_payment(payment_id: int, db: db_dependency, user: user_dependency):
     return await payment_service.get_payment_for_user(db, payment_id, user)
@@ -1,31 +1,30 @@
 from app.services import venue_service
-from fastapi import APIRouter, status, Depends
-from sqlalchemy.ext.asyncio import AsyncSession
-from app.core.database import get_db
-from app.core.dependencies.auth import get_current_user_with_roles
+from fastapi import APIRouter, status, Request
+from app.api.responses import etag_dto_response
+from app.core.database import db_dependency
+from app.core.dependencies.auth import REQUIRE_ANY_ROLE, REQUIRE_ADMIN
 from app.domain.venues.schemas import SeatUpdateDTO, SeatReadDTO
-from typing import Annotated
 
 
 router = APIRouter(prefix='/seats', tags=['seats'])
-db_dependency = Annotated[AsyncSession, Depends(get_db)]
 
 
 @router.get(
     "/{seat_id}",
     status_code=status.HTTP_200_OK,
     response_model=SeatReadDTO,
-    dependencies=[Depends(get_current_user_with_roles("ADMIN", "ORGANIZER", "CUSTOMER"))]
+    dependencies=[REQUIRE_ANY_ROLE]
 )
-async def get_seat(seat_id: int, db: db_dependency):
-    return await venue_service.get_seat(db, seat_id)
+async def get_seat(seat_id: int, db: db_dependency, request: Request):
+    seat = await venue_service.get_seat(db, seat_id)
+    return etag_dto_response(request, SeatReadDTO.model_validate(seat))
 
 
 @router.patch(
     "/{seat_id}",
     status_code=status.HTTP_200_OK,
     response_model=SeatReadDTO,
-    dependencies=[Depends(get_current_user_with_roles("ADMIN"))]
+    dependencies=[REQUIRE_ADMIN]
 )
 async def update_seat(
         seat_id: int,
@@ -38,7 +37,7 @@ async def update_seat(
 @router.delete(
     "/{seat_id}",
     status_code=status.HTTP_204_NO_CONTENT,
-    dependencies=[Depends(get_current_user_with_roles("ADMIN"))]
+    dependencies=[REQUIRE_ADMIN]
 )
 async def delete_seat(
         seat_id: int,
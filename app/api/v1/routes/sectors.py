@@ -1,32 +1,34 @@
 from app.services import venue_service
-from fastapi import APIRouter, status, Depends, Response
-from sqlalchemy.ext.asyncio import AsyncSession
-from app.core.database import get_db
-from app.core.dependencies.auth import get_current_user_with_roles
-from app.domain.venues.schemas import SectorReadDTO, SectorUpdateDTO, SeatReadDTO, SeatCreateDTO, SeatBulkCreateDTO
 from typing import Annotated
+from fastapi import APIRouter, status, Request, Response, Query
+from app.api.responses import etag_dto_response
+from app.core.pagination import PageDTO
+from app.core.database import db_dependency
+from app.core.dependencies.auth import REQUIRE_ANY_ROLE, REQUIRE_ADMIN
+from app.domain.venues.schemas import SectorReadDTO, SectorUpdateDTO, SeatReadDTO, SeatCreateDTO, SeatBulkCreateDTO, \
+    SeatsQueryDTO
 
 
 router = APIRouter(prefix='/sectors', tags=['sectors'])
-db_dependency = Annotated[AsyncSession, Depends(get_db)]
+_SEAT_LOC_PREFIX_B = b"/seats/"
 
 
 @router.get(
     "/{sector_id}",
     status_code=status.HTTP_200_OK,
     response_model=SectorReadDTO,
-    dependencies=[Depends(get_current_user_with_roles('ADMIN', 'ORGANIZER', 'CUSTOMER'))]
+    dependencies=[REQUIRE_ANY_ROLE]
 )
-async def get_sector(sector_id: int, db: db_dependency):
+async def get_sector(sector_id: int, db: db_dependency, request: Request):
     sector = await venue_service.get_sector(db, sector_id)
-    return sector
+    return etag_dto_response(request, SectorReadDTO.model_validate(sector))
 
 
 @router.patch(
     "/{sector_id}",
     status_code=status.HTTP_200_OK,
     response_model=SectorReadDTO,
-    dependencies=[Depends(get_current_user_with_roles("ADMIN"))]
+    dependencies=[REQUIRE_ADMIN]
 )
 async def rename_sector(
         sector_id: int,
@@ -40,7 +42,7 @@ async def rename_sector(
     "/{sector_id}/seats",
     status_code=status.HTTP_201_CREATED,
     response_model=SeatReadDTO,
-    dependencies=[Depends(get_current_user_with_roles("ADMIN"))]
+    dependencies=[REQUIRE_ADMIN]
 )
 async def create_seat_for_sector(
         sector_id: int,
@@ -49,28 +51,35 @@ async def create_seat_for_sector(
         response: Response
 ):
     seat = await venue_service.create_seat(db, schema, sector_id)
-    response.headers["Location"] = f"/seats/{seat.id}"
+    response.raw_headers.append((b"location", _SEAT_LOC_PREFIX_B + str(seat.id).encode()))
     return seat
 
 
 @router.post(
     "/{sector_id}/seats/bulk",
     status_code=status.HTTP_204_NO_CONTENT,
-    dependencies=[Depends(get_current_user_with_roles("ADMIN"))]
+    response_class=Response,
+    dependencies=[REQUIRE_ADMIN]
 )
 async def bulk_add_seats_for_sector(
         sector_id: int,
         schema: SeatBulkCreateDTO,
         db: db_dependency
-):
-    return await venue_service.bulk_create_seats(db, schema, sector_id)
+) -> Response:
+    await venue_service.bulk_create_seats(db, schema, sector_id)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
 @router.get(
     "/{sector_id}/seats",
     status_code=status.HTTP_200_OK,
-    response_model=list[SeatReadDTO],
-    dependencies=[Depends(get_current_user_with_roles("ADMIN", "ORGANIZER", "CUSTOMER"))]
+    response_model=PageDTO[SeatReadDTO],
+    dependencies=[REQUIRE_ANY_ROLE]
 )
-async def get_all_seats_by_sector(sector_id: int, db: db_dependency):
-    return await venue_service.list_seats_by_sector(db, sector_id)
+async def get_all_seats_by_sector(
+        sector_id: int,
+        db: db_dependency,
+        query: Annotated[SeatsQueryDTO, Query()],
+        request: Request
+):
+    return etag_dto_response(request, await venue_service.list_seats_by_sector(db, sector_id, query))
@@ -1,42 +1,43 @@
-from fastapi import APIRouter, Depends, status, Response
-from sqlalchemy.ext.asyncio import AsyncSession
-from app.core.database import get_db
 from typing import Annotated
-from app.domain.pricing.schemas import TicketTypeReadDTO, TicketTypeCreateDTO
-from app.core.dependencies.auth import get_current_user_with_roles
+from fastapi import APIRouter, status, Request, Response, Query
+from app.api.responses import etag_dto_response
+from app.core.pagination import PageDTO
+from app.core.database import db_dependency
+from app.domain.pricing.schemas import TicketTypeReadDTO, TicketTypeCreateDTO, TicketTypesQueryDTO
+from app.core.dependencies.auth import REQUIRE_ANY_ROLE, REQUIRE_ADMIN
 from app.services import ticket_type_service
 
 
 router = APIRouter(prefix="/ticket-types", tags=["ticket-types"])
-db_dependency = Annotated[AsyncSession, Depends(get_db)]
+_LOC_PREFIX_B = (router.prefix + "/").encode()
 
 
 @router.get(
     "/{ticket_type_id}",
     status_code=status.HTTP_200_OK,
     response_model=TicketTypeReadDTO,
-    dependencies=[Depends(get_current_user_with_roles("ADMIN", "ORGANIZER", "CUSTOMER"))]
+    dependencies=[REQUIRE_ANY_ROLE]
 )
-async def get_ticket_type(ticket_type_id: int, db: db_dependency):
+async def get_ticket_type(ticket_type_id: int, db: db_dependency, request: Request):
     ticket_type = await ticket_type_service.get_ticket_type(db, ticket_type_id)
-    return ticket_type
+    return etag_dto_response(request, TicketTypeReadDTO.model_validate(ticket_type))
 
 
 @router.get(
     "",
     status_code=status.HTTP_200_OK,
-    response_model=list[TicketTypeReadDTO],
-    dependencies=[Depends(get_current_user_with_roles("ADMIN", "ORGANIZER", "CUSTOMER"))]
+    response_model=PageDTO[TicketTypeReadDTO],
+    dependencies=[REQUIRE_ANY_ROLE]
 )
-async def list_ticket_types(db: db_dependency):
-    return await ticket_type_service.list_ticket_types(db)
+async def list_ticket_types(db: db_dependency, query: Annotated[TicketTypesQueryDTO, Query()], request: Request):
+    return etag_dto_response(request, await ticket_type_service.list_ticket_types(db, query))
 
 
 @router.post(
     "",
     status_code=status.HTTP_201_CREATED,
     response_model=TicketTypeReadDTO,
-    dependencies=[Depends(get_current_user_with_roles("ADMIN"))]
+    dependencies=[REQUIRE_ADMIN]
 )
 async def create_ticket_type(
         db: db_dependency,
@@ -44,14 +45,14 @@ async def create_ticket_type(
         response: Response
 ):
     ticket_type = await ticket_type_service.create_ticket_type(db, schema)
-    response.headers["Location"] = f"{router.prefix}/{ticket_type.id}"
+    response.raw_headers.append((b"location", _LOC_PREFIX_B + str(ticket_type.id).encode()))
     return ticket_type
 
 
 @router.delete(
     "/{ticket_type_id}",
     status_code=status.HTTP_204_NO_CONTENT,
-    dependencies=[Depends(get_current_user_with_roles("ADMIN"))]
+    dependencies=[REQUIRE_ADMIN]
 )
 async def delete_ticket_type(
         ticket_type_id: int,
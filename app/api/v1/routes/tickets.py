@@ -1,8 +1,7 @@
 from typing import Annotated
-from fastapi import APIRouter, Depends, status
-from sqlalchemy.ext.asyncio import AsyncSession
-from app.core.database import get_db
-from app.core.dependencies.auth import get_current_user_with_roles
+from fastapi import APIRouter, Depends, status, Query
+from app.core.database import db_dependency
+from app.core.dependencies.auth import CUSTOMER_ONLY, REQUIRE_ADMIN
 from app.core.dependencies.events import require_organizer_member
 from app.core.pagination import PageDTO
 from app.domain.users.models import User
@@ -12,19 +11,17 @@ from app.services import tickets_service
 
 
 router = APIRouter(tags=["tickets"])
-db_dependency = Annotated[AsyncSession, Depends(get_db)]
 
 
 @router.get(
     "/users/me/tickets",
     status_code=status.HTTP_200_OK,
-    response_model=PageDTO[TicketReadItemDTO],
-    response_model_exclude_none=True
+    response_model=PageDTO[TicketReadItemDTO]
 )
 async def list_user_tickets(
         db: db_dependency,
-        user: Annotated[User, Depends(get_current_user_with_roles("CUSTOMER"))],
-        query: Annotated[UserTicketsQueryDTO, Depends()]
+        user: Annotated[User, CUSTOMER_ONLY],
+        query: Annotated[UserTicketsQueryDTO, Query()]
 ):
     return await tickets_service.list_user_tickets(db, user, query)
 
@@ -32,13 +29,12 @@ async def list_user_tickets(
 @router.get(
     "/organizers/{organizer_id}/tickets",
     status_code=status.HTTP_200_OK,
-    response_model=PageDTO[TicketReadItemDTO],
-    response_model_exclude_none=True
+    response_model=PageDTO[TicketReadItemDTO]
 )
 async def list_tickets_organizer(
         organizer_id: Annotated[int, Depends(require_organizer_member)],
         db: db_dependency,
-        query: Annotated[OrganizerTicketsQueryDTO, Depends()]
+        query: Annotated[OrganizerTicketsQueryDTO, Query()]
 ):
     return await tickets_service.list_organizer_tickets(db, organizer_id, query)
 
@@ -47,11 +43,10 @@ async def list_tickets_organizer(
     "/admin/tickets",
     status_code=status.HTTP_200_OK,
     response_model=PageDTO[TicketReadItemDTO],
-    response_model_exclude_none=True,
-    dependencies=[Depends(get_current_user_with_roles("ADMIN"))]
+    dependencies=[REQUIRE_ADMIN]
 )
 async def list_tickets_admin(
         db: db_dependency,
-        query: Annotated[AdminTicketsQueryDTO, Depends()]
+        query: Annotated[AdminTicketsQueryDTO, Query()]
 ):
     return await tickets_service.list_admin_tickets(db, query)
@@ -1,8 +1,9 @@
+from functools import lru_cache
 from typing import Annotated
-from fastapi import APIRouter, Depends, status
-from sqlalchemy.ext.asyncio import AsyncSession
-from app.core.database import get_db
-from app.core.dependencies.auth import get_current_user_with_roles
+from fastapi import APIRouter, status, Query, Request
+from app.api.responses import etag_dto_response, etag_json_response
+from app.core.database import db_dependency
+from app.core.dependencies.auth import ANY_ROLE, REQUIRE_ADMIN
 from app.core.pagination import PageDTO
 from app.domain.users.models import User
 from app.domain.users.schemas import UserReadDTO, AdminUsersQueryDTO, PasswordChangeDTO, AdminUserListItemDTO, \
@@ -10,18 +11,23 @@ from app.domain.users.schemas import UserReadDTO, AdminUsersQueryDTO, PasswordCh
 from app.services import users_service
 
 router = APIRouter(tags=["users"])
-db_dependency = Annotated[AsyncSession, Depends(get_db)]
-me_dependency = Annotated[User, Depends(get_current_user_with_roles("CUSTOMER", "ORGANIZER", "ADMIN"))]
+me_dependency = Annotated[User, ANY_ROLE]
+_ME_FIELDS = tuple(UserReadDTO.model_fields)
+
+
+# Keyed by every serialized field value, so any profile change is a new entry rather than a stale hit.
+@lru_cache(maxsize=4096)
+def _me_body(values: tuple) -> str:
+    return UserReadDTO(**dict(zip(_ME_FIELDS, values))).model_dump_json()
 
 
 @router.get(
     "/users/me",
     status_code=status.HTTP_200_OK,
-    response_model=UserReadDTO,
-    response_model_exclude_none=True
+    response_model=UserReadDTO
 )
-async def get_me(user: me_dependency):
-    return user
+async def get_me(user: me_dependency, request: Request):
+    return etag_json_response(request, _me_body(tuple(getattr(user, f) for f in _ME_FIELDS)))
 
 
 @router.post(
@@ -36,17 +42,17 @@ async def change_my_password(schema: PasswordChangeDTO, db: db_dependency, user:
     "/admin/users",
     status_code=status.HTTP_200_OK,
     response_model=PageDTO[AdminUserListItemDTO],
-    dependencies=[Depends(get_current_user_with_roles("ADMIN"))]
+    dependencies=[REQUIRE_ADMIN]
 )
-async def list_admin_users(db: db_dependency, query: Annotated[AdminUsersQueryDTO, Depends()]):
-    return await users_service.list_users_admin(db, query)
+async def list_admin_users(db: db_dependency, query: Annotated[AdminUsersQueryDTO, Query()], request: Request):
+    return etag_dto_response(request, await users_service.list_users_admin(db, query))
 
 
 @router.patch(
     "/admin/users/{user_id}/roles",
     status_code=status.HTTP_200_OK,
     response_model=AdminUserListItemDTO,
-    dependencies=[Depends(get_current_user_with_roles("ADMIN"))]
+    dependencies=[REQUIRE_ADMIN]
 )
 async def set_user_roles(user_id: int, schema: UserRolesUpdateDTO, db: db_dependency):
     return await users_service.update_user_roles(db, user_id, schema)
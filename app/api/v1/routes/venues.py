@@ -1,9 +1,10 @@
 from app.core.pagination import PageDTO
 from app.services import venue_service
-from fastapi import APIRouter, status, Depends, Response
-from sqlalchemy.ext.asyncio import AsyncSession
-from app.core.database import get_db
-from app.core.dependencies.auth import get_current_user_with_roles
+from fastapi import APIRouter, status, Request, Response, Query
+from pydantic import TypeAdapter
+from app.api.responses import etag_dto_response, etag_list_response
+from app.core.database import db_dependency
+from app.core.dependencies.auth import REQUIRE_ANY_ROLE, REQUIRE_ADMIN
 from app.domain.venues.schemas import (
     VenueCreateDTO,
     VenueUpdateDTO,
@@ -15,15 +16,16 @@ from typing import Annotated
 
 
 router = APIRouter(prefix='/venues', tags=['venues'])
-db_dependency = Annotated[AsyncSession, Depends(get_db)]
+_SECTORS_ADAPTER = TypeAdapter(list[SectorReadDTO])
+_LOC_PREFIX_B = (router.prefix + "/").encode()
+_SECTOR_LOC_PREFIX_B = b"/sectors/"
 
 
 @router.post(
     "",
     status_code=status.HTTP_201_CREATED,
     response_model=VenueReadDTO,
-    response_model_exclude_none=True,
-    dependencies=[Depends(get_current_user_with_roles("ADMIN"))]
+    dependencies=[REQUIRE_ADMIN]
 )
 async def create_venue(
         schema: VenueCreateDTO,
@@ -31,7 +33,7 @@ async def create_venue(
         response: Response
 ):
     venue = await venue_service.create_venue(db, schema)
-    response.headers["Location"] = f"{router.prefix}/{venue.id}"
+    response.raw_headers.append((b"location", _LOC_PREFIX_B + str(venue.id).encode()))
     return venue
 
 
@@ -39,29 +41,28 @@ async def create_venue(
     "",
     status_code=status.HTTP_200_OK,
     response_model=PageDTO[VenueReadDTO],
-    dependencies=[Depends(get_current_user_with_roles('ADMIN', 'ORGANIZER', 'CUSTOMER'))]
+    dependencies=[REQUIRE_ANY_ROLE]
 )
-async def get_all_venues(db: db_dependency, query: Annotated[VenuesQueryDTO, Depends()]):
-    venues = await venue_service.list_venues(db, query)
-    return venues
+async def get_all_venues(db: db_dependency, query: Annotated[VenuesQueryDTO, Query()], request: Request):
+    return etag_dto_response(request, await venue_service.list_venues(db, query))
 
 
 @router.get(
     "/{venue_id}",
     status_code=status.HTTP_200_OK,
     response_model=VenueReadDTO,
-    dependencies=[Depends(get_current_user_with_roles('ADMIN', 'ORGANIZER', 'CUSTOMER'))]
+    dependencies=[REQUIRE_ANY_ROLE]
 )
-async def get_venue(venue_id: int, db: db_dependency):
+async def get_venue(venue_id: int, db: db_dependency, request: Request):
     venue = await venue_service.get_venue(db, venue_id)
-    return venue
+    return etag_dto_response(request, VenueReadDTO.model_validate(venue))
 
 
 @router.put(
     "/{venue_id}",
     status_code=status.HTTP_200_OK,
     response_model=VenueReadDTO,
-    dependencies=[Depends(get_current_user_with_roles('ADMIN'))]
+    dependencies=[REQUIRE_ADMIN]
 )
 async def update_venue(
         venue_id: int,
@@ -76,8 +77,7 @@ async def update_venue(
     "/{venue_id}/sectors",
     status_code=status.HTTP_201_CREATED,
     response_model=SectorReadDTO,
-    response_model_exclude_none=True,
-    dependencies=[Depends(get_current_user_with_roles('ADMIN'))],
+    dependencies=[REQUIRE_ADMIN],
     name="create_sector_for_venue"
 )
 async def create_sector_for_venue(
@@ -87,7 +87,7 @@ async def create_sector_for_venue(
         response: Response,
 ):
     sector = await venue_service.create_sector(db, venue_id, schema)
-    response.headers["Location"] = f"/sectors/{sector.id}"
+    response.raw_headers.append((b"location", _SECTOR_LOC_PREFIX_B + str(sector.id).encode()))
     return sector
 
 
@@ -95,8 +95,8 @@ async def create_sector_for_venue(
     "/{venue_id}/sectors",
     status_code=status.HTTP_200_OK,
     response_model=list[SectorReadDTO],
-    dependencies=[Depends(get_current_user_with_roles('ADMIN', 'ORGANIZER', 'CUSTOMER'))]
+    dependencies=[REQUIRE_ANY_ROLE]
 )
-async def get_all_sectors_by_venue(venue_id: int, db: db_dependency):
+async def get_all_sectors_by_venue(venue_id: int, db: db_dependency, request: Request):
     sectors = await venue_service.list_sectors_by_venue(db, venue_id)
-    return sectors
+    return etag_list_response(request, _SECTORS_ADAPTER, sectors)
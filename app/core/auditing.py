@@ -1,17 +1,71 @@
-import json
+import asyncio
+import logging
+import msgpack
 import time
 from datetime import timezone, datetime
-from typing import Any, Mapping
-from app.core.config import AUDIT_STREAM
-from app.core.ctx import get_redis, get_request_id, get_route, get_actor_id, get_actor_roles, get_client_ip
+from typing import Any, Mapping, NamedTuple
+from fastapi import HTTPException
+from app.core.config import AUDIT_STREAM, AUDIT_BATCH, AUDIT_STREAM_MAXLEN
+from app.core.ctx import get_redis, get_request_id, get_route, get_actor_id, get_actor_roles, get_client_ip, \
+    get_audit_queue, get_audit_buffer
 from sqlalchemy.exc import IntegrityError
 
 
+logger = logging.getLogger("audit")
+
+
 class AuditStatus:
     SUCCESS = "SUCCESS"
     FAIL = "FAIL"
 
 
+# Must stay in sync with audit.scope_lookup; audit_logs.scope stores these ids.
+AUDIT_SCOPE_IDS: dict[str, int] = {
+    "AUTH": 1,
+    "USERS": 2,
+    "ADDRESSES": 3,
+    "ORGANIZERS": 4,
+    "VENUES": 5,
+    "SECTORS": 6,
+    "SEATS": 7,
+    "EVENTS": 8,
+    "EVENT_SECTORS": 9,
+    "TICKET_TYPES": 10,
+    "EVENT_TICKET_TYPES": 11,
+    "BOOKING": 12,
+    "CART": 13,
+    "PAYMENT_METHODS": 14,
+    "PAYMENTS": 15,
+}
+
+
+# Packed as a positional msgpack array, so key names never go on the wire; the worker zips frames back onto
+# AUDIT_FIELDS. Only ever append fields.
+class AuditEvent(NamedTuple):
+    request_id: str | None
+    scope: int | str
+    action: str
+    status: bool
+    actor_user_id: int | None
+    actor_roles: tuple[str, ...]
+    actor_ip: str | None
+    route: str | None
+    object_type: str | None
+    object_id: int | None
+    organizer_id: int | None
+    event_id: int | None
+    order_id: int | None
+    payment_id: int | None
+    invoice_id: int | None
+    reason: str | None
+    meta: dict[str, Any]
+
+
+AUDIT_FIELDS = AuditEvent._fields
+
+
+# Meta keys that audit queries filter on (e.g. "sid", "event_ticket_type_id") are promoted to indexed
+# STORED generated columns on audit.audit_logs by migration; add new hot keys the same way.
 async def audit_emit(
     *,
     scope: str,
@@ -27,44 +81,123 @@ async def audit_emit(
     reason: str | None = None,
     meta: Mapping[str, Any] | None = None
 ) -> str | None:
+    queue = get_audit_queue()
     r = get_redis()
-    if not r:
+    if queue is None and not r:
+        return None
+
+    event = AuditEvent(
+        request_id=get_request_id(),
+        # Closed enums go on the wire as a smallint id and a bool; unknown scopes stay names so the worker rejects them.
+        scope=AUDIT_SCOPE_IDS.get(scope, scope),
+        action=action,
+        status=status == AuditStatus.SUCCESS,
+        actor_user_id=get_actor_id(),
+        actor_roles=get_actor_roles(),
+        actor_ip=get_client_ip(),
+        route=get_route(),
+        object_type=object_type,
+        object_id=object_id,
+        organizer_id=organizer_id,
+        event_id=event_id,
+        order_id=order_id,
+        payment_id=payment_id,
+        invoice_id=invoice_id,
+        reason=reason,
+        # AuditSpan hands over its own dict; only foreign mappings need a copy for msgpack.
+        meta=meta if isinstance(meta, dict) else dict(meta or {}),
+    )
+    buffer = get_audit_buffer()
+    if buffer is not None:
+        buffer.append(event)
         return None
+    return await _publish(queue, r, event)
 
-    payload = {
-        "request_id": get_request_id(),
-        "scope": scope,
-        "action": action,
-        "status": status,
-        "actor_user_id": get_actor_id(),
-        "actor_roles": list(get_actor_roles() or []),
-        "actor_ip": get_client_ip(),
-        "route": get_route(),
-        "object_type": object_type,
-        "object_id": object_id,
-        "organizer_id": organizer_id,
-        "event_id": event_id,
-        "order_id": order_id,
-        "payment_id": payment_id,
-        "invoice_id": invoice_id,
-        "reason": reason,
-        "meta": dict(meta or {}),
-    }
+
+async def _publish(queue, r, event: AuditEvent) -> str | None:
+    if queue is not None:
+        _enqueue(queue, event)
+        return None
+    return await _xadd(r, event)
+
+
+async def flush_audit_buffer(buffer: list[AuditEvent], committed: bool) -> None:
+    # After a rollback the SUCCESS events describe work that never happened; FAIL events still stand.
+    queue = get_audit_queue()
+    r = get_redis()
+    if queue is None and not r:
+        return
+    for event in buffer:
+        if committed or not event.status:
+            await _publish(queue, r, event)
+
+
+# Trimming is opt-in via AUDIT_STREAM_MAXLEN; when set, keep it well above the worker's backlog or unread entries
+# are dropped.
+# Stream entries are only read by the audit worker, so they are msgpack frames under the "mp" field.
+_PACKER = msgpack.Packer(datetime=True, default=str)
+
+async def _xadd(r, event: AuditEvent) -> str | None:
     try:
-        return await r.xadd(AUDIT_STREAM, {"json": json.dumps(payload, default=str)})
+        return await r.xadd(AUDIT_STREAM, {"mp": _PACKER.pack(event)}, maxlen=AUDIT_STREAM_MAXLEN, approximate=True)
     except Exception:
         return None
 
 
-def _reason_from_exception(exception: BaseException | None) -> str | None:
-    if exception is None:
-        return None
+_DROP_LOG_EVERY = 1000
+_dropped = 0
+
+
+def audit_dropped_total() -> int:
+    return _dropped
+
+
+def _enqueue(queue: asyncio.Queue, event: AuditEvent) -> None:
+    # Audit must never block a request: when the drainer falls behind, the oldest entry is dropped.
+    global _dropped
     try:
-        from fastapi import HTTPException
-        if isinstance(exception, HTTPException):
-            return str(exception.detail)
+        queue.put_nowait(event)
+    except asyncio.QueueFull:
+        _dropped += 1
+        if _dropped % _DROP_LOG_EVERY == 1:
+            logger.warning("Audit queue full; dropped %d events so far", _dropped)
+        queue.get_nowait()
+        queue.put_nowait(event)
+
+
+async def _xadd_batch(r, batch: list[AuditEvent]) -> None:
+    try:
+        async with r.pipeline(transaction=False) as pipe:
+            for event in batch:
+                pipe.xadd(AUDIT_STREAM, {"mp": _PACKER.pack(event)}, maxlen=AUDIT_STREAM_MAXLEN, approximate=True)
+            await pipe.execute()
     except Exception:
         pass
+
+
+def _take_batch(queue: asyncio.Queue, batch: list[AuditEvent]) -> list[AuditEvent]:
+    while len(batch) < AUDIT_BATCH and not queue.empty():
+        batch.append(queue.get_nowait())
+    return batch
+
+
+async def drain_audit_queue(r, queue: asyncio.Queue) -> None:
+    # Batches whatever piled up while the previous pipeline was in flight; no timer, so no added latency.
+    while True:
+        batch = _take_batch(queue, [await queue.get()])
+        await _xadd_batch(r, batch)
+
+
+async def flush_audit_queue(r, queue: asyncio.Queue) -> None:
+    while not queue.empty():
+        await _xadd_batch(r, _take_batch(queue, []))
+
+
+def _reason_from_exception(exception: BaseException | None) -> str | None:
+    if exception is None:
+        return None
+    if isinstance(exception, HTTPException):
+        return str(exception.detail)
     if isinstance(exception, IntegrityError):
         return "Integrity error"
     return str(exception)
@@ -90,8 +223,7 @@ class AuditSpan:
 
     async def __aenter__(self):
         self._t0 = time.perf_counter()
-        started = datetime.now(timezone.utc)
-        self.meta.setdefault("occurred_at", started.isoformat(timespec="milliseconds").replace("+00:00", "Z"))
+        self.meta.setdefault("occurred_at", datetime.now(timezone.utc))
         return self
 
     async def __aexit__(self, exc_type, exc, tb):
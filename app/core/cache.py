@@ -0,0 +1,58 @@
+import hashlib
+from typing import Awaitable, Callable
+from app.core.config import CACHE_TTL_SECONDS
+from app.core.ctx import get_redis, after_commit
+
+PUBLIC_EVENTS_CACHE = "events:public"
+ORGANIZERS_CACHE = "organizers"
+ACTIVE_PAYMENT_METHODS_CACHE = "payment_methods:active"
+
+
+def _version_key(namespace: str) -> str:
+    return f"cache:{namespace}:ver"
+
+
+async def get_or_set(
+        namespace: str,
+        params: str,
+        build: Callable[[], Awaitable[str]],
+        *,
+        ttl: int = CACHE_TTL_SECONDS
+) -> str:
+    r = get_redis()
+    if not r:
+        return await build()
+
+    key = None
+    try:
+        version = await r.get(_version_key(namespace)) or "0"
+        digest = hashlib.blake2b(params.encode(), digest_size=16).hexdigest()
+        key = f"cache:{namespace}:v{version}:{digest}"
+        cached = await r.get(key)
+        if cached is not None:
+            return cached
+    except Exception:
+        pass
+
+    payload = await build()
+    if key:
+        try:
+            await r.set(key, payload, ex=ttl)
+        except Exception:
+            pass
+    return payload
+
+
+async def invalidate(namespace: str) -> None:
+    # Bumping the version before commit would let a concurrent reader re-cache the old rows for the full TTL.
+    await after_commit(lambda: _bump_version(namespace))
+
+
+async def _bump_version(namespace: str) -> None:
+    r = get_redis()
+    if not r:
+        return
+    try:
+        await r.incr(_version_key(namespace))
+    except Exception:
+        pass
@@ -1,12 +1,13 @@
 import os
+from functools import lru_cache
+from pathlib import Path
 
 
+@lru_cache(maxsize=None)
 def get_secret(secret_name: str) -> str | None:
-    secret_path = f'/run/secrets/{secret_name}'
     try:
-        with open(secret_path, 'r', encoding='utf-8') as secret_file:
-            return secret_file.read().strip()
-    except IOError:
+        return Path('/run/secrets', secret_name).read_text(encoding='utf-8').strip()
+    except OSError:
         return os.getenv(secret_name)
 
 
@@ -25,6 +26,13 @@ if POSTGRES_USER and DB_PASSWORD and POSTGRES_DB:
 else:
     raise ValueError("Can't build DATABASE_URL")  # TODO - implement custom exception class
 
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "20"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+DB_POOL_WARM = int(os.getenv("DB_POOL_WARM", "5"))
+DB_PGBOUNCER = os.getenv("DB_PGBOUNCER", "false").lower() in ("1", "true", "yes")
+
 REFRESH_ROTATE = True
 REFRESH_SLIDING = False
 REFRESH_TOKEN_TTL_DAYS = 30
@@ -37,6 +45,12 @@ AUDIT_STREAM = os.getenv("AUDIT_STREAM", "audit:events")
 AUDIT_GROUP = os.getenv("AUDIT_GROUP", "audit-g1")
 AUDIT_BATCH = int(os.getenv("AUDIT_BATCH", "200"))
 AUDIT_BLOCK_MS = int(os.getenv("AUDIT_BLOCK_MS", "5000"))
+AUDIT_QUEUE_MAX = int(os.getenv("AUDIT_QUEUE_MAX", "10000"))
+# Unset (or 0) means the stream is never trimmed: MAXLEN drops entries whether or not the worker has acked them.
+AUDIT_STREAM_MAXLEN = int(os.getenv("AUDIT_STREAM_MAXLEN", "0")) or None
+
+CACHE_TTL_SECONDS = int(os.getenv("CACHE_TTL_SECONDS", "60"))
+TRUSTED_INTERNAL = os.getenv("TRUSTED_INTERNAL", "false").lower() in ("1", "true", "yes")
 
 ADMIN_EMAIL = os.getenv("ADMIN_EMAIL")
 ADMIN_PASSWORD = get_secret("admin_password")
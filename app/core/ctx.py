@@ -1,10 +1,13 @@
 from contextvars import ContextVar
-from typing import Any
+from typing import Any, Awaitable, Callable
 
 REQUEST_ID_CTX: ContextVar[str | None] = ContextVar("request_id", default=None)
 ROUTE_CTX: ContextVar[str | None] = ContextVar("route", default=None)
 CLIENT_IP_CTX: ContextVar[str | None] = ContextVar("client_ip", default=None)
 REDIS_CTX: ContextVar[Any] = ContextVar("redis", default=None)
+AUDIT_QUEUE_CTX: ContextVar[Any] = ContextVar("audit_queue", default=None)
+AUDIT_BUFFER_CTX: ContextVar[list | None] = ContextVar("audit_buffer", default=None)
+AFTER_COMMIT_CTX: ContextVar[list | None] = ContextVar("after_commit", default=None)
 AUTH_USER_ID_CTX: ContextVar[int | None] = ContextVar("auth_user_id", default=None)
 AUTH_ROLES_CTX: ContextVar[tuple[str, ...]] = ContextVar("auth_roles", default=())
 
@@ -25,9 +28,27 @@ def get_redis() -> Any:
     return REDIS_CTX.get()
 
 
+def get_audit_queue() -> Any:
+    return AUDIT_QUEUE_CTX.get()
+
+
+def get_audit_buffer() -> list | None:
+    return AUDIT_BUFFER_CTX.get()
+
+
 def get_actor_id() -> int | None:
     return AUTH_USER_ID_CTX.get()
 
 
 def get_actor_roles() -> tuple[str, ...]:
     return AUTH_ROLES_CTX.get()
+
+
+async def after_commit(callback: Callable[[], Awaitable[None]]) -> None:
+    # Side effects other readers act on (cache versions, token stale markers) must not land before the data does:
+    # inside get_db they run once the session commits and are dropped on rollback; elsewhere they run immediately.
+    hooks = AFTER_COMMIT_CTX.get()
+    if hooks is None:
+        await callback()
+    else:
+        hooks.append(callback)
@@ -1,18 +1,75 @@
-from .config import DATABASE_URL
+import asyncio
+from contextlib import AsyncExitStack
+from typing import Annotated
+from uuid import uuid4
+from fastapi import Depends
+from .config import DATABASE_URL, DB_POOL_SIZE, DB_MAX_OVERFLOW, DB_POOL_TIMEOUT, DB_POOL_RECYCLE, DB_PGBOUNCER, \
+    DB_POOL_WARM
+from sqlalchemy import text
+from .auditing import flush_audit_buffer
+from .ctx import AUDIT_BUFFER_CTX, AFTER_COMMIT_CTX
 from sqlalchemy.orm import declarative_base
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 
-engine = create_async_engine(DATABASE_URL)
+# PgBouncer in transaction mode hands each transaction to any server connection, so named prepared
+# statements cached on one backend are unusable on the next.
+CONNECT_ARGS = {
+    "statement_cache_size": 0,
+    "prepared_statement_cache_size": 0,
+    "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+} if DB_PGBOUNCER else {}
+
+engine = create_async_engine(
+    DATABASE_URL,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_timeout=DB_POOL_TIMEOUT,
+    pool_recycle=DB_POOL_RECYCLE,
+    pool_pre_ping=True,
+    connect_args=CONNECT_ARGS
+)
 
 AsyncSessionLocal = async_sessionmaker(bind=engine, expire_on_commit=False)
 
 Base = declarative_base()
 
+
+async def warm_pool(size: int = DB_POOL_WARM) -> None:
+    # Hold `size` connections at once so they stay pooled (asyncpg setup done) instead of opening on first requests.
+    size = max(1, min(size, DB_POOL_SIZE))
+    async with AsyncExitStack() as stack:
+        conns = await asyncio.gather(*(stack.enter_async_context(engine.connect()) for _ in range(size)))
+        await asyncio.gather(*(conn.execute(text("SELECT 1")) for conn in conns))
+
+
+# AsyncSession only checks out a pooled connection on its first statement, so handlers that never
+# query (cache hits, 304s) hold no connection; skip the commit/rollback round trip for them too.
+# Audit events emitted meanwhile are held until the outcome is known and published after the session ends;
+# after_commit hooks run only once the commit succeeded.
 async def get_db() -> AsyncSession:
-    async with AsyncSessionLocal() as session:
-        try:
-            yield session
-            await session.commit()
-        except Exception:
-            await session.rollback()
-            raise
+    audit_buffer: list = []
+    hooks: list = []
+    token = AUDIT_BUFFER_CTX.set(audit_buffer)
+    hooks_token = AFTER_COMMIT_CTX.set(hooks)
+    committed = False
+    try:
+        async with AsyncSessionLocal() as session:
+            try:
+                yield session
+                if session.in_transaction():
+                    await session.commit()
+                committed = True
+            except Exception:
+                if session.in_transaction():
+                    await session.rollback()
+                raise
+    finally:
+        AFTER_COMMIT_CTX.reset(hooks_token)
+        AUDIT_BUFFER_CTX.reset(token)
+        await flush_audit_buffer(audit_buffer, committed)
+        if committed:
+            for hook in hooks:
+                await hook()
+
+
+db_dependency = Annotated[AsyncSession, Depends(get_db)]
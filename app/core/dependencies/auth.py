@@ -1,23 +1,33 @@
+import hashlib
+import time
+from functools import lru_cache
 from fastapi import Depends
 from fastapi.security import OAuth2PasswordBearer
-from typing import Annotated
-from jose import JWTError, jwt
+from typing import Annotated, Iterable, NamedTuple
+import jwt
 from pydantic import ValidationError
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
-from app.core.database import get_db
+from sqlalchemy import select, lambda_stmt
+from sqlalchemy.orm import selectinload, raiseload
+from app.core.database import db_dependency
 from app.core.security import ALGORITHM
-from app.core.config import SECRET_KEY, JWT_ISSUER, JWT_AUDIENCE
+from app.core.config import SECRET_KEY, JWT_ISSUER, JWT_AUDIENCE, ACCESS_TOKEN_EXPIRE_MINUTES
 from app.domain.users.models import User
 from app.domain.auth.schemas import TokenPayload
 from app.domain.exceptions import Unauthorized, Forbidden
-from app.core.ctx import AUTH_ROLES_CTX, AUTH_USER_ID_CTX
+from app.core.ctx import AUTH_ROLES_CTX, AUTH_USER_ID_CTX, get_redis, after_commit
 
 
 oauth2_bearer = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
 
-async def get_token_payload(token: Annotated[str, Depends(oauth2_bearer)]) -> TokenPayload:
+_JWT_LEEWAY_SECONDS = 5
+_TOKEN_CACHE_MAX = 10_000
+# Verified access-token payloads by token digest. Only the signature/claims check is skipped on a hit;
+# a payload past exp is decoded (and rejected) again.
+_token_cache: dict[bytes, TokenPayload] = {}
+
+
+def _decode_access_token(token: str) -> TokenPayload:
     try:
         raw_payload = jwt.decode(
             token,
@@ -25,31 +35,170 @@ async def get_token_payload(token: Annotated[str, Depends(oauth2_bearer)]) -> To
             algorithms=[ALGORITHM],
             issuer=JWT_ISSUER,
             audience=JWT_AUDIENCE,
-            options={"verify_aud": True, "leeway": 5}
+            leeway=_JWT_LEEWAY_SECONDS
         )
         if raw_payload.get("typ") != "access":
             raise Unauthorized("Invalid token type", ctx={"reason": "invalid_type"})
         return TokenPayload.model_validate(raw_payload)
-    except (JWTError, ValidationError):
+    except (jwt.InvalidTokenError, ValidationError):
         raise Unauthorized("Invalid authentication credentials", ctx={"reason": "invalid_token"})
 
 
+async def get_token_payload(token: Annotated[str, Depends(oauth2_bearer)]) -> TokenPayload:
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    cached = _token_cache.get(key)
+    if cached is not None:
+        if cached.exp + _JWT_LEEWAY_SECONDS >= time.time():
+            return cached
+        del _token_cache[key]
+
+    payload = _decode_access_token(token)
+    if len(_token_cache) >= _TOKEN_CACHE_MAX:
+        _token_cache.pop(next(iter(_token_cache)))
+    _token_cache[key] = payload
+    return payload
+
+
+# Authorization only needs roles and organizer ids; the mapper-level selectin cascade would otherwise also
+# pull refresh sessions, orders and every organizer's events on each authenticated request.
+_AUTH_USER_OPTIONS = (
+    selectinload(User.roles),
+    selectinload(User.organizers).raiseload("*"),
+    raiseload("*"),
+)
+
+
+async def get_current_user(payload: Annotated[TokenPayload, Depends(get_token_payload)], db: db_dependency) -> User:
+    user_id = int(payload.sub)
+    # Built and cached once per call site; only user_id is re-extracted as a bound parameter on each request.
+    stmt = lambda_stmt(lambda: select(User).options(*_AUTH_USER_OPTIONS).where(User.is_active.is_(True)))
+    stmt += lambda s: s.where(User.id == user_id)
+    result = await db.execute(stmt)
+    user = result.scalars().first()
+    if not user:
+        raise Unauthorized("User not found", ctx={"user_id": payload.sub})
+
+    AUTH_ROLES_CTX.set(tuple(sorted(user.role_names)))
+    AUTH_USER_ID_CTX.set(user.id)
+    return user
+
+
+# Must stay in sync with the seeded roles table; role checks compare bitmasks instead of building name sets.
+_ROLE_BITS: dict[str, int] = {"ADMIN": 1, "ORGANIZER": 2, "CUSTOMER": 4}
+
+
+def _role_mask(names: Iterable[str]) -> int:
+    mask = 0
+    for name in names:
+        mask |= _ROLE_BITS.get(name, 0)
+    return mask
+
+
+def _allowed_mask(allowed_roles: tuple[str, ...]) -> int:
+    mask = 0
+    for name in allowed_roles:
+        mask |= _ROLE_BITS[name]
+    return mask
+
+
+def _forbidden(allowed_roles: tuple[str, ...], roles: Iterable[str]) -> Forbidden:
+    return Forbidden("Permission denied", ctx={"required": list(allowed_roles), "user_roles": sorted(roles)})
+
+
 def get_current_user_with_roles(*allowed_roles: str):
-    allowed = set(allowed_roles)
-
-    async def _inner(payload: Annotated[TokenPayload, Depends(get_token_payload)],
-                     db: Annotated[AsyncSession, Depends(get_db)]) -> User:
-        stmt = select(User).where(User.id == int(payload.sub), User.is_active.is_(True))
-        result = await db.execute(stmt)
-        user = result.scalars().first()
-        if not user:
-            raise Unauthorized("User not found", ctx={"user_id": payload.sub})
-
-        roles = {r.name for r in user.roles}
-        AUTH_ROLES_CTX.set(roles)
-        AUTH_USER_ID_CTX.set(user.id)
-
-        if allowed and roles.isdisjoint(allowed):
-            raise Forbidden("Permission denied", ctx={"required": list(allowed_roles), "user_roles": list(roles)})
+    return _user_with_roles(tuple(sorted(set(allowed_roles))))
+
+
+@lru_cache(maxsize=None)
+def _user_with_roles(allowed_roles: tuple[str, ...]):
+    allowed_mask = _allowed_mask(allowed_roles)
+
+    async def _inner(user: Annotated[User, Depends(get_current_user)]) -> User:
+        if allowed_mask and not _role_mask(user.role_names) & allowed_mask:
+            raise _forbidden(allowed_roles, user.role_names)
         return user
     return _inner
+
+
+class AuthPrincipal(NamedTuple):
+    user_id: int
+    roles: tuple[str, ...]
+
+
+_STALE_KEY_PREFIX = "auth:stale:"
+
+
+async def mark_access_tokens_stale(user_id: int) -> None:
+    # Access tokens issued up to now stop being trusted for their roles and fall back to a user lookup. The marker is
+    # written after the commit: a token refreshed before then still carries the old roles and must predate it.
+    await after_commit(lambda: _write_stale_marker(user_id))
+
+
+async def _write_stale_marker(user_id: int) -> None:
+    r = get_redis()
+    if not r:
+        return
+    try:
+        await r.set(f"{_STALE_KEY_PREFIX}{user_id}", int(time.time()),
+                    ex=ACCESS_TOKEN_EXPIRE_MINUTES * 60 + _JWT_LEEWAY_SECONDS)
+    except Exception:
+        pass
+
+
+async def _token_roles_trusted(payload: TokenPayload) -> bool:
+    if payload.roles is None:
+        return False
+    r = get_redis()
+    if not r:
+        return False
+    try:
+        stale_since = await r.get(f"{_STALE_KEY_PREFIX}{payload.sub}")
+    except Exception:
+        return False
+    return stale_since is None or payload.iat > int(stale_since)
+
+
+async def get_principal(
+    payload: Annotated[TokenPayload, Depends(get_token_payload)],
+    db: db_dependency
+) -> AuthPrincipal:
+    # Route guards only need identity and roles, which the signed token carries. Tokens without a roles claim,
+    # users whose roles changed since issue, and Redis outages take the database path instead.
+    if not await _token_roles_trusted(payload):
+        user = await get_current_user(payload, db)
+        return AuthPrincipal(user.id, tuple(sorted(user.role_names)))
+
+    principal = AuthPrincipal(int(payload.sub), tuple(payload.roles))
+    AUTH_ROLES_CTX.set(principal.roles)
+    AUTH_USER_ID_CTX.set(principal.user_id)
+    return principal
+
+
+def require_roles(*allowed_roles: str):
+    return _principal_with_roles(tuple(sorted(set(allowed_roles))))
+
+
+@lru_cache(maxsize=None)
+def _principal_with_roles(allowed_roles: tuple[str, ...]):
+    allowed_mask = _allowed_mask(allowed_roles)
+
+    async def _inner(principal: Annotated[AuthPrincipal, Depends(get_principal)]) -> AuthPrincipal:
+        if allowed_mask and not _role_mask(principal.roles) & allowed_mask:
+            raise _forbidden(allowed_roles, principal.roles)
+        return principal
+    return _inner
+
+
+# The user lookup is one shared dependency, so FastAPI's per-request cache resolves it once even when a route
+# mixes role sets; each role set is still a single memoized callable.
+ANY_ROLE = Depends(get_current_user_with_roles("ADMIN", "ORGANIZER", "CUSTOMER"))
+ADMIN_ONLY = Depends(get_current_user_with_roles("ADMIN"))
+ADMIN_OR_ORGANIZER = Depends(get_current_user_with_roles("ADMIN", "ORGANIZER"))
+ORGANIZER_ONLY = Depends(get_current_user_with_roles("ORGANIZER"))
+CUSTOMER_ONLY = Depends(get_current_user_with_roles("CUSTOMER"))
+CUSTOMER_OR_ADMIN = Depends(get_current_user_with_roles("CUSTOMER", "ADMIN"))
+
+# Guards for route-level `dependencies=[...]`, where the handler never sees the user: no user query on the hot path.
+REQUIRE_ANY_ROLE = Depends(require_roles("ADMIN", "ORGANIZER", "CUSTOMER"))
+REQUIRE_ADMIN = Depends(require_roles("ADMIN"))
+REQUIRE_ADMIN_OR_ORGANIZER = Depends(require_roles("ADMIN", "ORGANIZER"))
@@ -1,17 +1,15 @@
-from fastapi import Depends
 from typing import Annotated, NamedTuple
-from sqlalchemy import select
+from sqlalchemy import select, exists, true, lambda_stmt
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.core.database import get_db
-from app.core.dependencies.auth import get_current_user_with_roles
+from app.core.database import db_dependency
+from app.core.dependencies.auth import ADMIN_OR_ORGANIZER
 from app.domain.users.models import User
 from app.domain.events.models import Event
+from app.domain.associations import organizers_users
 from app.domain.pricing.models import EventTicketType
 from app.domain.allocation.models import EventSector
 from app.domain.exceptions import NotFound, Forbidden
 
-ADMIN_OR_ORG = get_current_user_with_roles('ADMIN', 'ORGANIZER')
-
 
 class EventActor(NamedTuple):
     event: Event
@@ -23,16 +21,60 @@ class EventTicketTypeActor(NamedTuple):
     user: User
 
 
-async def _ensure_event_owner(event_id: int, db: AsyncSession, user: User) -> Event:
-    event = (await db.execute(select(Event).where(Event.id == event_id))).scalars().first()
-    if not event:
+def _is_admin(user: User) -> bool:
+    return "ADMIN" in user.role_names
+
+
+def _owned_by(user_id: int):
+    return exists().where(
+        organizers_users.c.user_id == user_id,
+        organizers_users.c.organizer_id == Event.organizer_id
+    )
+
+
+# The ownership statements are lambda_stmt: each call site builds and caches its statement once, and later calls
+# only extract event_id / user_id as bound parameters. Admins get their own call site, so both shapes stay cached.
+def _event_owned_stmt(event_id: int, user: User):
+    if _is_admin(user):
+        return lambda_stmt(lambda: select(true()).where(Event.id == event_id))
+    user_id = user.id
+    return lambda_stmt(lambda: select(_owned_by(user_id)).where(Event.id == event_id))
+
+
+def _event_with_owner_stmt(event_id: int, user: User):
+    if _is_admin(user):
+        return lambda_stmt(lambda: select(Event, true().label("is_owner")).where(Event.id == event_id))
+    user_id = user.id
+    return lambda_stmt(lambda: select(Event, _owned_by(user_id).label("is_owner")).where(Event.id == event_id))
+
+
+def _ticket_type_with_owner_stmt(event_ticket_type_id: int, user: User):
+    # Ownership is resolved in the same round trip as the lookup instead of a second query on the event.
+    if _is_admin(user):
+        stmt = lambda_stmt(lambda: select(EventTicketType, EventSector.event_id, true().label("is_owner")))
+    else:
+        user_id = user.id
+        stmt = lambda_stmt(lambda: select(EventTicketType, EventSector.event_id, _owned_by(user_id).label("is_owner")))
+    stmt += lambda s: s.join(EventSector).join(Event, Event.id == EventSector.event_id)
+    stmt += lambda s: s.where(EventTicketType.id == event_ticket_type_id)
+    return stmt
+
+
+async def _authorize_event_owner(event_id: int, db: AsyncSession, user: User) -> None:
+    owned = await db.scalar(_event_owned_stmt(event_id, user))
+    if owned is None:
         raise NotFound("Event not found", ctx={"event_id": event_id})
+    if not owned:
+        raise Forbidden("Not allowed", ctx={"event_id": event_id, "reason": "organizer_mismatch"})
+
 
-    roles = {r.name for r in user.roles}
-    if "ADMIN" in roles:
-        return event
+async def _ensure_event_owner(event_id: int, db: AsyncSession, user: User) -> Event:
+    row = (await db.execute(_event_with_owner_stmt(event_id, user))).tuples().first()
+    if not row:
+        raise NotFound("Event not found", ctx={"event_id": event_id})
 
-    if event.organizer_id not in {o.id for o in user.organizers}:
+    event, owned = row
+    if not owned:
         raise Forbidden("Not allowed", ctx={"event_id": event_id, "reason": "organizer_mismatch"})
 
     return event
@@ -40,13 +82,12 @@ async def _ensure_event_owner(event_id: int, db: AsyncSession, user: User) -> Ev
 
 def require_organizer_member(
         organizer_id: int,
-        user: Annotated[User, Depends(ADMIN_OR_ORG)]
+        user: Annotated[User, ADMIN_OR_ORGANIZER]
 ) -> int:
-    roles = {r.name for r in user.roles}
-    if "ADMIN" in roles:
+    if _is_admin(user):
         return organizer_id
 
-    if organizer_id not in {o.id for o in user.organizers}:
+    if organizer_id not in user.organizer_ids:
         raise Forbidden("Not allowed", ctx={"organizer_id": organizer_id, "reason": "organizer_mismatch"})
 
     return organizer_id
@@ -54,16 +95,25 @@ def require_organizer_member(
 
 async def require_event_owner(
         event_id: int,
-        db: Annotated[AsyncSession, Depends(get_db)],
-        user: Annotated[User, Depends(ADMIN_OR_ORG)]
+        db: db_dependency,
+        user: Annotated[User, ADMIN_OR_ORGANIZER]
 ) -> Event:
     return await _ensure_event_owner(event_id, db, user)
 
 
+async def authorize_event_owner(
+        event_id: int,
+        db: db_dependency,
+        user: Annotated[User, ADMIN_OR_ORGANIZER]
+) -> int:
+    await _authorize_event_owner(event_id, db, user)
+    return event_id
+
+
 async def require_event_actor(
         event_id: int,
-        db: Annotated[AsyncSession, Depends(get_db)],
-        user: Annotated[User, Depends(ADMIN_OR_ORG)]
+        db: db_dependency,
+        user: Annotated[User, ADMIN_OR_ORGANIZER]
 ) -> EventActor:
     event = await _ensure_event_owner(event_id, db, user)
     return EventActor(event, user)
@@ -71,20 +121,16 @@ async def require_event_actor(
 
 async def require_event_ticket_type_access(
         event_ticket_type_id: int,
-        db: Annotated[AsyncSession, Depends(get_db)],
-        user: Annotated[User, Depends(ADMIN_OR_ORG)]
+        db: db_dependency,
+        user: Annotated[User, ADMIN_OR_ORGANIZER]
 ) -> EventTicketTypeActor:
-    stmt = (
-        select(EventTicketType, EventSector.event_id)
-        .join(EventSector)
-        .where(EventTicketType.id == event_ticket_type_id)
-    )
-    result = await db.execute(stmt)
+    result = await db.execute(_ticket_type_with_owner_stmt(event_ticket_type_id, user))
     row = result.tuples().first()
 
     if not row:
         raise NotFound("Event ticket type not found", ctx={"event_ticket_type_id": event_ticket_type_id})
 
-    event_ticket_type, event_id = row
-    await _ensure_event_owner(event_id, db=db, user=user)
+    event_ticket_type, event_id, owned = row
+    if not owned:
+        raise Forbidden("Not allowed", ctx={"event_id": event_id, "reason": "organizer_mismatch"})
     return EventTicketTypeActor(event_ticket_type, user)
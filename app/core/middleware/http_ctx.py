@@ -1,37 +1,57 @@
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
-from app.core.ctx import REQUEST_ID_CTX, ROUTE_CTX, CLIENT_IP_CTX, REDIS_CTX
+from starlette.types import ASGIApp, Receive, Scope, Send
+from app.core.ctx import REQUEST_ID_CTX, ROUTE_CTX, CLIENT_IP_CTX, REDIS_CTX, AUDIT_QUEUE_CTX
 
 
-def _client_ip(request: Request) -> str | None:
-    xff = request.headers.get("x-forwarded-for")
-    return xff.split(",")[0].strip() if xff else (request.client.host if request.client else None)
+def _header(scope: Scope, name: bytes) -> str | None:
+    # ASGI servers lowercase header names, so the raw list can be scanned without building a Headers object.
+    for key, value in scope["headers"]:
+        if key == name:
+            return value.decode("latin-1")
+    return None
 
 
-def _http_route(request: Request) -> str:
-    return f"{request.method} {request.url.path}"
+def _client_ip(scope: Scope) -> str | None:
+    xff = _header(scope, b"x-forwarded-for")
+    if xff:
+        return xff.partition(",")[0].strip()
+    client = scope.get("client")
+    return client[0] if client else None
 
 
-class HttpContextMiddleware(BaseHTTPMiddleware):
-    def __init__(self, app, request_id_header: str = "X-Request-ID"):
-        super().__init__(app)
-        self.request_id_header = request_id_header
+def _http_route(scope: Scope) -> str:
+    return f"{scope['method']} {scope['path']}"
+
+
+class HttpContextMiddleware:
+    # Plain ASGI: BaseHTTPMiddleware would run every request in an extra task with a memory stream in between.
+    def __init__(self, app: ASGIApp, request_id_header: str = "X-Request-ID"):
+        self.app = app
+        self.request_id_header = request_id_header.lower().encode("latin-1")
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-    async def dispatch(self, request: Request, call_next):
         tokens: list[tuple] = []
         try:
-            req_id = request.headers.get(self.request_id_header)
+            req_id = _header(scope, self.request_id_header)
             if req_id is not None:
                 tokens.append((REQUEST_ID_CTX, REQUEST_ID_CTX.set(req_id)))
 
-            tokens.append((ROUTE_CTX, ROUTE_CTX.set(_http_route(request))))
-            tokens.append((CLIENT_IP_CTX, CLIENT_IP_CTX.set(_client_ip(request))))
+            tokens.append((ROUTE_CTX, ROUTE_CTX.set(_http_route(scope))))
+            tokens.append((CLIENT_IP_CTX, CLIENT_IP_CTX.set(_client_ip(scope))))
 
-            redis_client = getattr(request.app.state, "redis", None)
+            state = scope["app"].state
+            redis_client = getattr(state, "redis", None)
             if redis_client:
                 tokens.append((REDIS_CTX, REDIS_CTX.set(redis_client)))
 
-            return await call_next(request)
+            audit_queue = getattr(state, "audit_queue", None)
+            if audit_queue is not None:
+                tokens.append((AUDIT_QUEUE_CTX, AUDIT_QUEUE_CTX.set(audit_queue)))
+
+            await self.app(scope, receive, send)
         finally:
             for var, token in reversed(tokens):
                 var.reset(token)
@@ -1,19 +1,30 @@
 import uuid
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from app.core.ctx import REQUEST_ID_CTX
+from app.core.middleware.http_ctx import _header
 
 
-class RequestIdMiddleware(BaseHTTPMiddleware):
-    def __init__(self, app, header_name: str = "X-Request-ID"):
-        super().__init__(app)
+class RequestIdMiddleware:
+    def __init__(self, app: ASGIApp, header_name: str = "X-Request-ID"):
+        self.app = app
         self.header_name = header_name
+        self._raw_header_name = header_name.lower().encode("latin-1")
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        rid = _header(scope, self._raw_header_name) or str(uuid.uuid4())
+
+        async def send_with_request_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).setdefault(self.header_name, rid)
+            await send(message)
 
-    async def dispatch(self, request, call_next):
-        rid = request.headers.get(self.header_name) or str(uuid.uuid4())
         token = REQUEST_ID_CTX.set(rid)
         try:
-            response = await call_next(request)
-            response.headers.setdefault(self.header_name, rid)
-            return response
+            await self.app(scope, receive, send_with_request_id)
         finally:
             REQUEST_ID_CTX.reset(token)
@@ -1,30 +1,86 @@
+import base64
+import binascii
+import orjson
+from datetime import datetime
 from typing import Generic, TypeVar
-from pydantic import BaseModel, computed_field
-from sqlalchemy import select, func
-from typing import Any
+from pydantic import BaseModel, model_validator
+from sqlalchemy import select, func, tuple_
+from typing import Any, AsyncIterator, Callable, Sequence
 from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.utils.fields import omit_none
+from app.domain.exceptions import InvalidInput
 
 
 T = TypeVar("T")
 
+EXPORT_BATCH_SIZE = 500
+
 
 class PageDTO(BaseModel, Generic[T]):
     items: list[T]
-    total: int
+    total: int | None
     page: int
     page_size: int
+    next_cursor: str | None = omit_none(default=None)
+
+    # Derived once at construction: plain fields serialize on pydantic-core's fast path, computed fields do not.
+    pages: int | None = 1
+    has_next: bool = False
+
+    @model_validator(mode="after")
+    def _derive_pages(self):
+        if self.total is None:
+            # Cursor pages are not counted; only the cursor tells whether more rows follow.
+            self.pages = None
+            self.has_next = self.next_cursor is not None
+            return self
+        if self.page_size > 0:
+            self.pages = max(1, (self.total + self.page_size - 1) // self.page_size)
+        else:
+            self.pages = 1
+        self.has_next = self.page < self.pages
+        return self
+
+
+def encode_cursor(*values: Any) -> str:
+    raw = orjson.dumps([v.isoformat() if isinstance(v, datetime) else v for v in values])
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
 
-    @computed_field
-    @property
-    def pages(self) -> int:
-        if self.page_size <= 0:
-            return 1
-        return max(1, (self.total + self.page_size - 1) // self.page_size)
 
-    @computed_field
-    @property
-    def has_next(self) -> bool:
-        return self.page < self.pages
+def next_cursor(items: Sequence[T], page_size: int, key: Callable[[T], Sequence[Any]]) -> str | None:
+    if not items or len(items) < page_size:
+        return None
+    return encode_cursor(*key(items[-1]))
+
+
+def _coerce_cursor_value(col: Any, value: Any) -> Any:
+    python_type = col.type.python_type
+    if python_type is datetime:
+        if not isinstance(value, str):
+            raise TypeError("cursor value is not a timestamp")
+        return datetime.fromisoformat(value)
+    # bool is an int subclass, but never a valid keyset value.
+    if isinstance(value, bool) or not isinstance(value, python_type):
+        raise TypeError(f"cursor value is not {python_type.__name__}")
+    return value
+
+
+def _decode_cursor(cursor: str, keyset: Sequence[Any]) -> list[Any]:
+    try:
+        values = orjson.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        if not isinstance(values, list) or len(values) != len(keyset):
+            raise ValueError("cursor arity mismatch")
+        return [_coerce_cursor_value(col, v) for col, v in zip(keyset, values)]
+    except (ValueError, TypeError, binascii.Error) as e:
+        raise InvalidInput("Invalid cursor", ctx={"after": cursor}) from e
+
+
+async def _count(db: AsyncSession, stmt, count_by: Any | None) -> int:
+    if count_by is not None:
+        count_stmt = stmt.with_only_columns(count_by).order_by(None).distinct()
+        return await db.scalar(select(func.count()).select_from(count_stmt.subquery())) or 0
+    total_subquery = stmt.order_by(None).limit(None).offset(None)
+    return await db.scalar(select(func.count()).select_from(total_subquery.subquery())) or 0
 
 
 async def paginate(
@@ -37,7 +93,11 @@ async def paginate(
         order_by: list[Any] | None = None,
         distinct_on: Any | None = None,
         scalars: bool = True,
-        count_by: Any | None = None
+        count_by: Any | None = None,
+        keyset: Sequence[Any] | None = None,
+        keyset_desc: bool = True,
+        after: str | None = None,
+        single_query_count: bool = True
 ):
     page = max(1, int(page))
     page_size = max(1, min(200, int(page_size)))
@@ -55,13 +115,35 @@ async def paginate(
     elif order_by:
         stmt = stmt.order_by(*order_by)
 
-    if count_by is not None:
-        count_stmt = stmt.with_only_columns(count_by).order_by(None).distinct()
-        total = await db.scalar(select(func.count()).select_from(count_stmt.subquery()))
-    else:
-        total_subquery = stmt.order_by(None).limit(None).offset(None)
-        total = await db.scalar(select(func.count()).select_from(total_subquery.subquery()))
+    if after is not None and keyset:
+        # Counting the whole filtered set would make every cursor page O(N); cursor pages report no total.
+        values = _decode_cursor(after, keyset)
+        bound = tuple_(*values)
+        stmt = stmt.where(tuple_(*keyset) < bound if keyset_desc else tuple_(*keyset) > bound).limit(page_size)
+        if scalars:
+            result = await db.scalars(stmt)
+        else:
+            result = await db.execute(stmt)
+        return result.all(), None
 
+    # COUNT(*) OVER () is evaluated before LIMIT/OFFSET, so the page and the total come back in one query. It
+    # cannot count distinct ids (count_by); those keep the separate count.
+    if single_query_count and count_by is None and not distinct_on:
+        result = await db.execute(
+            stmt.add_columns(func.count().over().label("total_count")).limit(page_size).offset((page - 1) * page_size)
+        )
+        width = len(result.keys()) - 1
+        frozen = result.freeze()
+        if frozen.data:
+            page_result = frozen()
+            items = page_result.scalars().all() if scalars else page_result.columns(*range(width)).all()
+            return items, int(frozen.data[0][width])
+        if page == 1:
+            return [], 0
+        # Past the last page there is no row to read the total from.
+        return [], await _count(db, stmt, None)
+
+    total = await _count(db, stmt, count_by)
     stmt = stmt.limit(page_size).offset((page - 1) * page_size)
 
     if scalars:
@@ -71,3 +153,15 @@ async def paginate(
 
     items = result.all()
     return items, int(total or 0)
+
+
+async def stream_batches(
+        db: AsyncSession,
+        stmt,
+        map_row: Callable[[Any], T],
+        *,
+        batch_size: int = EXPORT_BATCH_SIZE
+) -> AsyncIterator[list[T]]:
+    result = await db.stream(stmt.execution_options(yield_per=batch_size))
+    async for partition in result.partitions():
+        yield [map_row(row) for row in partition]
@@ -3,7 +3,8 @@ from argon2 import PasswordHasher
 from argon2.exceptions import VerifyMismatchError
 from .config import SECRET_KEY, ACCESS_TOKEN_EXPIRE_MINUTES, ALGORITHM, JWT_ISSUER, JWT_AUDIENCE
 from datetime import timedelta, datetime, timezone
-from jose import jwt
+from typing import Iterable
+import jwt
 
 ph = PasswordHasher()
 
@@ -19,7 +20,7 @@ def verify_password(password: str, hashed_password: str) -> bool:
         return False
 
 
-def create_access_token(subject: str | int, *, sid: str | None = None) -> str:
+def create_access_token(subject: str | int, *, sid: str | None = None, roles: Iterable[str] = ()) -> str:
     now = datetime.now(timezone.utc)
     expire = now + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     payload = {
@@ -30,7 +31,8 @@ def create_access_token(subject: str | int, *, sid: str | None = None) -> str:
         "jti": str(uuid.uuid4()),
         "typ": "access",
         "iss": JWT_ISSUER,
-        "aud": JWT_AUDIENCE
+        "aud": JWT_AUDIENCE,
+        "roles": sorted(roles)
     }
     if sid:
         payload["sid"] = sid
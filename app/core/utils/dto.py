@@ -0,0 +1,11 @@
+from typing import Any, TypeVar
+from pydantic import BaseModel
+from app.core.config import TRUSTED_INTERNAL
+
+M = TypeVar("M", bound=BaseModel)
+
+
+def from_orm(model: type[M], obj: Any) -> M:
+    if TRUSTED_INTERNAL:
+        return model.model_construct(**{name: getattr(obj, name) for name in model.model_fields})
+    return model.model_validate(obj)
@@ -0,0 +1,10 @@
+from typing import Any
+from pydantic import Field
+
+
+def _is_none(value: Any) -> bool:
+    return value is None
+
+
+def omit_none(**kwargs: Any) -> Any:
+    return Field(exclude_if=_is_none, **kwargs)
@@ -1,11 +1,23 @@
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload, load_only, raiseload
 from app.core.pagination import paginate
+from app.domain.organizers.models import Organizer
+from app.domain.venues.models import Venue
 from .models import Address
 
 
+# Callers only read columns plus organizer ids and whether a venue exists; the mapper-level selectin cascade
+# would otherwise walk venue -> sectors -> seats and every organizer's events.
+_ADDRESS_OPTIONS = (
+    selectinload(Address.organizers).options(load_only(Organizer.id), raiseload("*")),
+    selectinload(Address.venue).options(load_only(Venue.id), raiseload("*")),
+    raiseload("*"),
+)
+
+
 async def get_address_by_id(db: AsyncSession, address_id: int) -> Address | None:
-    stmt = select(Address).where(Address.id == address_id)
+    stmt = select(Address).options(*_ADDRESS_OPTIONS).where(Address.id == address_id)
     result = await db.execute(stmt)
     return result.scalars().first()
 
@@ -19,8 +31,7 @@ async def list_all_addresses(db: AsyncSession, page: int, page_size: int) -> tup
         page_size=page_size,
         where=[],
         order_by=[Address.id],
-        scalars=True,
-        count_by=Address.id
+        scalars=True
     )
     return items, total
 
@@ -1,4 +1,5 @@
 from pydantic import BaseModel, Field, ConfigDict
+from app.core.utils.fields import omit_none
 
 class AddressCreateDTO(BaseModel):
     city: str = Field(min_length=2, max_length=100)
@@ -17,7 +18,7 @@ class AddressReadDTO(BaseModel):
     street: str
     postal_code: str
     building_number: str
-    apartment_number: str | None
+    apartment_number: str | None = omit_none()
     country_code: str
 
 
@@ -26,7 +27,7 @@ class AddressPutDTO(AddressCreateDTO):
 
 
 class AddressesQueryDTO(BaseModel):
-    model_config = ConfigDict(extra='forbid')
+    model_config = ConfigDict(extra='ignore')
 
     page: int = Field(default=1, ge=1)
     page_size: int = Field(default=20, ge=1, le=200)
@@ -1,7 +1,7 @@
 from app.domain.allocation.models import EventSector
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, delete
 
 
 async def get_event_sector(db: AsyncSession, event_id: int, sector_id: int) -> EventSector | None:
@@ -27,5 +27,10 @@ async def bulk_add_event_sectors(db: AsyncSession, event_id: int, data: list[dic
     await db.execute(stmt)
 
 
-async def delete_event_sector(db: AsyncSession, event_sector: EventSector) -> None:
-    await db.delete(event_sector)
+async def delete_event_sector(db: AsyncSession, event_id: int, sector_id: int) -> int | None:
+    stmt = (
+        delete(EventSector)
+        .where(EventSector.event_id == event_id, EventSector.sector_id == sector_id)
+        .returning(EventSector.id)
+    )
+    return await db.scalar(stmt)
@@ -22,6 +22,7 @@ class TokenPayload(BaseModel):
     iss: str | None = None
     aud: str | list[str] | None = None
     sid: str | None = None
+    roles: list[str] | None = None
 
 
 class LoginResponse(Token):
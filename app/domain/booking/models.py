@@ -55,6 +55,8 @@ class Order(Base):
             unique=True,
             postgresql_where=text("status IN ('PENDING', 'AWAITING_PAYMENT')")
         ),
+        Index("ix_orders_created_id", text("created_at DESC"), text("id DESC")),
+        Index("ix_orders_user_created_id", "user_id", text("created_at DESC"), text("id DESC")),
     )
 
 
@@ -149,3 +151,12 @@ class Invoice(Base):
     issued_at: Mapped[datetime] = mapped_column(TIMESTAMP(timezone=True), nullable=True)
 
     order: Mapped["Order"] = relationship(back_populates="invoice", lazy="selectin", uselist=False)
+
+    __table_args__ = (
+        Index(
+            "ix_invoices_issued_id",
+            text("issued_at DESC"),
+            text("id DESC"),
+            postgresql_where=text("issued_at IS NOT NULL")
+        ),
+    )
@@ -3,6 +3,7 @@ from decimal import Decimal
 from pydantic import BaseModel, ConfigDict, Field, model_validator, field_validator, EmailStr, AliasChoices, AliasPath
 from app.domain.booking.models import OrderStatus, InvoiceType, TicketStatus
 from app.core.utils.text_utils import strip_text
+from app.core.utils.fields import omit_none
 from app.domain.payments.schemas import PaymentInOrderDTO
 
 
@@ -18,7 +19,7 @@ class ReserveTicketReadDTO(BaseModel):
 
     order_id: int
     ticket_instance_id: int
-    reserved_until: datetime | None
+    reserved_until: datetime | None = omit_none()
     order_total_price: Decimal
 
 
@@ -27,7 +28,7 @@ class TicketInstanceReadDTO(BaseModel):
 
     id: int
     event_ticket_type_id: int
-    seat_id: int | None
+    seat_id: int | None = omit_none()
     event_id: int
     event_name: str = Field(validation_alias=AliasPath('event', 'name'))
     price_net: Decimal = Field(validation_alias='price_net_snapshot')
@@ -42,12 +43,12 @@ class OrderSummaryDTO(BaseModel):
     id: int
     status: OrderStatus
     total_price: Decimal
-    reserved_until: datetime | None
+    reserved_until: datetime | None = omit_none()
     created_at: datetime
 
 
 class OrderListItemDTO(OrderSummaryDTO):
-    items_count: int | None = None
+    items_count: int | None = omit_none(default=None)
 
 
 class OrderDetailsDTO(OrderSummaryDTO):
@@ -58,15 +59,16 @@ class OrderDetailsDTO(OrderSummaryDTO):
         validation_alias=AliasChoices('ticket_instances', 'items'),
         serialization_alias='items'
     )
-    payment: PaymentInOrderDTO | None = None
+    payment: PaymentInOrderDTO | None = omit_none(default=None)
 
 
 class UserOrdersQueryDTO(BaseModel):
-    model_config = ConfigDict(extra='forbid')
+    model_config = ConfigDict(extra='ignore')
 
     status: OrderStatus | None = None
     page: int = Field(default=1, ge=1)
     page_size: int = Field(default=20, ge=1, le=200)
+    after: str | None = None
 
 
 class AdminOrdersQueryDTO(UserOrdersQueryDTO):
@@ -76,6 +78,16 @@ class AdminOrdersQueryDTO(UserOrdersQueryDTO):
     created_to: datetime | None = None
 
 
+class AdminOrdersExportQueryDTO(BaseModel):
+    model_config = ConfigDict(extra='ignore')
+
+    status: OrderStatus | None = None
+    user_id: int | None = None
+    email: EmailStr | None = None
+    created_from: datetime | None = None
+    created_to: datetime | None = None
+
+
 class AdminOrderListItemDTO(BaseModel):
     model_config = ConfigDict(from_attributes=True, extra='forbid')
 
@@ -142,9 +154,9 @@ class InvoiceListItemDTO(BaseModel):
     model_config = ConfigDict(from_attributes=True, extra='forbid')
 
     id: int
-    invoice_number: str | None
+    invoice_number: str | None = omit_none()
     order_id: int
-    issued_at: datetime | None
+    issued_at: datetime | None = omit_none()
     items_count: int
     total_net: Decimal
     total_vat: Decimal
@@ -160,18 +172,18 @@ class InvoiceReadDTO(BaseModel):
     model_config = ConfigDict(from_attributes=True, extra="forbid")
 
     id: int
-    invoice_number: str | None
+    invoice_number: str | None = omit_none()
     currency_code: str
     invoice_type: InvoiceType
-    full_name: str | None
-    company_name: str | None
-    tax_id: str | None
+    full_name: str | None = omit_none()
+    company_name: str | None = omit_none()
+    tax_id: str | None = omit_none()
     street: str
     postal_code: str
     city: str
     country_code: str
     created_at: datetime
-    issued_at: datetime | None
+    issued_at: datetime | None = omit_none()
 
 
 class InvoiceDetailsDTO(InvoiceReadDTO):
@@ -231,7 +243,7 @@ class TicketHolderPrivateDTO(BaseModel):
 
 
 class UserTicketsQueryDTO(BaseModel):
-    model_config = ConfigDict(extra='forbid')
+    model_config = ConfigDict(extra='ignore')
 
     status: TicketStatus | None = None
     page: int = Field(default=1, ge=1)
@@ -263,18 +275,19 @@ class TicketReadItemDTO(BaseModel):
     venue_name: str
     sector_name: str
     is_ga: bool
-    row: int | None
-    seat: int | None
+    row: int | None = omit_none()
+    seat: int | None = omit_none()
     ticket_type_name: str
     price_gross: Decimal
-    holder: TicketHolderPublicDTO | TicketHolderPrivateDTO | None = None
+    holder: TicketHolderPublicDTO | TicketHolderPrivateDTO | None = omit_none(default=None)
 
 
 class UserInvoicesQueryDTO(BaseModel):
-    model_config = ConfigDict(extra='forbid')
+    model_config = ConfigDict(extra='ignore')
 
     page: int = Field(default=1, ge=1)
     page_size: int = Field(default=20, ge=1, le=200)
+    after: str | None = None
 
 
 class AdminInvoicesQueryDTO(UserInvoicesQueryDTO):
@@ -283,6 +296,14 @@ class AdminInvoicesQueryDTO(UserInvoicesQueryDTO):
     invoice_type: InvoiceType | None = None
 
 
+class AdminInvoicesExportQueryDTO(BaseModel):
+    model_config = ConfigDict(extra='ignore')
+
+    user_id: int | None = None
+    email: EmailStr | None = None
+    invoice_type: InvoiceType | None = None
+
+
 class AdminOrderDetailsDTO(OrderDetailsDTO):
     model_config = ConfigDict(from_attributes=True, extra='forbid')
 
@@ -1,9 +1,17 @@
 from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.engine import Row
 from .models import Event, EventStatus
 from typing import Iterable
 from app.core.pagination import paginate
 
+_LIST_COLUMNS = (
+    Event.id, Event.name, Event.organizer_id, Event.venue_id, Event.status,
+    Event.event_start, Event.event_end, Event.sales_start, Event.sales_end,
+    Event.max_tickets_per_user, Event.age_restriction, Event.holder_data_required,
+    Event.description, Event.created_at, Event.updated_at
+)
+
 
 async def get_event_by_id(db: AsyncSession, event_id: int) -> Event | None:
     stmt = select(Event).where(Event.id == event_id)
@@ -22,8 +30,10 @@ async def list_events(
         name: str | None = None,
         date_from=None,
         date_to=None,
-) -> tuple[list[Event], int]:
-    stmt = select(Event)
+        after: str | None = None
+) -> tuple[list[Row], int | None]:
+    # Plain column rows: no identity map, no mapper-level selectin cascade (sectors, ticket instances, ...).
+    stmt = select(*_LIST_COLUMNS)
     where = []
 
     if statuses is not None:
@@ -45,9 +55,10 @@ async def list_events(
         page=page,
         page_size=page_size,
         where=where,
-        order_by=[Event.event_start.desc(), Event.id],
-        scalars=True,
-        count_by=Event.id
+        order_by=[Event.event_start.desc(), Event.id.desc()],
+        scalars=False,
+        keyset=[Event.event_start, Event.id],
+        after=after
     )
 
     return items, total
@@ -1,5 +1,5 @@
 from sqlalchemy.orm import mapped_column, Mapped, relationship
-from sqlalchemy import Identity, Text, Integer, ForeignKey, CheckConstraint, Boolean, TIMESTAMP, func, Enum
+from sqlalchemy import Identity, Text, Integer, ForeignKey, CheckConstraint, Boolean, TIMESTAMP, func, Enum, Index, text
 from app.core.database import Base
 from datetime import datetime
 import enum
@@ -56,5 +56,6 @@ class Event(Base):
 
     __table_args__ = (
         CheckConstraint("event_end >= event_start", name="chk_event_time_range"),
-        CheckConstraint("sales_end >= sales_start", name="chk_sales_range")
+        CheckConstraint("sales_end >= sales_start", name="chk_sales_range"),
+        Index("ix_events_event_start_id", text("event_start DESC"), text("id DESC")),
     )
@@ -66,7 +66,7 @@ class EventStatusDTO(BaseModel):
 
 
 class PublicEventsQueryDTO(BaseModel):
-    model_config = ConfigDict(extra='forbid')
+    model_config = ConfigDict(extra='ignore')
 
     page: int = Field(default=1, ge=1)
     page_size: int = Field(default=20, ge=1, le=200)
@@ -76,7 +76,7 @@ class PublicEventsQueryDTO(BaseModel):
 
 
 class OrganizerEventsQueryDTO(BaseModel):
-    model_config = ConfigDict(extra='forbid')
+    model_config = ConfigDict(extra='ignore')
 
     page: int = Field(default=1, ge=1)
     page_size: int = Field(default=20, ge=1, le=200)
@@ -85,10 +85,11 @@ class OrganizerEventsQueryDTO(BaseModel):
 
 
 class AdminEventsQueryDTO(BaseModel):
-    model_config = ConfigDict(extra='forbid')
+    model_config = ConfigDict(extra='ignore')
 
     page: int = Field(default=1, ge=1)
     page_size: int = Field(default=20, ge=1, le=200)
+    after: str | None = None
     statuses: list[EventStatus] | None = None
     organizer_id: int | None = None
     venue_id: int | None = None
@@ -17,8 +17,9 @@ async def list_all_organizers(
         *,
         name: str | None = None,
         email: str | None = None,
-        registration_number: str | None = None
-) -> tuple[list[Organizer], int]:
+        registration_number: str | None = None,
+        after: str | None = None
+) -> tuple[list[Organizer], int | None]:
     stmt = select(Organizer)
     where = []
 
@@ -37,7 +38,9 @@ async def list_all_organizers(
         where=where,
         order_by=[Organizer.id],
         scalars=True,
-        count_by=Organizer.id
+        keyset=[Organizer.id],
+        keyset_desc=False,
+        after=after
     )
     return items, total
 
@@ -1,6 +1,7 @@
 from datetime import datetime
 from pydantic import BaseModel, EmailStr, Field, model_validator, ConfigDict
 from phonenumbers import parse, format_number, is_valid_number, PhoneNumberFormat, NumberParseException
+from app.core.utils.fields import omit_none
 
 class OrganizerCreateDTO(BaseModel):
     name: str = Field(min_length=2, max_length=100)
@@ -39,9 +40,9 @@ class OrganizerReadDTO(BaseModel):
     name: str
     email: EmailStr
     phone_number: str
-    vat_number: str | None = None
-    registration_number: str | None = None
-    iban: str | None = None
+    vat_number: str | None = omit_none(default=None)
+    registration_number: str | None = omit_none(default=None)
+    iban: str | None = omit_none(default=None)
     country_code: str
     address_id: int
     created_at: datetime
@@ -52,10 +53,11 @@ class OrganizerPutDTO(OrganizerCreateDTO):
 
 
 class OrganizersQueryDTO(BaseModel):
-    model_config = ConfigDict(extra='forbid')
+    model_config = ConfigDict(extra='ignore')
 
     page: int = Field(default=1, ge=1)
     page_size: int = Field(default=20, ge=1, le=200)
+    after: str | None = None
     name: str | None = None
     email: str | None = None
     registration_number: str | None = None
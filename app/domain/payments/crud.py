@@ -1,16 +1,34 @@
-from sqlalchemy import select
+from sqlalchemy import select, Row
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
+from app.core.pagination import paginate
 from .models import PaymentMethod
 
 
 async def get_payment_method(db: AsyncSession, payment_method_id: int) -> PaymentMethod | None:
-    result = await db.execute(select(PaymentMethod).where(PaymentMethod.id == payment_method_id))
+    result = await db.execute(select(PaymentMethod).options(raiseload("*")).where(PaymentMethod.id == payment_method_id))
     return result.scalars().first()
 
 
-async def list_payment_methods(db: AsyncSession) -> list[PaymentMethod]:
-    result = await db.execute(select(PaymentMethod).order_by(PaymentMethod.id))
-    return result.scalars().all()
+async def list_payment_methods(
+        db: AsyncSession,
+        page: int,
+        page_size: int,
+        *,
+        after: str | None = None
+) -> tuple[list[Row], int | None]:
+    items, total = await paginate(
+        db,
+        select(PaymentMethod.id, PaymentMethod.name, PaymentMethod.is_active),
+        page=page,
+        page_size=page_size,
+        order_by=[PaymentMethod.id],
+        scalars=False,
+        keyset=[PaymentMethod.id],
+        keyset_desc=False,
+        after=after
+    )
+    return items, total
 
 
 async def list_active_payment_methods(db: AsyncSession) -> list[PaymentMethod]:
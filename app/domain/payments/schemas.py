@@ -1,6 +1,7 @@
 from datetime import datetime
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 from app.core.utils.text_utils import strip_text
+from app.core.utils.fields import omit_none
 from decimal import Decimal
 from app.domain.payments.models import PaymentStatus
 
@@ -30,6 +31,14 @@ class PaymentMethodReadDTO(BaseModel):
     is_active: bool
 
 
+class PaymentMethodsQueryDTO(BaseModel):
+    model_config = ConfigDict(extra='ignore')
+
+    page: int = Field(default=1, ge=1)
+    page_size: int = Field(default=20, ge=1, le=200)
+    after: str | None = None
+
+
 class PaymentCreateDTO(BaseModel):
     model_config = ConfigDict(extra='forbid')
 
@@ -46,8 +55,8 @@ class PaymentReadDTO(BaseModel):
     provider: str
     status: PaymentStatus
     created_at: datetime
-    paid_at: datetime | None
-    redirect_url: str | None = None
+    paid_at: datetime | None = omit_none()
+    redirect_url: str | None = omit_none(default=None)
 
 
 class PaymentFinalizeDTO(BaseModel):
@@ -1,19 +1,38 @@
 from app.domain.pricing.models import TicketType, EventTicketType
+from app.domain.allocation.models import EventSector
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, delete
+from sqlalchemy.orm import raiseload
+from sqlalchemy.engine import Row
+from app.core.pagination import paginate
 
 
 async def get_ticket_type(db: AsyncSession, ticket_type_id: int) -> TicketType | None:
-    stmt = select(TicketType).where(TicketType.id == ticket_type_id)
+    stmt = select(TicketType).options(raiseload("*")).where(TicketType.id == ticket_type_id)
     result = await db.execute(stmt)
     return result.scalars().first()
 
 
-async def list_ticket_types(db: AsyncSession) -> list[TicketType]:
-    stmt = select(TicketType)
-    result = await db.execute(stmt)
-    return result.scalars().all()
+async def list_ticket_types(
+        db: AsyncSession,
+        page: int,
+        page_size: int,
+        *,
+        after: str | None = None
+) -> tuple[list[Row], int | None]:
+    items, total = await paginate(
+        db,
+        select(TicketType.id, TicketType.name),
+        page=page,
+        page_size=page_size,
+        order_by=[TicketType.id],
+        scalars=False,
+        keyset=[TicketType.id],
+        keyset_desc=False,
+        after=after
+    )
+    return items, total
 
 
 async def create_ticket_type(db: AsyncSession, data: dict) -> TicketType:
@@ -22,8 +41,9 @@ async def create_ticket_type(db: AsyncSession, data: dict) -> TicketType:
     return ticket_type
 
 
-async def delete_ticket_type(db: AsyncSession, ticket_type: TicketType) -> None:
-    await db.delete(ticket_type)
+async def delete_ticket_type(db: AsyncSession, ticket_type_id: int) -> int | None:
+    stmt = delete(TicketType).where(TicketType.id == ticket_type_id).returning(TicketType.id)
+    return await db.scalar(stmt)
 
 
 async def get_event_ticket_type(db: AsyncSession, event_ticket_type_id: int) -> EventTicketType | None:
@@ -32,10 +52,22 @@ async def get_event_ticket_type(db: AsyncSession, event_ticket_type_id: int) ->
     return result.scalars().first()
 
 
-async def list_event_ticket_types_by_sector(db: AsyncSession, event_sector_id: int) -> list[EventTicketType]:
-    stmt = select(EventTicketType).where(EventTicketType.event_sector_id == event_sector_id)
+async def list_event_ticket_types_by_event_sector(db: AsyncSession, event_id: int, sector_id: int) -> list[Row]:
+    # Outer join so an existing sector without ticket types still yields one all-NULL row.
+    stmt = (
+        select(
+            EventTicketType.id,
+            EventTicketType.event_sector_id,
+            EventTicketType.ticket_type_id,
+            EventTicketType.price_net,
+            EventTicketType.vat_rate
+        )
+        .select_from(EventSector)
+        .outerjoin(EventTicketType, EventTicketType.event_sector_id == EventSector.id)
+        .where(EventSector.event_id == event_id, EventSector.sector_id == sector_id)
+    )
     result = await db.execute(stmt)
-    return result.scalars().all()
+    return result.all()
 
 
 async def create_event_ticket_type(db: AsyncSession, data: dict) -> EventTicketType:
@@ -15,6 +15,14 @@ class TicketTypeReadDTO(BaseModel):
     name: str
 
 
+class TicketTypesQueryDTO(BaseModel):
+    model_config = ConfigDict(extra='ignore')
+
+    page: int = Field(default=1, ge=1)
+    page_size: int = Field(default=20, ge=1, le=200)
+    after: str | None = None
+
+
 class EventTicketTypeCreateDTO(BaseModel):
     model_config = ConfigDict(extra='forbid')
 
@@ -66,7 +66,6 @@ async def list_all_users(
         page_size=page_size,
         where=where,
         order_by=[User.created_at.desc(), User.id],
-        scalars=True,
-        count_by=User.id,
+        scalars=True
     )
     return items, total
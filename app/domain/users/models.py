@@ -1,3 +1,4 @@
+from functools import cached_property
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy import Identity, Text, text, Date, TIMESTAMP
 from app.core.database import Base
@@ -51,3 +52,13 @@ class User(Base):
     )
 
     orders: Mapped[list["Order"]] = relationship(back_populates="user", lazy='selectin')
+
+    # Read by several authorization checks per request; computed once per loaded instance. Code that reassigns
+    # roles or organizers on an instance must not read these afterwards.
+    @cached_property
+    def role_names(self) -> frozenset[str]:
+        return frozenset(r.name for r in self.roles)
+
+    @cached_property
+    def organizer_ids(self) -> frozenset[int]:
+        return frozenset(o.id for o in self.organizers)
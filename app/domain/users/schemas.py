@@ -1,5 +1,6 @@
 from pydantic import BaseModel, EmailStr, Field, field_validator, ConfigDict, SecretStr, model_validator, computed_field
 from datetime import date, datetime
+from app.core.utils.fields import omit_none
 from app.core.utils.validators import check_password_strength, normalize_phone_or_none, ensure_passwords_match
 
 
@@ -38,8 +39,8 @@ class UserReadDTO(BaseModel):
     email: EmailStr
     first_name: str
     last_name: str
-    phone_number: str | None
-    birth_date: date | None
+    phone_number: str | None = omit_none()
+    birth_date: date | None = omit_none()
 
 
 class RoleReadDTO(BaseModel):
@@ -67,7 +68,7 @@ class AdminUserListItemDTO(BaseModel):
 
 
 class AdminUsersQueryDTO(BaseModel):
-    model_config = ConfigDict(extra='forbid')
+    model_config = ConfigDict(extra='ignore')
 
     page: int = Field(default=1, ge=1)
     page_size: int = Field(default=20, ge=1, le=200)
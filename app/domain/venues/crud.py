@@ -1,12 +1,20 @@
-from sqlalchemy import select
+from sqlalchemy import select, delete, update, Row
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import raiseload
 from app.core.pagination import paginate
-from app.domain import Venue, Sector, Seat
+from app.domain import Venue, Sector, Seat, TicketInstance
+
+# Read-model columns only: hydrating entities would trigger the selectin cascade (sectors -> seats -> tickets).
+_VENUE_LIST_COLUMNS = (Venue.id, Venue.name, Venue.address_id)
+_SECTOR_LIST_COLUMNS = (
+    Sector.id, Sector.venue_id, Sector.name, Sector.base_capacity, Sector.is_ga, Sector.created_at, Sector.updated_at
+)
+_SEAT_LIST_COLUMNS = (Seat.id, Seat.sector_id, Seat.row, Seat.number)
 
 
 async def get_venue_by_id(db: AsyncSession, venue_id: int) -> Venue | None:
-    stmt = select(Venue).where(Venue.id == venue_id)
+    stmt = select(Venue).options(raiseload("*")).where(Venue.id == venue_id)
     result = await db.execute(stmt)
     return result.scalars().first()
 
@@ -17,8 +25,8 @@ async def list_all_venues(
         page_size: int,
         *,
         name: str | None = None
-) -> tuple[list[Venue], int]:
-    stmt = select(Venue)
+) -> tuple[list[Row], int]:
+    stmt = select(*_VENUE_LIST_COLUMNS)
     where = []
 
     if name:
@@ -31,8 +39,7 @@ async def list_all_venues(
         page_size=page_size,
         where=where,
         order_by=[Venue.id],
-        scalars=True,
-        count_by=Venue.id
+        scalars=False
     )
     return items, total
 
@@ -50,17 +57,23 @@ async def update_venue(venue: Venue, data: dict) -> Venue:
 
 
 async def get_sector_by_id(db: AsyncSession, sector_id: int) -> Sector | None:
-    stmt = select(Sector).where(Sector.id == sector_id)
+    stmt = select(Sector).options(raiseload("*")).where(Sector.id == sector_id)
     result = await db.execute(stmt)
     return result.scalars().first()
 
 
-async def list_sectors_by_venue(db: AsyncSession, venue_id: int) -> list[Sector]:
-    stmt = select(Sector).where(Sector.venue_id == venue_id)
+async def list_sectors_by_ids(db: AsyncSession, sector_ids: list[int]) -> list[Sector]:
+    stmt = select(Sector).options(raiseload("*")).where(Sector.id.in_(sector_ids))
     result = await db.execute(stmt)
     return result.scalars().all()
 
 
+async def list_sectors_by_venue(db: AsyncSession, venue_id: int) -> list[Row]:
+    stmt = select(*_SECTOR_LIST_COLUMNS).where(Sector.venue_id == venue_id)
+    result = await db.execute(stmt)
+    return result.all()
+
+
 async def create_sector(db: AsyncSession, data: dict) -> Sector:
     sector = Sector(**data)
     db.add(sector)
@@ -74,15 +87,33 @@ async def update_sector(sector: Sector, data: dict) -> Sector:
 
 
 async def get_seat_by_id(db: AsyncSession, seat_id: int) -> Seat | None:
-    stmt = select(Seat).where(Seat.id == seat_id)
+    stmt = select(Seat).options(raiseload("*")).where(Seat.id == seat_id)
     result = await db.execute(stmt)
     return result.scalars().first()
 
 
-async def list_seats_by_sector(db: AsyncSession, sector_id: int) -> list[Seat]:
-    stmt = select(Seat).where(Seat.sector_id == sector_id)
-    result = await db.execute(stmt)
-    return result.scalars().all()
+async def list_seats_by_sector(
+        db: AsyncSession,
+        sector_id: int,
+        page: int,
+        page_size: int,
+        *,
+        after: str | None = None
+) -> tuple[list[Row], int | None]:
+    order = [Seat.row, Seat.number, Seat.id]
+    items, total = await paginate(
+        db,
+        select(*_SEAT_LIST_COLUMNS),
+        page=page,
+        page_size=page_size,
+        where=[Seat.sector_id == sector_id],
+        order_by=order,
+        scalars=False,
+        keyset=order,
+        keyset_desc=False,
+        after=after
+    )
+    return items, total
 
 
 async def create_seat(db: AsyncSession, data: dict) -> Seat:
@@ -91,9 +122,13 @@ async def create_seat(db: AsyncSession, data: dict) -> Seat:
     return seat
 
 
+_INSERT_SEAT_IGNORE = insert(Seat).on_conflict_do_nothing()
+
+
+# Parameter-list form: ORM bulk insert reuses one cached statement and batches rows via insertmanyvalues,
+# instead of compiling a fresh multi-row VALUES clause for every payload size.
 async def bulk_add_seats(db: AsyncSession, sector_id: int, data: list[dict]) -> None:
-    stmt = insert(Seat).values([{"sector_id": sector_id, **d} for d in data]).on_conflict_do_nothing()
-    await db.execute(stmt)
+    await db.execute(_INSERT_SEAT_IGNORE, [{"sector_id": sector_id, **d} for d in data])
 
 
 async def update_seat(seat: Seat, data: dict) -> Seat:
@@ -102,5 +137,8 @@ async def update_seat(seat: Seat, data: dict) -> Seat:
     return seat
 
 
-async def delete_seat(db: AsyncSession, seat: Seat) -> None:
-    await db.delete(seat)
+async def delete_seat(db: AsyncSession, seat_id: int) -> int | None:
+    # Same outcome as the ORM delete: tickets issued for the seat are kept, only detached from it.
+    await db.execute(update(TicketInstance).where(TicketInstance.seat_id == seat_id).values(seat_id=None))
+    stmt = delete(Seat).where(Seat.id == seat_id).returning(Seat.id)
+    return await db.scalar(stmt)
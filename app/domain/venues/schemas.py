@@ -29,7 +29,7 @@ class VenueUpdateDTO(BaseModel):
 
 
 class VenuesQueryDTO(BaseModel):
-    model_config = ConfigDict(extra='forbid')
+    model_config = ConfigDict(extra='ignore')
 
     page: int = Field(default=1, ge=1)
     page_size: int = Field(default=20, ge=1, le=200)
@@ -88,6 +88,14 @@ class SeatReadDTO(BaseModel):
     number: int
 
 
+class SeatsQueryDTO(BaseModel):
+    model_config = ConfigDict(extra='ignore')
+
+    page: int = Field(default=1, ge=1)
+    page_size: int = Field(default=20, ge=1, le=200)
+    after: str | None = None
+
+
 class SeatUpdateDTO(BaseModel):
     model_config = ConfigDict(extra='forbid')
 
@@ -1,27 +1,44 @@
+import asyncio
+import contextlib
 from fastapi import FastAPI
+from starlette.middleware.gzip import GZipMiddleware
 
 from app.api.exceptions import register_error_handler
 from app.api.v1.routes import (auth, addresses, organizers, venues, sectors, events, seats, ticket_types,
                                event_ticket_types, booking, cart, payment_methods, payments, orders, invoices,
                                tickets, users, admin_maintenance)
+from app.core.auditing import drain_audit_queue, flush_audit_queue
+from app.core.config import AUDIT_QUEUE_MAX
 from app.core.middleware.http_ctx import HttpContextMiddleware
 from app.core.middleware.request_id import RequestIdMiddleware
+from app.core.database import warm_pool
 from app.core.redis import create_redis
 
 
 async def lifespan(app: FastAPI):
     r = await create_redis()
     app.state.redis = r
+    app.state.audit_queue = asyncio.Queue(maxsize=AUDIT_QUEUE_MAX)
+    drainer = asyncio.create_task(drain_audit_queue(r, app.state.audit_queue))
+    await warm_pool()
     try:
         yield
     finally:
+        drainer.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await drainer
+        await flush_audit_queue(r, app.state.audit_queue)
         await r.aclose()
 
 
+# Keep the default response class: with a response_model FastAPI serializes straight to JSON bytes via Pydantic.
+# Setting default_response_class (e.g. ORJSONResponse, now deprecated) would route every body through
+# jsonable_encoder again and disable that fast path.
 app = FastAPI(lifespan=lifespan)
 
 app.add_middleware(RequestIdMiddleware, header_name="X-Request-ID")
 app.add_middleware(HttpContextMiddleware)
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
 
 register_error_handler(app)
 
@@ -43,4 +60,3 @@ app.include_router(invoices.router)
 app.include_router(tickets.router)
 app.include_router(users.router)
 # app.include_router(admin_maintenance.router)
-app.include_router(users.router)
\ No newline at end of file
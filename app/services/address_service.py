@@ -1,6 +1,7 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.auditing import AuditSpan
 from app.core.pagination import PageDTO
+from app.core.utils.dto import from_orm
 from app.domain.addresses import crud
 from app.domain.addresses.models import Address
 from app.domain.addresses.schemas import AddressCreateDTO, AddressPutDTO, AddressesQueryDTO, AddressReadDTO
@@ -16,7 +17,7 @@ async def get_address(db: AsyncSession, address_id: int) -> Address:
 
 async def list_addresses(db: AsyncSession, query: AddressesQueryDTO) -> PageDTO[AddressReadDTO]:
     addresses, total = await crud.list_all_addresses(db, query.page, query.page_size)
-    items = [AddressReadDTO.model_validate(address) for address in addresses]
+    items = [from_orm(AddressReadDTO, address) for address in addresses]
     return PageDTO[AddressReadDTO](
         items=items,
         total=total,
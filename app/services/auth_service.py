@@ -67,7 +67,7 @@ async def login_user(
         token_hash = hash_refresh_token(raw_refresh_token, REFRESH_TOKEN_PEPPER)
         expires_at = new_expiry(REFRESH_TOKEN_TTL_DAYS)
         session = await create_session(db, user.id, token_hash, expires_at, ip, user_agent)
-        access = create_access_token(subject=user.id, sid=str(session.id))
+        access = create_access_token(subject=user.id, sid=str(session.id), roles=[r.name for r in user.roles])
 
         span.object_id = session.id
         span.meta.update({"sid": str(session.id)})
@@ -113,7 +113,8 @@ async def refresh_tokens(db: AsyncSession, raw_refresh_token: str) -> LoginRespo
             else:
                 await touch_session(db, session=session)
 
-        access = create_access_token(subject=session.user.id, sid=str(session.id))
+        user = session.user
+        access = create_access_token(subject=user.id, sid=str(session.id), roles=[r.name for r in user.roles])
 
         span.object_id = session.id
         span.meta.update({"rotated": rotated, "sliding": slid})
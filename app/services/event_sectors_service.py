@@ -4,7 +4,7 @@ from app.domain.allocation.models import EventSector
 from app.domain.events.models import Event
 from app.domain.allocation import crud
 from app.domain.allocation.schemas import EventSectorCreateDTO, EventSectorBulkCreateDTO
-from app.services.venue_service import get_sector
+from app.services.venue_service import get_sector, get_sectors
 from app.core.auditing import AuditSpan
 from app.domain.exceptions import InvalidInput, NotFound, Conflict
 
@@ -79,9 +79,10 @@ async def bulk_create_event_sectors(
             event_id=event.id,
             meta={"sector_ids": sector_ids, "count": len(sector_ids)}
     ):
+        sectors = await get_sectors(db, sector_ids)
         data = []
         for sec in schema.sectors:
-            sector = await get_sector(db, sec.sector_id)
+            sector = sectors[sec.sector_id]
             _ensure_venue_match(event, sector)
 
             d = sec.model_dump(exclude_none=True)
@@ -100,10 +101,10 @@ async def delete_event_sector(db: AsyncSession, event_id: int, sector_id: int) -
             event_id=event_id,
             meta={"sector_id": sector_id}
     ) as span:
-        event_sector = await get_event_sector(db, event_id, sector_id)
-        span.object_id = event_sector.id
-        await crud.delete_event_sector(db, event_sector)
         try:
-            await db.flush()
+            event_sector_id = await crud.delete_event_sector(db, event_id, sector_id)
         except IntegrityError:
             raise Conflict("Event sector in use", ctx={"event_id": event_id, "sector_id": sector_id})
+        if event_sector_id is None:
+            raise NotFound("Event sector not found", ctx={"event_id": event_id, "sector_id": sector_id})
+        span.object_id = event_sector_id
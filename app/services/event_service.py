@@ -4,8 +4,11 @@ from app.domain.events.models import Event, EventStatus
 from app.domain.events.schemas import EventCreateDTO, EventUpdateDTO, EventReadDTO, PublicEventsQueryDTO, \
     OrganizerEventsQueryDTO, AdminEventsQueryDTO
 from app.domain.users.models import User
-from app.core.pagination import PageDTO
+from app.core.pagination import PageDTO, next_cursor
 from app.core.auditing import AuditSpan
+from app.core.cache import invalidate, PUBLIC_EVENTS_CACHE
+from app.core.coalesce import InFlight
+from app.core.utils.dto import from_orm
 from app.services.venue_service import get_venue
 from app.domain.events import crud
 from datetime import datetime, timezone
@@ -20,14 +23,6 @@ ALLOWED_TRANSITIONS = {
 }
 
 
-def _get_roles(user: User) -> set[str]:
-    return {role.name for role in user.roles}
-
-
-def _get_organizer_ids(user: User) -> set[int]:
-    return {org.id for org in user.organizers}
-
-
 def _validate_event_times_on_create(data: dict) -> None:
     es = data["event_start"]
     ee = data["event_end"]
@@ -76,23 +71,40 @@ def _validate_event_times_on_update(data: dict, ev: Event) -> None:
         )
 
 
+_event_reads: InFlight[int, EventReadDTO] = InFlight()
+
+
+def _is_visible_to(event: Event | EventReadDTO, user: User) -> bool:
+    roles = user.role_names
+
+    if "ADMIN" in roles:
+        return True
+
+    if "ORGANIZER" in roles and event.organizer_id in user.organizer_ids:
+        return True
+
+    return event.status in PUBLIC_STATUSES
+
+
 async def get_event(db: AsyncSession, event_id: int, user: User) -> Event:
     event = await crud.get_event_by_id(db, event_id)
-    if not event:
+    if not event or not _is_visible_to(event, user):
         raise NotFound("Event not found", ctx={"event_id": event_id})
+    return event
 
-    roles = _get_roles(user)
-
-    if "ADMIN" in roles:
-        return event
 
-    if "ORGANIZER" in roles and event.organizer_id in _get_organizer_ids(user):
-        return event
+async def _load_event_read(db: AsyncSession, event_id: int) -> EventReadDTO:
+    event = await crud.get_event_by_id(db, event_id)
+    if not event:
+        raise NotFound("Event not found", ctx={"event_id": event_id})
+    return from_orm(EventReadDTO, event)
 
-    if event.status in PUBLIC_STATUSES:
-        return event
 
-    raise NotFound("Event not found", ctx={"event_id": event_id})
+async def get_event_read(db: AsyncSession, event_id: int, user: User) -> EventReadDTO:
+    event = await _event_reads.run(event_id, lambda: _load_event_read(db, event_id))
+    if not _is_visible_to(event, user):
+        raise NotFound("Event not found", ctx={"event_id": event_id})
+    return event
 
 
 async def list_public_events(db: AsyncSession, query: PublicEventsQueryDTO) -> PageDTO[EventReadDTO]:
@@ -106,7 +118,7 @@ async def list_public_events(db: AsyncSession, query: PublicEventsQueryDTO) -> P
         date_to=query.date_to
     )
 
-    items = [EventReadDTO.model_validate(event) for event in events]
+    items = [from_orm(EventReadDTO, event) for event in events]
 
     return PageDTO(
         items=items,
@@ -121,7 +133,7 @@ async def list_events_for_organizer(
         user: User,
         query: OrganizerEventsQueryDTO
 ) -> PageDTO[EventReadDTO]:
-    if "ORGANIZER" not in _get_roles(user):
+    if "ORGANIZER" not in user.role_names:
         raise Forbidden("Not allowed")
 
     statuses = [query.status] if query.status is not None else None
@@ -131,11 +143,11 @@ async def list_events_for_organizer(
         page=query.page,
         page_size=query.page_size,
         statuses=statuses,
-        organizer_ids=_get_organizer_ids(user),
+        organizer_ids=user.organizer_ids,
         name=query.name
     )
 
-    items = [EventReadDTO.model_validate(event) for event in events]
+    items = [from_orm(EventReadDTO, event) for event in events]
 
     return PageDTO(
         items=items,
@@ -158,11 +170,18 @@ async def list_events_for_admin(db: AsyncSession, query: AdminEventsQueryDTO) ->
         name=query.name,
         date_from=query.date_from,
         date_to=query.date_to,
+        after=query.after
     )
 
-    items = [EventReadDTO.model_validate(e) for e in events]
+    items = [from_orm(EventReadDTO, e) for e in events]
 
-    return PageDTO(items=items, total=total, page=query.page, page_size=query.page_size)
+    return PageDTO(
+        items=items,
+        total=total,
+        page=query.page,
+        page_size=query.page_size,
+        next_cursor=next_cursor(items, query.page_size, lambda e: (e.event_start, e.id))
+    )
 
 
 async def create_event(
@@ -193,6 +212,7 @@ async def create_event(
 
         span.object_id = event.id
         span.event_id = event.id
+        await invalidate(PUBLIC_EVENTS_CACHE)
         return event
 
 
@@ -216,6 +236,7 @@ async def update_event(db: AsyncSession, schema: EventUpdateDTO, event: Event) -
         except IntegrityError as e:
             raise Conflict("Event time conflict", ctx={"event_id": event.id}) from e
         span.object_id = event.id
+        await invalidate(PUBLIC_EVENTS_CACHE)
         return event
 
 
@@ -256,4 +277,5 @@ async def update_event_status(
             raise Conflict("Statuses conflict", ctx={"event_id": event.id, "to": new_status.name}) from e
 
         span.meta.update({"from": current.name, "to": new_status.name})
+        await invalidate(PUBLIC_EVENTS_CACHE)
         return event
@@ -3,10 +3,11 @@ from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.domain.pricing import crud
 from app.domain.pricing.schemas import EventTicketTypeCreateDTO, EventTicketTypeUpdateDTO, \
-    EventTicketTypeBulkCreateDTO
+    EventTicketTypeBulkCreateDTO, EventTicketTypeReadDTO
 from app.domain.pricing.models import EventTicketType
 from app.domain.allocation.models import EventSector
 from app.core.auditing import AuditSpan
+from app.core.utils.dto import from_orm
 from app.domain.exceptions import NotFound, Conflict
 
 
@@ -21,8 +22,15 @@ async def get_event_ticket_type(db: AsyncSession, event_ticket_type_id: int) ->
     return event_ticket_type
 
 
-async def list_event_sector_ticket_types(db: AsyncSession, event_sector_id: int) -> list[EventTicketType]:
-    return await crud.list_event_ticket_types_by_sector(db, event_sector_id)
+async def list_ticket_types_by_event_sector_keys(
+        db: AsyncSession,
+        event_id: int,
+        sector_id: int
+) -> list[EventTicketTypeReadDTO]:
+    rows = await crud.list_event_ticket_types_by_event_sector(db, event_id, sector_id)
+    if not rows:
+        raise NotFound("Event sector not found", ctx={"event_id": event_id, "sector_id": sector_id})
+    return [from_orm(EventTicketTypeReadDTO, row) for row in rows if row.id is not None]
 
 
 async def create_event_ticket_type(
@@ -1,14 +1,15 @@
 from datetime import datetime
 from zoneinfo import ZoneInfo
 from decimal import Decimal
+from typing import AsyncIterator
 from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.dialects.postgresql import insert
-from app.core.pagination import PageDTO, paginate
+from app.core.pagination import PageDTO, paginate, next_cursor, stream_batches
 from app.domain.booking.counters import invoice_counters
 from app.domain.booking.models import Invoice, Order, TicketInstance
 from app.domain.booking.schemas import UserInvoicesQueryDTO, InvoiceListItemDTO, InvoiceDetailsDTO, InvoiceLineDTO, \
-    AdminInvoicesQueryDTO, AdminInvoiceListItemDTO
+    AdminInvoicesQueryDTO, AdminInvoiceListItemDTO, AdminInvoicesExportQueryDTO
 from app.domain.users.models import User
 from app.domain.events.models import Event
 from app.domain.exceptions import NotFound
@@ -219,9 +220,11 @@ async def list_user_invoices(
         page=query.page,
         page_size=query.page_size,
         where=where,
-        order_by=[Invoice.issued_at.desc().nulls_last(), Invoice.id],
+        order_by=[Invoice.issued_at.desc(), Invoice.id.desc()],
         scalars=False,
-        count_by=Invoice.id
+        count_by=Invoice.id,
+        keyset=[Invoice.issued_at, Invoice.id],
+        after=query.after
     )
 
     items = [_map_user_invoice_row(r) for r in rows]
@@ -229,7 +232,8 @@ async def list_user_invoices(
         items=items,
         total=total,
         page=query.page,
-        page_size=query.page_size
+        page_size=query.page_size,
+        next_cursor=next_cursor(items, query.page_size, lambda i: (i.issued_at, i.id))
     )
 
 
@@ -238,7 +242,7 @@ async def get_user_invoice_details(db: AsyncSession, user: User, invoice_id: int
     return await _build_invoice_details(db, invoice, order_id)
 
 
-async def list_admin_invoices(db: AsyncSession, query: AdminInvoicesQueryDTO) -> PageDTO[AdminInvoiceListItemDTO]:
+def _admin_invoices_where(query: AdminInvoicesQueryDTO | AdminInvoicesExportQueryDTO) -> list:
     where = [Invoice.issued_at.is_not(None)]
     if query.user_id is not None:
         where.append(Order.user_id == query.user_id)
@@ -246,16 +250,21 @@ async def list_admin_invoices(db: AsyncSession, query: AdminInvoicesQueryDTO) ->
         where.append(func.lower(User.email) == func.lower(query.email))
     if query.invoice_type is not None:
         where.append(Invoice.invoice_type == query.invoice_type)
+    return where
+
 
+async def list_admin_invoices(db: AsyncSession, query: AdminInvoicesQueryDTO) -> PageDTO[AdminInvoiceListItemDTO]:
     rows, total = await paginate(
         db,
         _invoice_base_select(admin=True),
         page=query.page,
         page_size=query.page_size,
-        where=where,
-        order_by=[Invoice.issued_at.desc().nulls_last(), Invoice.id],
+        where=_admin_invoices_where(query),
+        order_by=[Invoice.issued_at.desc(), Invoice.id.desc()],
         scalars=False,
-        count_by=Invoice.id
+        count_by=Invoice.id,
+        keyset=[Invoice.issued_at, Invoice.id],
+        after=query.after
     )
 
     items = [_map_admin_invoice_row(r) for r in rows]
@@ -263,8 +272,21 @@ async def list_admin_invoices(db: AsyncSession, query: AdminInvoicesQueryDTO) ->
         items=items,
         total=total,
         page=query.page,
-        page_size=query.page_size
+        page_size=query.page_size,
+        next_cursor=next_cursor(items, query.page_size, lambda i: (i.issued_at, i.id))
+    )
+
+
+def stream_admin_invoices(
+        db: AsyncSession,
+        query: AdminInvoicesExportQueryDTO
+) -> AsyncIterator[list[AdminInvoiceListItemDTO]]:
+    stmt = (
+        _invoice_base_select(admin=True)
+        .where(*_admin_invoices_where(query))
+        .order_by(Invoice.issued_at.desc(), Invoice.id.desc())
     )
+    return stream_batches(db, stmt, _map_admin_invoice_row)
 
 
 async def get_invoice_details_admin(
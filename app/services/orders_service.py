@@ -1,24 +1,18 @@
 from sqlalchemy import select, func, desc
+from typing import AsyncIterator
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.core.pagination import PageDTO, paginate
+from app.core.pagination import PageDTO, paginate, next_cursor, stream_batches
+from app.core.utils.dto import from_orm
 from app.domain.users.models import User
 from app.domain.booking.models import Order, TicketInstance
 from app.domain.payments.models import Payment, PaymentStatus
 from app.domain.booking.schemas import UserOrdersQueryDTO, OrderListItemDTO, OrderDetailsDTO, \
-    AdminOrdersQueryDTO, AdminOrderListItemDTO, AdminOrderDetailsDTO
+    AdminOrdersQueryDTO, AdminOrderListItemDTO, AdminOrderDetailsDTO, AdminOrdersExportQueryDTO
 from app.domain.payments.schemas import PaymentInOrderDTO, PaymentMethodReadDTO
 from app.domain.exceptions import NotFound
 
 
-def _to_order_list_item(order: Order, items_count: int | None) -> OrderListItemDTO:
-    return OrderListItemDTO(
-        id=order.id,
-        status=order.status,
-        total_price=order.total_price,
-        reserved_until=order.reserved_until,
-        created_at=order.created_at,
-        items_count=items_count
-    )
+_ORDER_LIST_COLUMNS = (Order.id, Order.status, Order.total_price, Order.reserved_until, Order.created_at)
 
 
 def _to_payment_in_order(payment: Payment) -> PaymentInOrderDTO:
@@ -70,22 +64,25 @@ async def list_user_orders(
 
     items_rows, total = await paginate(
         db,
-        select(Order, ti_count.label("items_count")),
+        select(*_ORDER_LIST_COLUMNS, ti_count.label("items_count")),
         page=query.page,
         page_size=query.page_size,
         where=where,
-        order_by=[desc(Order.created_at), Order.id],
+        order_by=[desc(Order.created_at), desc(Order.id)],
         scalars=False,
-        count_by=Order.id
+        count_by=Order.id,
+        keyset=[Order.created_at, Order.id],
+        after=query.after
     )
 
-    items = [_to_order_list_item(order, int(items_count or 0)) for order, items_count in items_rows]
+    items = [from_orm(OrderListItemDTO, row) for row in items_rows]
 
     return PageDTO[OrderListItemDTO](
         items=items,
         total=total,
         page=query.page,
-        page_size=query.page_size
+        page_size=query.page_size,
+        next_cursor=next_cursor(items, query.page_size, lambda o: (o.created_at, o.id))
     )
 
 
@@ -106,7 +103,7 @@ async def get_user_order(db: AsyncSession, user: User, order_id: int) -> OrderDe
     return _to_order_details(order, payment_dto)
 
 
-async def list_orders_admin(db: AsyncSession, query: AdminOrdersQueryDTO) -> PageDTO[AdminOrderListItemDTO]:
+def _admin_orders_where(query: AdminOrdersQueryDTO | AdminOrdersExportQueryDTO) -> list:
     where = []
     if query.status is not None:
         where.append(Order.status == query.status)
@@ -118,41 +115,52 @@ async def list_orders_admin(db: AsyncSession, query: AdminOrdersQueryDTO) -> Pag
         where.append(Order.user_id == query.user_id)
     if query.email is not None:
         where.append(Order.user.has(func.lower(User.email) == func.lower(query.email)))
+    return where
 
+
+def _admin_orders_select():
     ti_count = _ticket_instance_count_subquery()
+    return (
+        select(*_ORDER_LIST_COLUMNS, ti_count.label("items_count"), Order.user_id, User.email.label("user_email"))
+        .join(User)
+    )
+
 
+async def list_orders_admin(db: AsyncSession, query: AdminOrdersQueryDTO) -> PageDTO[AdminOrderListItemDTO]:
     rows, total = await paginate(
         db,
-        select(Order, ti_count.label("items_count"), User.id.label("user_id"), User.email.label("user_email")).join(User),
+        _admin_orders_select(),
         page=query.page,
         page_size=query.page_size,
-        where=where,
-        order_by=[desc(Order.created_at), Order.id],
+        where=_admin_orders_where(query),
+        order_by=[desc(Order.created_at), desc(Order.id)],
         scalars=False,
-        count_by=Order.id
+        count_by=Order.id,
+        keyset=[Order.created_at, Order.id],
+        after=query.after
     )
 
-    items = []
-    for order, items_count, user_id, user_email in rows:
-        items.append(
-            AdminOrderListItemDTO(
-                id=order.id,
-                status=order.status,
-                total_price=order.total_price,
-                reserved_until=order.reserved_until,
-                created_at=order.created_at,
-                items_count=int(items_count or 0),
-                user_id=user_id,
-                user_email=user_email
-            )
-        )
+    items = [from_orm(AdminOrderListItemDTO, row) for row in rows]
 
     return PageDTO[AdminOrderListItemDTO](
         items=items,
         total=int(total or 0),
         page=query.page,
-        page_size=query.page_size
+        page_size=query.page_size,
+        next_cursor=next_cursor(items, query.page_size, lambda o: (o.created_at, o.id))
+    )
+
+
+def stream_orders_admin(
+        db: AsyncSession,
+        query: AdminOrdersExportQueryDTO
+) -> AsyncIterator[list[AdminOrderListItemDTO]]:
+    stmt = (
+        _admin_orders_select()
+        .where(*_admin_orders_where(query))
+        .order_by(desc(Order.created_at), desc(Order.id))
     )
+    return stream_batches(db, stmt, lambda row: from_orm(AdminOrderListItemDTO, row))
 
 
 async def get_order_admin(db: AsyncSession, order_id: int) -> AdminOrderDetailsDTO:
@@ -1,10 +1,13 @@
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.core.pagination import PageDTO
+from app.core.pagination import PageDTO, next_cursor
 from app.domain.organizers.models import Organizer
 from app.domain.organizers import crud
 from app.domain.organizers.schemas import OrganizerCreateDTO, OrganizerPutDTO, OrganizerReadDTO, OrganizersQueryDTO
 from app.core.auditing import AuditSpan
+from app.core.cache import invalidate, ORGANIZERS_CACHE
+from app.core.coalesce import InFlight
+from app.core.utils.dto import from_orm
 from app.domain.exceptions import NotFound, Conflict
 
 
@@ -15,6 +18,17 @@ async def get_organizer(db: AsyncSession, organizer_id: int) -> Organizer:
     return organizer
 
 
+_organizer_reads: InFlight[int, OrganizerReadDTO] = InFlight()
+
+
+async def _load_organizer_read(db: AsyncSession, organizer_id: int) -> OrganizerReadDTO:
+    return from_orm(OrganizerReadDTO, await get_organizer(db, organizer_id))
+
+
+async def get_organizer_read(db: AsyncSession, organizer_id: int) -> OrganizerReadDTO:
+    return await _organizer_reads.run(organizer_id, lambda: _load_organizer_read(db, organizer_id))
+
+
 async def list_organizers(db: AsyncSession, query: OrganizersQueryDTO) -> PageDTO[OrganizerReadDTO]:
     organizers, total = await crud.list_all_organizers(
         db,
@@ -22,16 +36,18 @@ async def list_organizers(db: AsyncSession, query: OrganizersQueryDTO) -> PageDT
         query.page_size,
         name=query.name,
         email=query.email,
-        registration_number=query.registration_number
+        registration_number=query.registration_number,
+        after=query.after
     )
 
-    items = [OrganizerReadDTO.model_validate(organizer) for organizer in organizers]
+    items = [from_orm(OrganizerReadDTO, organizer) for organizer in organizers]
 
     return PageDTO(
         items=items,
         total=total,
         page=query.page,
-        page_size=query.page_size
+        page_size=query.page_size,
+        next_cursor=next_cursor(items, query.page_size, lambda o: (o.id,))
     )
 
 
@@ -50,6 +66,7 @@ async def create_organizer(db: AsyncSession, schema: OrganizerCreateDTO) -> Orga
         except IntegrityError as e:
             raise Conflict("Organizer already exists", ctx={"fields": fields}) from e
         span.object_id = organizer.id
+        await invalidate(ORGANIZERS_CACHE)
         return organizer
 
 
@@ -73,6 +90,7 @@ async def update_organizer(
             await db.flush()
         except IntegrityError as e:
             raise Conflict("Organizer update violates unique constraint", ctx={"fields": fields}) from e
+        await invalidate(ORGANIZERS_CACHE)
         return organizer
 
 
@@ -89,3 +107,4 @@ async def delete_organizer(db: AsyncSession, organizer_id: int) -> None:
             await db.flush()
         except IntegrityError as e:
             raise Conflict("Organizer in use", ctx={"organizer_id": organizer_id}) from e
+        await invalidate(ORGANIZERS_CACHE)
@@ -1,18 +1,25 @@
 from datetime import datetime, timezone
-from sqlalchemy import select
+from sqlalchemy import select, or_, and_
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 from app.domain.payments import crud
 from app.domain.payments.models import PaymentMethod, Payment, PaymentStatus
-from app.domain.payments.schemas import PaymentMethodCreateDTO, PaymentMethodUpdateDTO, PaymentCreateDTO
+from app.domain.payments.schemas import PaymentMethodCreateDTO, PaymentMethodUpdateDTO, PaymentCreateDTO, \
+    PaymentMethodReadDTO, PaymentMethodsQueryDTO
+from app.core.pagination import PageDTO, next_cursor
+from app.core.utils.dto import from_orm
 from app.domain.users.models import User
 from app.domain.booking.models import Order, OrderStatus, TicketInstance, Ticket
 from app.services.invoices_service import issue_invoice_for_order
 from app.core.auditing import AuditSpan
+from app.core.cache import invalidate, ACTIVE_PAYMENT_METHODS_CACHE
 import uuid
 import hashlib
 from app.domain.exceptions import NotFound, Conflict, InvalidInput
 
+_ACTIVE_PAYMENT_STATUSES = (PaymentStatus.PENDING, PaymentStatus.REQUIRES_ACTION)
+
 
 def _redirect_url(payment: Payment, idempotency_key: str) -> str:
     return f"/payments/{payment.id}/redirect?ik={idempotency_key}"
@@ -64,6 +71,7 @@ async def _require_active_payment_method(db: AsyncSession, pm_id: int) -> Paymen
 async def _require_awaiting_order(db: AsyncSession, user_id: int) -> Order:
     order = await db.scalar(
         select(Order)
+        .options(raiseload("*"))
         .where(Order.user_id == user_id, Order.status == OrderStatus.AWAITING_PAYMENT)
         .with_for_update()
     )
@@ -93,6 +101,8 @@ async def _require_payment_for_user(db: AsyncSession, payment_id: int, user_id:
     )
     if for_update:
         stmt = stmt.with_for_update()
+    else:
+        stmt = stmt.options(raiseload("*"))
     payment = await db.scalar(stmt)
     if not payment:
         raise NotFound("Payment not found", ctx={"payment_id": payment_id, "user_id": user_id})
@@ -103,8 +113,16 @@ async def get_payment_method(db: AsyncSession, payment_method_id: int) -> Paymen
     return await _require_payment_method(db, payment_method_id)
 
 
-async def list_all_payment_methods(db: AsyncSession) -> list[PaymentMethod]:
-    return await crud.list_payment_methods(db)
+async def list_all_payment_methods(db: AsyncSession, query: PaymentMethodsQueryDTO) -> PageDTO[PaymentMethodReadDTO]:
+    payment_methods, total = await crud.list_payment_methods(db, query.page, query.page_size, after=query.after)
+    items = [from_orm(PaymentMethodReadDTO, payment_method) for payment_method in payment_methods]
+    return PageDTO(
+        items=items,
+        total=total,
+        page=query.page,
+        page_size=query.page_size,
+        next_cursor=next_cursor(items, query.page_size, lambda m: (m.id,))
+    )
 
 
 async def list_active_payment_methods(db: AsyncSession) -> list[PaymentMethod]:
@@ -125,6 +143,7 @@ async def create_payment_method(db: AsyncSession, schema: PaymentMethodCreateDTO
         except IntegrityError as e:
             raise Conflict("Payment method already exists", ctx={"fields": fields}) from e
         span.object_id = payment_method.id
+        await invalidate(ACTIVE_PAYMENT_METHODS_CACHE)
         return payment_method
 
 
@@ -147,6 +166,7 @@ async def update_payment_method(
             await db.flush()
         except IntegrityError as e:
             raise Conflict("Payment method already exists", ctx={"fields": fields}) from e
+        await invalidate(ACTIVE_PAYMENT_METHODS_CACHE)
         return payment_method
 
 
@@ -170,7 +190,16 @@ async def start_payment(
         amount = order.total_price
         span.meta.update({"order_id": order.id, "amount": str(amount)})
 
-        existing_by_key = await db.scalar(select(Payment).where(Payment.idempotency_key == idempotency_key))
+        # Idempotency hit and active payment for the order in one round trip, under the order row lock.
+        candidates = (await db.scalars(
+            select(Payment)
+            .options(raiseload("*"))
+            .where(or_(
+                Payment.idempotency_key == idempotency_key,
+                and_(Payment.order_id == order.id, Payment.status.in_(_ACTIVE_PAYMENT_STATUSES))
+            ))
+        )).all()
+        existing_by_key = next((p for p in candidates if p.idempotency_key == idempotency_key), None)
         if existing_by_key:
             if (existing_by_key.order_id != order.id or
                     existing_by_key.payment_method_id != payment_method.id or
@@ -194,13 +223,7 @@ async def start_payment(
             span.meta.update({"status": existing_by_key.status, "redirect": bool(redirect_url), "idempotent_hit": True})
             return existing_by_key, redirect_url
 
-        existing_active = await db.scalar(
-            select(Payment)
-            .where(
-                Payment.order_id == order.id,
-                Payment.status.in_([PaymentStatus.PENDING, PaymentStatus.REQUIRES_ACTION])
-            )
-        )
+        existing_active = next(iter(candidates), None)
 
         if existing_active:
             if existing_active.payment_method_id == payment_method.id and existing_active.amount == amount:
@@ -2,7 +2,9 @@ from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.domain.pricing.models import TicketType
 from app.domain.pricing import crud
-from app.domain.pricing.schemas import TicketTypeCreateDTO
+from app.domain.pricing.schemas import TicketTypeCreateDTO, TicketTypeReadDTO, TicketTypesQueryDTO
+from app.core.pagination import PageDTO, next_cursor
+from app.core.utils.dto import from_orm
 from app.core.auditing import AuditSpan
 from app.domain.exceptions import NotFound, Conflict
 
@@ -14,8 +16,16 @@ async def get_ticket_type(db: AsyncSession, ticket_type_id: int) -> TicketType:
     return ticket_type
 
 
-async def list_ticket_types(db: AsyncSession) -> list[TicketType]:
-    return await crud.list_ticket_types(db)
+async def list_ticket_types(db: AsyncSession, query: TicketTypesQueryDTO) -> PageDTO[TicketTypeReadDTO]:
+    ticket_types, total = await crud.list_ticket_types(db, query.page, query.page_size, after=query.after)
+    items = [from_orm(TicketTypeReadDTO, ticket_type) for ticket_type in ticket_types]
+    return PageDTO(
+        items=items,
+        total=total,
+        page=query.page,
+        page_size=query.page_size,
+        next_cursor=next_cursor(items, query.page_size, lambda t: (t.id,))
+    )
 
 
 async def create_ticket_type(db: AsyncSession, schema: TicketTypeCreateDTO) -> TicketType:
@@ -42,9 +52,9 @@ async def delete_ticket_type(db: AsyncSession, ticket_type_id: int) -> None:
         object_type="ticket_type",
         object_id=ticket_type_id,
     ):
-        ticket_type = await get_ticket_type(db, ticket_type_id)
-        await crud.delete_ticket_type(db, ticket_type)
         try:
-            await db.flush()
+            deleted_id = await crud.delete_ticket_type(db, ticket_type_id)
         except IntegrityError as e:
             raise Conflict("Ticket type in use", ctx={"ticket_type_id": ticket_type_id}) from e
+        if deleted_id is None:
+            raise NotFound("Ticket type not found", ctx={"ticket_type_id": ticket_type_id})
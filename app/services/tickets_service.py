@@ -33,39 +33,40 @@ def _to_holder_dto(row: Any, full: bool):
     )
 
 
-def _ticket_row_select():
-    return (
-        select(
-            Ticket.id,
-            Ticket.code,
-            Ticket.status,
-            Ticket.created_at,
-            Event.id.label("event_id"),
-            Event.name.label("event_name"),
-            Event.event_start,
-            Venue.name.label("venue_name"),
-            Sector.is_ga,
-            Sector.name.label("sector_name"),
-            Seat.row,
-            Seat.number.label("seat"),
-            TicketInstance.ticket_type_name_snapshot.label("ticket_type_name"),
-            TicketInstance.price_gross_snapshot.label("price_gross"),
-            TicketHolder.id.label("holder_id"),
-            TicketHolder.first_name,
-            TicketHolder.last_name,
-            TicketHolder.identification_number
-        )
-        .select_from(Ticket)
-        .join(TicketInstance, TicketInstance.id == Ticket.ticket_instance_id)
-        .join(Order, Order.id == TicketInstance.order_id)
-        .join(Event, Event.id == TicketInstance.event_id)
-        .join(Venue, Venue.id == Event.venue_id)
-        .join(EventTicketType, EventTicketType.id == TicketInstance.event_ticket_type_id)
-        .join(EventSector, EventSector.id == EventTicketType.event_sector_id)
-        .join(Sector, Sector.id == EventSector.sector_id)
-        .outerjoin(Seat, Seat.id == TicketInstance.seat_id)
-        .outerjoin(TicketHolder, TicketHolder.ticket_instance_id == TicketInstance.id)
+# Statements are immutable, so the listing base is built once; per-request .where() clones it.
+_TICKET_ROWS = (
+    select(
+        Ticket.id,
+        Ticket.code,
+        Ticket.status,
+        Ticket.created_at,
+        Event.id.label("event_id"),
+        Event.name.label("event_name"),
+        Event.event_start,
+        Venue.name.label("venue_name"),
+        Sector.is_ga,
+        Sector.name.label("sector_name"),
+        Seat.row,
+        Seat.number.label("seat"),
+        TicketInstance.ticket_type_name_snapshot.label("ticket_type_name"),
+        TicketInstance.price_gross_snapshot.label("price_gross"),
+        TicketHolder.id.label("holder_id"),
+        TicketHolder.first_name,
+        TicketHolder.last_name,
+        TicketHolder.identification_number
     )
+    .select_from(Ticket)
+    .join(TicketInstance, TicketInstance.id == Ticket.ticket_instance_id)
+    .join(Order, Order.id == TicketInstance.order_id)
+    .join(Event, Event.id == TicketInstance.event_id)
+    .join(Venue, Venue.id == Event.venue_id)
+    .join(EventTicketType, EventTicketType.id == TicketInstance.event_ticket_type_id)
+    .join(EventSector, EventSector.id == EventTicketType.event_sector_id)
+    .join(Sector, Sector.id == EventSector.sector_id)
+    .outerjoin(Seat, Seat.id == TicketInstance.seat_id)
+    .outerjoin(TicketHolder, TicketHolder.ticket_instance_id == TicketInstance.id)
+)
+_TICKET_ROWS_WITH_USER = _TICKET_ROWS.join(User, User.id == Order.user_id)
 
 
 def _map_ticket_row(row: Any, full_holder: bool) -> TicketReadItemDTO:
@@ -97,9 +98,7 @@ async def _list_tickets_helper(
         needs_user_join: bool,
         full_holder: bool
 ) -> PageDTO[TicketReadItemDTO]:
-    base = _ticket_row_select()
-    if needs_user_join:
-        base = base.join(User, User.id == Order.user_id)
+    base = _TICKET_ROWS_WITH_USER if needs_user_join else _TICKET_ROWS
 
     rows, total = await paginate(
         db,
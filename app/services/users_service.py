@@ -6,6 +6,7 @@ from app.domain.users import crud as crud
 from app.domain.users.models import User
 from app.core.auditing import AuditSpan
 from app.core.security import verify_password, hash_password
+from app.core.dependencies.auth import mark_access_tokens_stale
 from app.domain.exceptions import Unauthorized, InvalidInput, NotFound, Forbidden
 
 
@@ -66,5 +67,6 @@ async def update_user_roles(db: AsyncSession, user_id: int, schema: UserRolesUpd
         user.roles = roles
         await db.flush()
         await db.refresh(user)
+        await mark_access_tokens_stale(user.id)
 
         return user
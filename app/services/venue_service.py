@@ -1,10 +1,11 @@
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.core.pagination import PageDTO
+from app.core.pagination import PageDTO, next_cursor
 from app.core.auditing import AuditSpan
+from app.core.utils.dto import from_orm
 from app.domain.venues.models import Venue, Sector, Seat
 from app.domain.venues.schemas import VenueCreateDTO, VenueUpdateDTO, SectorCreateDTO, SectorUpdateDTO, SeatCreateDTO, \
-    SeatBulkCreateDTO, SeatUpdateDTO, VenuesQueryDTO, VenueReadDTO
+    SeatBulkCreateDTO, SeatUpdateDTO, VenuesQueryDTO, VenueReadDTO, SectorReadDTO, SeatReadDTO, SeatsQueryDTO
 from app.domain.venues import crud
 from app.services.address_service import get_address
 from app.domain.exceptions import NotFound, Conflict, InvalidInput
@@ -24,7 +25,7 @@ async def get_venue(db: AsyncSession, venue_id: int) -> Venue:
 
 async def list_venues(db: AsyncSession, query: VenuesQueryDTO) -> PageDTO[VenueReadDTO]:
     venues, total = await crud.list_all_venues(db, query.page, query.page_size, name=query.name)
-    items = [VenueReadDTO.model_validate(venue) for venue in venues]
+    items = [from_orm(VenueReadDTO, venue) for venue in venues]
     return PageDTO(
         items=items,
         total=total,
@@ -80,8 +81,16 @@ async def get_sector(db: AsyncSession, sector_id: int) -> Sector:
     return sector
 
 
-async def list_sectors_by_venue(db: AsyncSession, venue_id: int) -> list[Sector]:
-    return await crud.list_sectors_by_venue(db, venue_id)
+async def get_sectors(db: AsyncSession, sector_ids: list[int]) -> dict[int, Sector]:
+    sectors = {s.id: s for s in await crud.list_sectors_by_ids(db, sector_ids)}
+    for sector_id in sector_ids:
+        if sector_id not in sectors:
+            raise NotFound("Sector not found", ctx={"sector_id": sector_id})
+    return sectors
+
+
+async def list_sectors_by_venue(db: AsyncSession, venue_id: int) -> list[SectorReadDTO]:
+    return [from_orm(SectorReadDTO, row) for row in await crud.list_sectors_by_venue(db, venue_id)]
 
 
 async def create_sector(
@@ -143,8 +152,16 @@ async def get_seat(db: AsyncSession, seat_id: int) -> Seat:
     return seat
 
 
-async def list_seats_by_sector(db: AsyncSession, sector_id: int) -> list[Seat]:
-    return await crud.list_seats_by_sector(db, sector_id)
+async def list_seats_by_sector(db: AsyncSession, sector_id: int, query: SeatsQueryDTO) -> PageDTO[SeatReadDTO]:
+    seats, total = await crud.list_seats_by_sector(db, sector_id, query.page, query.page_size, after=query.after)
+    items = [from_orm(SeatReadDTO, seat) for seat in seats]
+    return PageDTO(
+        items=items,
+        total=total,
+        page=query.page,
+        page_size=query.page_size,
+        next_cursor=next_cursor(items, query.page_size, lambda s: (s.row, s.number, s.id))
+    )
 
 
 async def create_seat(db: AsyncSession, schema: SeatCreateDTO, sector_id: int) -> Seat:
@@ -222,9 +239,9 @@ async def delete_seat(db: AsyncSession, seat_id: int) -> None:
         object_type="seat",
         object_id=seat_id
     ):
-        seat = await get_seat(db, seat_id)
-        await crud.delete_seat(db, seat)
         try:
-            await db.flush()
+            deleted_id = await crud.delete_seat(db, seat_id)
         except IntegrityError as e:
             raise Conflict("Seat in use", ctx={"seat_id": seat_id}) from e
+        if deleted_id is None:
+            raise NotFound("Seat not found", ctx={"seat_id": seat_id})
@@ -1,5 +1,6 @@
 import os
-import json
+import orjson
+import msgpack
 import asyncio
 import signal
 import socket
@@ -8,9 +9,9 @@ import redis.asyncio as redis
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from sqlalchemy import text, bindparam, Text
 from sqlalchemy.dialects.postgresql import JSONB, INET, ARRAY
-from sqlalchemy.exc import SQLAlchemyError, DBAPIError
 from app.core.config import DATABASE_URL, AUDIT_STREAM, AUDIT_GROUP, AUDIT_BATCH, AUDIT_BLOCK_MS
 from app.core.redis import create_redis
+from app.core.auditing import AUDIT_SCOPE_IDS, AUDIT_FIELDS, AuditStatus
 
 
 logger = logging.getLogger("audit.worker")
@@ -23,11 +24,11 @@ INSERT_AUDIT = text("""
     INSERT INTO audit.audit_logs
     (request_id, scope, action, actor_user_id, actor_roles, actor_ip, route,
      object_type, object_id, organizer_id, event_id, order_id, payment_id,
-     invoice_id, status, reason, meta)
+     invoice_id, success, reason, meta)
     VALUES
     (:request_id, :scope, :action, :actor_user_id, :actor_roles, :actor_ip, :route,
      :object_type, :object_id, :organizer_id, :event_id, :order_id, :payment_id,
-     :invoice_id, :status, :reason, :meta)
+     :invoice_id, :success, :reason, :meta)
 """).bindparams(
     bindparam("actor_roles", type_=ARRAY(Text())),
     bindparam("actor_ip", type_=INET),
@@ -35,11 +36,20 @@ INSERT_AUDIT = text("""
 )
 
 
+_SCOPE_ID_SET = frozenset(AUDIT_SCOPE_IDS.values())
+
+
 def _params_from_payload(payload: dict) -> dict:
-    status = (payload.get("status") or "SUCCESS").upper()
+    status = payload.get("status")
+    if not isinstance(status, bool):
+        status = (status or AuditStatus.SUCCESS).upper() == AuditStatus.SUCCESS
+    scope = payload["scope"]
+    scope_id = scope if scope in _SCOPE_ID_SET else AUDIT_SCOPE_IDS.get(scope)
+    if scope_id is None:
+        raise ValueError(f"unknown scope: {scope}")
     return {
         "request_id": payload.get("request_id"),
-        "scope": payload["scope"],
+        "scope": scope_id,
         "action": payload["action"],
         "actor_user_id": payload.get("actor_user_id"),
         "actor_roles": list(payload.get("actor_roles") or []),
@@ -52,12 +62,88 @@ def _params_from_payload(payload: dict) -> dict:
         "order_id": payload.get("order_id"),
         "payment_id": payload.get("payment_id"),
         "invoice_id": payload.get("invoice_id"),
-        "status": "SUCCESS" if status == "SUCCESS" else "FAIL",
+        "success": status,
         "reason": payload.get("reason"),
         "meta": dict(payload.get("meta") or {}),
     }
 
 
+def _payload_from_fields(fields: dict) -> dict:
+    raw = fields.get(b"mp")
+    if raw is not None:
+        data = msgpack.unpackb(raw, timestamp=3)
+        # Positional frames; maps come from producers that predate AUDIT_FIELDS.
+        return dict(zip(AUDIT_FIELDS, data)) if isinstance(data, list) else data
+    # Entries queued as JSON before the switch to msgpack.
+    raw_json = fields.get(b"json")
+    return orjson.loads(raw_json) if raw_json else {}
+
+
+def _json_serializer(value) -> str:
+    return orjson.dumps(value, default=str, option=orjson.OPT_UTC_Z).decode()
+
+
+_AUDIT_COLUMNS = (
+    "request_id", "scope", "action", "actor_user_id", "actor_roles", "actor_ip", "route",
+    "object_type", "object_id", "organizer_id", "event_id", "order_id", "payment_id",
+    "invoice_id", "success", "reason", "meta",
+)
+# Below this, COPY setup costs more than a plain executemany.
+_COPY_MIN_ROWS = 32
+
+
+async def _write_rows(session: async_sessionmaker, rows: list[dict]) -> None:
+    async with session() as db:
+        async with db.begin():
+            if len(rows) < _COPY_MIN_ROWS:
+                await db.execute(INSERT_AUDIT, rows)
+                return
+            conn = await db.connection()
+            raw = await conn.get_raw_connection()
+            records = [(*(row[c] for c in _AUDIT_COLUMNS[:-1]), _json_serializer(row["meta"])) for row in rows]
+            await raw.driver_connection.copy_records_to_table(
+                "audit_logs", schema_name="audit", columns=_AUDIT_COLUMNS, records=records
+            )
+
+
+async def _process_entries(r: redis.Redis, session: async_sessionmaker, entries: list) -> None:
+    ids, rows, dropped = [], [], []
+    for msg_id, fields in entries:
+        try:
+            payload = _payload_from_fields(fields)
+            if not isinstance(payload, dict):
+                raise ValueError("payload is not a map")
+            if not payload.get("scope") or not payload.get("action"):
+                raise ValueError("missing required fields: scope/action")
+            rows.append(_params_from_payload(payload))
+            ids.append(msg_id)
+        except Exception as e:
+            logger.warning("Invalid payload; dropping id=%s err=%s", msg_id, e)
+            dropped.append(msg_id)
+
+    if rows:
+        try:
+            await _write_rows(session, rows)
+        except Exception:
+            # One bad row must not pin the whole batch in the PEL: retry row by row and ack what lands.
+            logger.exception("Batch insert of %d rows failed; retrying row by row", len(rows))
+            written = []
+            for msg_id, row in zip(ids, rows):
+                try:
+                    await _write_rows(session, [row])
+                    written.append(msg_id)
+                except Exception:
+                    logger.exception("DB insert failed; keeping id=%s in PEL", msg_id)
+            ids = written
+
+    acked = ids + dropped
+    if acked:
+        try:
+            await r.xack(AUDIT_STREAM, AUDIT_GROUP, *acked)
+        except Exception:
+            logger.exception("XACK failed for %d ids", len(acked))
+
+
 async def _ensure_group(r: redis.Redis) -> None:
     try:
         await r.xgroup_create(
@@ -75,10 +161,10 @@ async def _ensure_group(r: redis.Redis) -> None:
 
 
 async def run() -> None:
-    r = await create_redis()
+    r = await create_redis(decode_responses=False)
     await _ensure_group(r)
 
-    engine = create_async_engine(DATABASE_URL, pool_pre_ping=True)
+    engine = create_async_engine(DATABASE_URL, pool_pre_ping=True, json_serializer=_json_serializer)
     session = async_sessionmaker(bind=engine, expire_on_commit=False)
 
     stop = asyncio.Event()
@@ -111,30 +197,7 @@ async def run() -> None:
                 block=AUDIT_BLOCK_MS,
             )
             if resp:
-                entries = resp[0][1]
-                async with session() as db:
-                    async with db.begin():
-                        for msg_id, fields in entries:
-                            raw_json = fields.get("json")
-                            try:
-                                payload = json.loads(raw_json) if raw_json else {}
-                                if not isinstance(payload, dict):
-                                    raise ValueError("payload is not a JSON object")
-                                if not payload.get("scope") or not payload.get("action"):
-                                    raise ValueError("missing required fields: scope/action")
-
-                                params = _params_from_payload(payload)
-                                await db.execute(INSERT_AUDIT, params)
-
-                                await r.xack(AUDIT_STREAM, AUDIT_GROUP, msg_id)
-                            except (DBAPIError, SQLAlchemyError):
-                                logger.exception("DB insert failed; keeping id=%s in PEL", msg_id)
-                            except Exception as e:
-                                logger.warning("Invalid payload; dropping id=%s err=%s", msg_id, e)
-                                try:
-                                    await r.xack(AUDIT_STREAM, AUDIT_GROUP, msg_id)
-                                except Exception:
-                                    logger.exception("XACK failed id=%s", msg_id)
+                await _process_entries(r, session, resp[0][1])
             now = loop.time()
             if now - last_retry > 30:
                 last_retry = now
@@ -149,30 +212,7 @@ async def run() -> None:
                     )
                     if msgs:
                         logger.info("XAUTOCLAIM: retrying %d pending messages", len(msgs))
-                        async with session() as db:
-                            async with db.begin():
-                                for msg_id, fields in msgs:
-                                    raw_json = fields.get("json")
-                                    try:
-                                        payload = json.loads(raw_json) if raw_json else {}
-                                        if not isinstance(payload, dict):
-                                            raise ValueError("payload is not a JSON object")
-                                        if not payload.get("scope") or not payload.get("action"):
-                                            raise ValueError("missing required fields: scope/action")
-
-                                        params = _params_from_payload(payload)
-                                        await db.execute(INSERT_AUDIT, params)
-                                        await r.xack(AUDIT_STREAM, AUDIT_GROUP, msg_id)
-
-                                    except (DBAPIError, SQLAlchemyError):
-                                        logger.exception("DB insert failed (XAUTOCLAIM); keeping id=%s", msg_id)
-                                    except Exception as e:
-                                        logger.warning("Invalid payload (XAUTOCLAIM); dropping id=%s err=%s", msg_id, e)
-                                        try:
-                                            await r.xack(AUDIT_STREAM, AUDIT_GROUP, msg_id)
-                                        except Exception:
-                                            logger.exception("XACK failed id=%s", msg_id)
-
+                        await _process_entries(r, session, msgs)
                 except Exception:
                     logger.exception("XAUTOCLAIM failed")
     finally:
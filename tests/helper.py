@@ -24,3 +24,10 @@ def create_role(mocker, name: str):
     role = mocker.Mock()
     role.name = name
     return role
+
+
+def create_user(mocker, roles=(), organizers=(), **attrs):
+    user = mocker.Mock(roles=list(roles), organizers=list(organizers), **attrs)
+    user.role_names = frozenset(r.name for r in roles)
+    user.organizer_ids = frozenset(o.id for o in organizers)
+    return user
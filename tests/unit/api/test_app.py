@@ -0,0 +1,15 @@
+from collections import Counter
+from app.main import app
+
+
+def test_every_route_is_registered_once():
+    routers = [r.original_router for r in app.routes if hasattr(r, "original_router")]
+    keys = Counter(
+        (method, route.path)
+        for router in routers
+        for route in router.routes
+        for method in getattr(route, "methods", None) or ()
+    )
+
+    assert len({id(router) for router in routers}) == len(routers)
+    assert [key for key, count in keys.items() if count > 1] == []
@@ -0,0 +1,65 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from app.api.exceptions import register_error_handler, MEDIA_TYPE
+from app.domain.exceptions import AppError, NotFound, Unauthorized, Conflict
+
+
+class _CustomNotFound(NotFound):
+    pass
+
+
+def _client(exc: Exception) -> TestClient:
+    app = FastAPI()
+    register_error_handler(app)
+
+    @app.get("/boom")
+    async def boom():
+        raise exc
+
+    return TestClient(app)
+
+
+@pytest.mark.parametrize(
+    "exc, expected_status, expected_title",
+    [
+        (NotFound("Event not found"), 404, "Not Found"),
+        (Conflict("Seat taken"), 409, "Conflict"),
+        (_CustomNotFound("Nested"), 404, "Not Found"),
+        (AppError("Generic"), 400, "Application Error"),
+    ]
+)
+def test_problem_status_and_title(exc, expected_status, expected_title):
+    response = _client(exc).get("/boom")
+
+    assert response.status_code == expected_status
+    assert response.headers["content-type"].startswith(MEDIA_TYPE)
+    body = response.json()
+    assert body["status"] == expected_status
+    assert body["title"] == expected_title
+    assert body["detail"] == str(exc)
+
+
+def test_problem_includes_context():
+    response = _client(NotFound("Event not found", ctx={"event_id": 1})).get("/boom")
+
+    assert response.json()["context"] == {"event_id": 1}
+
+
+def test_unauthorized_sets_www_authenticate():
+    response = _client(Unauthorized("Invalid token type")).get("/boom")
+
+    assert response.status_code == 401
+    assert response.headers["www-authenticate"] == (
+        'Bearer realm="api", error="invalid_token", error_description="Invalid token type"'
+    )
+
+
+
+def test_pool_timeout_returns_503_with_retry_after():
+    response = _client(PoolTimeoutError("QueuePool limit reached")).get("/boom")
+
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "1"
+    assert response.json()["title"] == "Service Unavailable"
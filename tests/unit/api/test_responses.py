@@ -0,0 +1,79 @@
+import json
+import pytest
+from fastapi import Request
+from pydantic import BaseModel, TypeAdapter
+from app.api.responses import streaming_array_response, etag_dto_response, etag_list_response
+
+
+class _Item(BaseModel):
+    id: int
+
+
+async def _batches(*batches):
+    for batch in batches:
+        yield [_Item(id=i) for i in batch]
+
+
+async def _body(response) -> bytes:
+    return b"".join([chunk async for chunk in response.body_iterator])
+
+
+@pytest.mark.asyncio
+async def test_streaming_array_response_joins_batches_into_one_array():
+    response = streaming_array_response(_batches([1, 2], [], [3]))
+
+    assert response.media_type == "application/json"
+    assert json.loads(await _body(response)) == [{"id": 1}, {"id": 2}, {"id": 3}]
+
+
+@pytest.mark.asyncio
+async def test_streaming_array_response_empty_stream_is_empty_array():
+    response = streaming_array_response(_batches())
+
+    assert await _body(response) == b"[]"
+
+
+def _request(headers: dict[str, str] | None = None) -> Request:
+    raw = [(k.lower().encode(), v.encode()) for k, v in (headers or {}).items()]
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": raw})
+
+
+def test_etag_dto_response_sets_validators():
+    response = etag_dto_response(_request(), _Item(id=1))
+
+    assert response.status_code == 200
+    assert response.headers["etag"].startswith('"')
+    assert response.headers["cache-control"] == "private, no-cache"
+    assert json.loads(response.body) == {"id": 1}
+
+
+@pytest.mark.parametrize("header", ["{etag}", 'W/{etag}', '"other", {etag}', "*"])
+def test_etag_dto_response_matching_if_none_match_returns_304(header):
+    etag = etag_dto_response(_request(), _Item(id=1)).headers["etag"]
+
+    response = etag_dto_response(_request({"If-None-Match": header.format(etag=etag)}), _Item(id=1))
+
+    assert response.status_code == 304
+    assert response.body == b""
+    assert response.headers["etag"] == etag
+
+
+def test_etag_dto_response_changed_body_returns_200():
+    etag = etag_dto_response(_request(), _Item(id=1)).headers["etag"]
+
+    response = etag_dto_response(_request({"If-None-Match": etag}), _Item(id=2))
+
+    assert response.status_code == 200
+
+
+def test_etag_list_response_validates_items_from_attributes():
+    class _Row:
+        def __init__(self, id):
+            self.id = id
+
+    adapter = TypeAdapter(list[_Item])
+    response = etag_list_response(_request(), adapter, [_Row(1), _Row(2)])
+    etag = response.headers["etag"]
+
+    assert json.loads(response.body) == [{"id": 1}, {"id": 2}]
+    assert etag_list_response(_request({"If-None-Match": etag}), adapter, [_Row(1), _Row(2)]).status_code == 304
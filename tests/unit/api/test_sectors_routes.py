@@ -0,0 +1,14 @@
+import pytest
+from app.api.v1.routes.sectors import bulk_add_seats_for_sector
+
+
+@pytest.mark.asyncio
+async def test_bulk_add_seats_returns_empty_204(mocker):
+    bulk = mocker.patch("app.api.v1.routes.sectors.venue_service.bulk_create_seats", return_value=None)
+    db, schema = object(), object()
+
+    resp = await bulk_add_seats_for_sector(7, schema, db)
+
+    bulk.assert_awaited_once_with(db, schema, 7)
+    assert resp.status_code == 204
+    assert resp.body == b""
@@ -0,0 +1,31 @@
+import json
+import pytest
+from datetime import date
+from types import SimpleNamespace
+from fastapi import Request
+from app.api.v1.routes.users import get_me, _me_body
+
+
+def _request() -> Request:
+    return Request({"type": "http", "method": "GET", "path": "/users/me", "headers": []})
+
+
+def _user(**overrides):
+    fields = dict(id=1, email="a@example.com", first_name="Ann", last_name="Lee", phone_number=None,
+                  birth_date=date(1990, 1, 2))
+    return SimpleNamespace(**(fields | overrides))
+
+
+@pytest.mark.asyncio
+async def test_get_me_reuses_serialized_body_until_profile_changes():
+    _me_body.cache_clear()
+
+    first = await get_me(_user(), _request())
+    second = await get_me(_user(), _request())
+    renamed = await get_me(_user(first_name="Anna"), _request())
+
+    assert json.loads(first.body) == {"id": 1, "email": "a@example.com", "first_name": "Ann", "last_name": "Lee",
+                                      "birth_date": "1990-01-02"}
+    assert second.body == first.body
+    assert _me_body.cache_info().hits == 1
+    assert renamed.headers["etag"] != first.headers["etag"]
@@ -0,0 +1,147 @@
+import asyncio
+import msgpack
+import pytest
+from datetime import timezone
+from app.core.auditing import AUDIT_FIELDS, AuditSpan, audit_emit, flush_audit_queue, flush_audit_buffer, \
+    audit_dropped_total
+from app.core.ctx import REDIS_CTX, REQUEST_ID_CTX, AUDIT_QUEUE_CTX, AUDIT_BUFFER_CTX
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.entries: list[dict] = []
+        self.executes = 0
+        self.options: list[dict] = []
+
+    async def xadd(self, stream, fields, **kwargs):
+        self.options.append(kwargs)
+        self.entries.append(dict(zip(AUDIT_FIELDS, msgpack.unpackb(fields["mp"], timestamp=3))))
+        return f"{len(self.entries)}-0"
+
+    def pipeline(self, transaction=True):
+        return _FakePipeline(self)
+
+
+class _FakePipeline:
+    def __init__(self, r):
+        self.r = r
+        self.pending: list[dict] = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def xadd(self, stream, fields, **kwargs):
+        self.pending.append((fields, kwargs))
+
+    async def execute(self):
+        self.r.executes += 1
+        return [await self.r.xadd(None, f, **kw) for f, kw in self.pending]
+
+
+@pytest.fixture
+def fake_redis():
+    r = _FakeRedis()
+    token = REDIS_CTX.set(r)
+    yield r
+    REDIS_CTX.reset(token)
+
+
+@pytest.mark.asyncio
+async def test_audit_emit_publishes_immediately(fake_redis):
+    entry_id = await audit_emit(scope="CART", action="CHECKOUT", status="SUCCESS")
+
+    assert entry_id == "1-0"
+    assert fake_redis.entries[0]["action"] == "CHECKOUT"
+
+
+@pytest.mark.asyncio
+async def test_span_publishes_with_request_context(fake_redis):
+    token = REQUEST_ID_CTX.set("req-1")
+    try:
+        async with AuditSpan(scope="CART", action="CHECKOUT") as span:
+            span.order_id = 9
+    finally:
+        REQUEST_ID_CTX.reset(token)
+
+    assert fake_redis.entries[0]["request_id"] == "req-1"
+    assert fake_redis.entries[0]["order_id"] == 9
+    assert fake_redis.entries[0]["status"] is True
+    assert fake_redis.entries[0]["scope"] == 13
+
+
+@pytest.mark.asyncio
+async def test_span_packs_occurred_at_as_utc_timestamp(fake_redis):
+    async with AuditSpan(scope="CART", action="CHECKOUT"):
+        pass
+
+    assert fake_redis.entries[0]["meta"]["occurred_at"].tzinfo == timezone.utc
+
+
+@pytest.mark.asyncio
+async def test_audit_emit_with_queue_enqueues_and_flush_publishes_one_pipeline(fake_redis):
+    queue = asyncio.Queue(maxsize=10)
+    token = AUDIT_QUEUE_CTX.set(queue)
+    try:
+        assert await audit_emit(scope="CART", action="CHECKOUT", status="SUCCESS") is None
+        await audit_emit(scope="CART", action="RESERVE", status="FAIL")
+    finally:
+        AUDIT_QUEUE_CTX.reset(token)
+
+    assert fake_redis.entries == []
+
+    await flush_audit_queue(fake_redis, queue)
+
+    assert [e["action"] for e in fake_redis.entries] == ["CHECKOUT", "RESERVE"]
+    assert fake_redis.executes == 1
+    assert all(o["maxlen"] is None for o in fake_redis.options)
+
+
+@pytest.mark.asyncio
+async def test_audit_emit_with_full_queue_drops_oldest(fake_redis):
+    queue = asyncio.Queue(maxsize=1)
+    dropped_before = audit_dropped_total()
+    token = AUDIT_QUEUE_CTX.set(queue)
+    try:
+        await audit_emit(scope="CART", action="OLD", status="SUCCESS")
+        await audit_emit(scope="CART", action="NEW", status="SUCCESS")
+    finally:
+        AUDIT_QUEUE_CTX.reset(token)
+
+    assert queue.get_nowait().action == "NEW"
+    assert audit_dropped_total() == dropped_before + 1
+
+
+@pytest.mark.asyncio
+async def test_audit_emit_passes_meta_through_without_copy():
+    queue = asyncio.Queue()
+    meta = {"sid": 3}
+    token = AUDIT_QUEUE_CTX.set(queue)
+    try:
+        await audit_emit(scope="CART", action="CHECKOUT", status="SUCCESS", meta=meta)
+    finally:
+        AUDIT_QUEUE_CTX.reset(token)
+
+    event = queue.get_nowait()
+    assert event.meta is meta
+    assert event.actor_roles == ()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("committed, published", [(True, ["CHECKOUT", "RESERVE"]), (False, ["RESERVE"])])
+async def test_flush_audit_buffer_drops_success_events_after_rollback(fake_redis, committed, published):
+    buffer: list[dict] = []
+    token = AUDIT_BUFFER_CTX.set(buffer)
+    try:
+        await audit_emit(scope="CART", action="CHECKOUT", status="SUCCESS")
+        await audit_emit(scope="CART", action="RESERVE", status="FAIL")
+    finally:
+        AUDIT_BUFFER_CTX.reset(token)
+
+    assert fake_redis.entries == []
+
+    await flush_audit_buffer(buffer, committed)
+
+    assert [e["action"] for e in fake_redis.entries] == published
@@ -0,0 +1,81 @@
+import pytest
+from app.core import cache
+from app.core.ctx import REDIS_CTX, AFTER_COMMIT_CTX
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.store: dict[str, str] = {}
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.store[key] = value
+
+    async def incr(self, key):
+        self.store[key] = str(int(self.store.get(key, "0")) + 1)
+
+
+@pytest.fixture
+def fake_redis():
+    r = _FakeRedis()
+    token = REDIS_CTX.set(r)
+    yield r
+    REDIS_CTX.reset(token)
+
+
+def _builder(values):
+    calls = []
+
+    async def build():
+        calls.append(1)
+        return values[len(calls) - 1]
+
+    return build, calls
+
+
+@pytest.mark.asyncio
+async def test_get_or_set_hits_cache_for_same_params(fake_redis):
+    build, calls = _builder(['{"a":1}', '{"a":2}'])
+
+    first = await cache.get_or_set("ns", "p", build)
+    second = await cache.get_or_set("ns", "p", build)
+
+    assert first == second == '{"a":1}'
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_invalidate_bumps_version(fake_redis):
+    build, calls = _builder(['{"a":1}', '{"a":2}'])
+
+    await cache.get_or_set("ns", "p", build)
+    await cache.invalidate("ns")
+    result = await cache.get_or_set("ns", "p", build)
+
+    assert result == '{"a":2}'
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_invalidate_waits_for_commit(fake_redis):
+    hooks = []
+    token = AFTER_COMMIT_CTX.set(hooks)
+    try:
+        await cache.invalidate("ns")
+    finally:
+        AFTER_COMMIT_CTX.reset(token)
+
+    assert fake_redis.store == {}
+    await hooks[0]()
+    assert fake_redis.store == {"cache:ns:ver": "1"}
+
+
+@pytest.mark.asyncio
+async def test_get_or_set_without_redis_builds_every_time():
+    build, calls = _builder(['{"a":1}', '{"a":2}'])
+
+    assert await cache.get_or_set("ns", "p", build) == '{"a":1}'
+    assert await cache.get_or_set("ns", "p", build) == '{"a":2}'
+    assert len(calls) == 2
@@ -0,0 +1,46 @@
+import asyncio
+import pytest
+from app.core.coalesce import InFlight
+from app.domain.exceptions import NotFound
+
+
+@pytest.mark.asyncio
+async def test_concurrent_callers_share_one_load():
+    inflight: InFlight[int, str] = InFlight()
+    calls = 0
+    gate = asyncio.Event()
+
+    async def load():
+        nonlocal calls
+        calls += 1
+        await gate.wait()
+        return "event"
+
+    tasks = [asyncio.create_task(inflight.run(1, load)) for _ in range(5)]
+    await asyncio.sleep(0)
+    gate.set()
+
+    assert await asyncio.gather(*tasks) == ["event"] * 5
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_error_is_shared_and_key_released():
+    inflight: InFlight[int, str] = InFlight()
+    gate = asyncio.Event()
+
+    async def failing():
+        await gate.wait()
+        raise NotFound("Event not found")
+
+    tasks = [asyncio.create_task(inflight.run(1, failing)) for _ in range(3)]
+    await asyncio.sleep(0)
+    gate.set()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    assert all(isinstance(r, NotFound) for r in results)
+
+    async def ok():
+        return "event"
+
+    assert await inflight.run(1, ok) == "event"
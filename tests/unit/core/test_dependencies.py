@@ -1,10 +1,14 @@
 import pytest
-from jose import JWTError
-from app.core.dependencies.auth import get_current_user_with_roles, get_token_payload
+from jwt import InvalidTokenError
+from app.core.ctx import AUDIT_BUFFER_CTX, AFTER_COMMIT_CTX, REDIS_CTX, AUTH_ROLES_CTX, after_commit
+from app.core.database import get_db
+from app.core.dependencies.auth import get_current_user, get_current_user_with_roles, get_token_payload, get_principal, \
+    require_roles, mark_access_tokens_stale, AuthPrincipal
+from app.domain.auth.schemas import TokenPayload
 from app.core.dependencies.events import require_organizer_member, require_event_ticket_type_access
 from app.core.dependencies.addresses import require_authorized_address
 from app.domain.exceptions import Unauthorized, Forbidden, NotFound
-from tests.helper import create_role, db_with_scalars_first, db_with_tuples_first
+from tests.helper import create_role, create_user, db_with_scalars_first, db_with_tuples_first, db_with_scalar
 
 
 @pytest.mark.asyncio
@@ -26,10 +30,26 @@ async def test_get_token_payload_ok(mocker):
     assert payload.sub == "7"
 
 
+@pytest.mark.asyncio
+async def test_get_token_payload_reuses_verified_payload_until_expiry(mocker):
+    mocker.patch("app.core.dependencies.auth.SECRET_KEY", "fake-key")
+    decode = mocker.patch("app.core.dependencies.auth.jwt.decode",
+                          return_value={"sub": "7", "iat": 1, "exp": 1_000, "nbf": 1, "typ": "access"})
+    clock = mocker.patch("app.core.dependencies.auth.time.time", return_value=500)
+
+    first = await get_token_payload("cached-token")
+    second = await get_token_payload("cached-token")
+    clock.return_value = 2_000
+    await get_token_payload("cached-token")
+
+    assert second is first
+    assert decode.call_count == 2
+
+
 @pytest.mark.asyncio
 async def test_get_token_payload_invalid_jwt_raises_401(mocker):
     mocker.patch("app.core.dependencies.auth.SECRET_KEY", "fake-key")
-    mocker.patch("app.core.dependencies.auth.jwt.decode", side_effect=JWTError("err"))
+    mocker.patch("app.core.dependencies.auth.jwt.decode", side_effect=InvalidTokenError("err"))
 
     with pytest.raises(Unauthorized) as e:
         await get_token_payload("bad-token")
@@ -53,12 +73,12 @@ async def test_get_token_payload_invalid_payload_raises_401(mocker):
 async def test_get_current_user_with_roles_when_roles_intersect_and_user_found(mocker):
     dependency = get_current_user_with_roles("ADMIN", "CUSTOMER")
     role = create_role(mocker, "CUSTOMER")
-    fake_user = mocker.Mock(is_active=True, roles=[role])
+    fake_user = create_user(mocker, is_active=True, roles=[role])
 
     db, res = db_with_scalars_first(mocker, fake_user)
     payload = mocker.Mock(sub="1")
 
-    user = await dependency(payload, db)
+    user = await dependency(await get_current_user(payload, db))
 
     assert user is fake_user
     db.execute.assert_awaited_once()
@@ -70,13 +90,13 @@ async def test_get_current_user_with_roles_when_roles_intersect_and_user_found(m
 async def test_get_current_user_with_roles_when_roles_do_not_intersect_raises_403(mocker):
     dependency = get_current_user_with_roles("ADMIN")
     role = create_role(mocker, "ORGANIZER")
-    fake_user = mocker.Mock(is_active=True, roles=[role])
+    fake_user = create_user(mocker, is_active=True, roles=[role])
 
     db, res = db_with_scalars_first(mocker, fake_user)
     payload = mocker.Mock(sub="1")
 
     with pytest.raises(Forbidden) as e:
-        await dependency(payload, db)
+        await dependency(await get_current_user(payload, db))
 
     assert e.value.ctx["required"] == "['ADMIN']"
     db.execute.assert_awaited_once()
@@ -86,13 +106,11 @@ async def test_get_current_user_with_roles_when_roles_do_not_intersect_raises_40
 
 @pytest.mark.asyncio
 async def test_get_current_user_with_roles_when_roles_intersect_and_user_not_found_raises_401(mocker):
-    dependency = get_current_user_with_roles("ORGANIZER")
-
     db, result = db_with_scalars_first(mocker, None)
     payload = mocker.Mock(sub="1")
 
     with pytest.raises(Unauthorized) as e:
-        await dependency(payload, db)
+        await get_current_user(payload, db)
 
     assert str(e.value) == "User not found"
     assert e.value.ctx == {"user_id": "1"}
@@ -102,11 +120,115 @@ async def test_get_current_user_with_roles_when_roles_intersect_and_user_not_fou
     result.scalars.return_value.first.assert_called_once()
 
 
+def test_get_current_user_with_roles_reuses_callable_per_role_set():
+    assert get_current_user_with_roles("ADMIN", "ORGANIZER") is get_current_user_with_roles("ORGANIZER", "ADMIN")
+    assert get_current_user_with_roles("ADMIN") is not get_current_user_with_roles("ORGANIZER")
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_with_roles_when_user_has_no_known_role_raises_403(mocker):
+    dependency = get_current_user_with_roles("ADMIN", "ORGANIZER", "CUSTOMER")
+    fake_user = create_user(mocker, roles=[create_role(mocker, "LEGACY")])
+
+    with pytest.raises(Forbidden) as e:
+        await dependency(fake_user)
+
+    assert e.value.ctx["user_roles"] == "['LEGACY']"
+
+
+def test_get_current_user_with_roles_rejects_unknown_role_name():
+    with pytest.raises(KeyError):
+        get_current_user_with_roles("SUPERUSER")
+
+
+def _payload(roles=None, iat=100):
+    return TokenPayload(sub="7", iat=iat, exp=iat + 900, nbf=iat, typ="access", roles=roles)
+
+
+@pytest.fixture
+def redis_ctx(mocker):
+    r = mocker.AsyncMock()
+    r.get.return_value = None
+    token = REDIS_CTX.set(r)
+    yield r
+    REDIS_CTX.reset(token)
+
+
+@pytest.mark.asyncio
+async def test_get_principal_trusts_token_roles_without_db(mocker, redis_ctx):
+    db = mocker.AsyncMock()
+
+    principal = await get_principal(_payload(roles=["ORGANIZER"]), db)
+
+    assert principal == AuthPrincipal(7, ("ORGANIZER",))
+    assert AUTH_ROLES_CTX.get() == ("ORGANIZER",)
+    db.execute.assert_not_called()
+    redis_ctx.get.assert_awaited_once_with("auth:stale:7")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("roles, stale_since", [(None, None), (["ADMIN"], b"100")])
+async def test_get_principal_falls_back_to_user_lookup(mocker, redis_ctx, roles, stale_since):
+    redis_ctx.get.return_value = stale_since
+    user = create_user(mocker, id=7, roles=[create_role(mocker, "CUSTOMER")])
+    lookup = mocker.patch("app.core.dependencies.auth.get_current_user", return_value=user)
+
+    principal = await get_principal(_payload(roles=roles), mocker.AsyncMock())
+
+    assert principal == AuthPrincipal(7, ("CUSTOMER",))
+    lookup.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_get_principal_falls_back_when_redis_unavailable(mocker):
+    user = create_user(mocker, id=7, roles=[create_role(mocker, "CUSTOMER")])
+    lookup = mocker.patch("app.core.dependencies.auth.get_current_user", return_value=user)
+
+    principal = await get_principal(_payload(roles=["ADMIN"]), mocker.AsyncMock())
+
+    assert principal.roles == ("CUSTOMER",)
+    lookup.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_require_roles_checks_principal_roles():
+    dependency = require_roles("ADMIN", "ORGANIZER")
+    principal = AuthPrincipal(7, ("ORGANIZER",))
+
+    assert await dependency(principal) is principal
+    with pytest.raises(Forbidden):
+        await dependency(AuthPrincipal(7, ("CUSTOMER",)))
+    assert require_roles("ORGANIZER", "ADMIN") is dependency
+
+
+@pytest.mark.asyncio
+async def test_mark_access_tokens_stale_sets_expiring_key(redis_ctx):
+    await mark_access_tokens_stale(7)
+
+    args, kwargs = redis_ctx.set.await_args
+    assert args[0] == "auth:stale:7"
+    assert kwargs["ex"] > 0
+
+
+@pytest.mark.asyncio
+async def test_mark_access_tokens_stale_waits_for_commit(redis_ctx):
+    hooks = []
+    token = AFTER_COMMIT_CTX.set(hooks)
+    try:
+        await mark_access_tokens_stale(7)
+    finally:
+        AFTER_COMMIT_CTX.reset(token)
+
+    redis_ctx.set.assert_not_awaited()
+    await hooks[0]()
+    redis_ctx.set.assert_awaited_once()
+
+
 def test_require_organizer_member_when_organizer_organizer_id_in_user_organizers(mocker):
     role = create_role(mocker, "ORGANIZER")
     organizer1 = mocker.Mock(id=1)
     organizer2 = mocker.Mock(id=2)
-    user = mocker.Mock(roles=[role], organizers=[organizer1, organizer2])
+    user = create_user(mocker, roles=[role], organizers=[organizer1, organizer2])
 
     result = require_organizer_member(1, user)
 
@@ -115,7 +237,7 @@ def test_require_organizer_member_when_organizer_organizer_id_in_user_organizers
 
 def test_require_organizer_member_when_admin(mocker):
     role = create_role(mocker, "ADMIN")
-    user = mocker.Mock(roles=[role])
+    user = create_user(mocker, roles=[role])
 
     result = require_organizer_member(333, user)
 
@@ -124,7 +246,7 @@ def test_require_organizer_member_when_admin(mocker):
 
 def test_require_organizer_member_when_organizer_id_not_in_user_organizer_raises_403(mocker):
     role = create_role(mocker, "ORGANIZER")
-    user = mocker.Mock(roles=[role], organizers=[mocker.Mock(id=1), mocker.Mock(id=2)])
+    user = create_user(mocker, roles=[role], organizers=[mocker.Mock(id=1), mocker.Mock(id=2)])
 
     with pytest.raises(Forbidden) as e:
         require_organizer_member(3, user)
@@ -135,13 +257,11 @@ def test_require_organizer_member_when_organizer_id_not_in_user_organizer_raises
 
 @pytest.mark.asyncio
 async def test_get_current_user_with_roles_when_user_not_found_raises_401(mocker):
-    dependency = get_current_user_with_roles("ORGANIZER")
-
     db, res = db_with_scalars_first(mocker, None)
     payload = mocker.Mock(sub="1")
 
     with pytest.raises(Unauthorized) as e:
-        await dependency(payload, db)
+        await get_current_user(payload, db)
 
     assert e.value.ctx["user_id"] == "1"
     db.execute.assert_awaited_once()
@@ -153,25 +273,21 @@ async def test_get_current_user_with_roles_when_user_not_found_raises_401(mocker
 async def test_require_event_owner_ok_for_admin(mocker):
     from app.core.dependencies.events import require_event_owner
     event = mocker.Mock(organizer_id=123)
-    db, res = db_with_scalars_first(mocker, event)
-    user = mocker.Mock(roles=[create_role(mocker, "ADMIN")])
+    db, res = db_with_tuples_first(mocker, (event, True))
+    user = create_user(mocker, roles=[create_role(mocker, "ADMIN")])
 
     out = await require_event_owner(1, db, user)
 
     assert out is event
     db.execute.assert_awaited_once()
-    res.scalars.assert_called_once()
-    res.scalars.return_value.first.assert_called_once()
+    res.tuples.return_value.first.assert_called_once()
 
 @pytest.mark.asyncio
 async def test_require_event_owner_forbidden_when_not_organizer(mocker):
     from app.core.dependencies.events import require_event_owner
     event = mocker.Mock(organizer_id=3)
-    db, res = db_with_scalars_first(mocker, event)
-    user = mocker.Mock(
-        roles=[create_role(mocker, "ORGANIZER")],
-        organizers=[mocker.Mock(id=1), mocker.Mock(id=2)],
-    )
+    db, res = db_with_tuples_first(mocker, (event, False))
+    user = create_user(mocker, id=7, roles=[create_role(mocker, "ORGANIZER")])
 
     with pytest.raises(Forbidden) as e:
         await require_event_owner(1, db, user)
@@ -179,15 +295,14 @@ async def test_require_event_owner_forbidden_when_not_organizer(mocker):
     assert str(e.value) == "Not allowed"
     assert e.value.ctx == {"event_id": 1, "reason": "organizer_mismatch"}
     db.execute.assert_awaited_once()
-    res.scalars.assert_called_once()
-    res.scalars.return_value.first.assert_called_once()
+    res.tuples.return_value.first.assert_called_once()
 
 
 @pytest.mark.asyncio
 async def test_require_event_owner_not_found(mocker):
     from app.core.dependencies.events import require_event_owner
-    db, res = db_with_scalars_first(mocker, None)
-    user = mocker.Mock()
+    db, res = db_with_tuples_first(mocker, None)
+    user = create_user(mocker, id=7, roles=[create_role(mocker, "ORGANIZER")])
 
     with pytest.raises(NotFound) as e:
         await require_event_owner(1, db, user)
@@ -195,50 +310,77 @@ async def test_require_event_owner_not_found(mocker):
     assert str(e.value) == "Event not found"
     assert e.value.ctx == {"event_id": 1}
     db.execute.assert_awaited_once()
-    res.scalars.assert_called_once()
-    res.scalars.return_value.first.assert_called_once()
+    res.tuples.return_value.first.assert_called_once()
 
 
 @pytest.mark.asyncio
 async def test_require_event_owner_ok_for_organizer_member(mocker):
     from app.core.dependencies.events import require_event_owner
     event = mocker.Mock(organizer_id=2)
-    db, res = db_with_scalars_first(mocker, event)
-    user = mocker.Mock(
-        roles=[create_role(mocker, "ORGANIZER")],
-        organizers=[mocker.Mock(id=1), mocker.Mock(id=2)],
-    )
+    db, res = db_with_tuples_first(mocker, (event, True))
+    user = create_user(mocker, id=7, roles=[create_role(mocker, "ORGANIZER")])
 
     out = await require_event_owner(1, db, user)
 
     assert out is event
     db.execute.assert_awaited_once()
-    res.scalars.assert_called_once()
-    res.scalars.return_value.first.assert_called_once()
+    res.tuples.return_value.first.assert_called_once()
 
 
 @pytest.mark.asyncio
-async def test_require_event_ticket_type_access_when_event_ticket_type_exists(mocker):
-    spy = mocker.patch(
-        "app.core.dependencies.events._ensure_event_owner",
-        new=mocker.AsyncMock(return_value=None),
-    )
+async def test_authorize_event_owner_returns_event_id_when_owned(mocker):
+    from app.core.dependencies.events import authorize_event_owner
+    db = db_with_scalar(mocker, True)
+    user = create_user(mocker, id=7, roles=[create_role(mocker, "ORGANIZER")])
 
-    user = mocker.Mock()
+    assert await authorize_event_owner(1, db, user) == 1
+    db.scalar.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("owned, exc, message", [
+    (None, NotFound, "Event not found"),
+    (False, Forbidden, "Not allowed"),
+])
+async def test_authorize_event_owner_rejects_missing_or_foreign_event(mocker, owned, exc, message):
+    from app.core.dependencies.events import authorize_event_owner
+    db = db_with_scalar(mocker, owned)
+    user = create_user(mocker, id=7, roles=[create_role(mocker, "ORGANIZER")])
+
+    with pytest.raises(exc) as e:
+        await authorize_event_owner(1, db, user)
+
+    assert str(e.value) == message
+
+
+@pytest.mark.asyncio
+async def test_require_event_ticket_type_access_when_event_ticket_type_exists(mocker):
+    user = create_user(mocker, roles=[create_role(mocker, "ORGANIZER")])
     event_ticket_type = mocker.Mock()
-    db, _res = db_with_tuples_first(mocker, (event_ticket_type, 1))
+    db, _res = db_with_tuples_first(mocker, (event_ticket_type, 1, True))
 
     returned = await require_event_ticket_type_access(1, db, user)
 
     assert returned.event_ticket_type is event_ticket_type
     assert returned.user is user
     db.execute.assert_awaited_once()
-    spy.assert_awaited_once_with(1, db=db, user=user)
+
+
+@pytest.mark.asyncio
+async def test_require_event_ticket_type_access_when_not_owner_raises_403(mocker):
+    user = create_user(mocker, roles=[create_role(mocker, "ORGANIZER")])
+    db, _res = db_with_tuples_first(mocker, (mocker.Mock(), 5, False))
+
+    with pytest.raises(Forbidden) as e:
+        await require_event_ticket_type_access(1, db, user)
+
+    assert e.value.ctx == {"event_id": 5, "reason": "organizer_mismatch"}
+    db.execute.assert_awaited_once()
 
 
 @pytest.mark.asyncio
 async def test_require_event_ticket_type_access_when_not_found_raises_404(mocker):
-    user = mocker.Mock()
+    user = create_user(mocker, roles=[])
     db, res = db_with_tuples_first(mocker, None)
 
     with pytest.raises(NotFound) as e:
@@ -260,7 +402,7 @@ async def test_require_authorized_address_admin_ok(mocker):
     )
     admin_role = mocker.Mock()
     admin_role.name = "ADMIN"
-    user = mocker.Mock(roles=[admin_role])
+    user = create_user(mocker, roles=[admin_role])
 
     db = mocker.Mock()
 
@@ -293,7 +435,7 @@ async def test_require_authorized_address_organizer_ok_when_shared_org_and_not_a
     )
     org_role = mocker.Mock()
     org_role.name = "ORGANIZER"
-    user = mocker.Mock(roles=[org_role], organizers=[mocker.Mock(id=5), mocker.Mock(id=9)])
+    user = create_user(mocker, roles=[org_role], organizers=[mocker.Mock(id=5), mocker.Mock(id=9)])
     db = mocker.Mock()
 
     result = await require_authorized_address(10, db, user)
@@ -310,7 +452,7 @@ async def test_require_authorized_address_organizer_mismatch_raises_403(mocker):
     )
     org_role = mocker.Mock()
     org_role.name = "ORGANIZER"
-    user = mocker.Mock(roles=[org_role], organizers=[mocker.Mock(id=7), mocker.Mock(id=8)])
+    user = create_user(mocker, roles=[org_role], organizers=[mocker.Mock(id=7), mocker.Mock(id=8)])
 
     db = mocker.Mock()
 
@@ -330,7 +472,7 @@ async def test_require_authorized_address_attached_to_venue_raises_403(mocker):
     )
     org_role = mocker.Mock()
     org_role.name = "ORGANIZER"
-    user = mocker.Mock(roles=[org_role], organizers=[mocker.Mock(id=1)])
+    user = create_user(mocker, roles=[org_role], organizers=[mocker.Mock(id=1)])
 
     db = mocker.Mock()
 
@@ -338,3 +480,99 @@ async def test_require_authorized_address_attached_to_venue_raises_403(mocker):
         await require_authorized_address(55, db, user)
 
     assert e.value.ctx == {"address_id": 55, "reason": "address_attached_to_venue"}
+
+
+def _patch_session(mocker, in_transaction: bool):
+    session = mocker.AsyncMock()
+    session.in_transaction = mocker.Mock(return_value=in_transaction)
+    factory = mocker.patch("app.core.database.AsyncSessionLocal")
+    factory.return_value.__aenter__.return_value = session
+    return session
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("in_transaction", [True, False])
+async def test_get_db_commits_only_when_session_was_used(mocker, in_transaction):
+    session = _patch_session(mocker, in_transaction)
+
+    gen = get_db()
+    assert await gen.__anext__() is session
+    with pytest.raises(StopAsyncIteration):
+        await gen.__anext__()
+
+    assert session.commit.await_count == int(in_transaction)
+    session.rollback.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_get_db_on_rollback_publishes_only_failed_audit_events(mocker):
+    _patch_session(mocker, True)
+    flush = mocker.patch("app.core.database.flush_audit_buffer", mocker.AsyncMock())
+
+    gen = get_db()
+    await gen.__anext__()
+    buffer = AUDIT_BUFFER_CTX.get()
+    buffer.append({"status": "SUCCESS"})
+    with pytest.raises(RuntimeError):
+        await gen.athrow(RuntimeError("handler failed"))
+
+    flush.assert_awaited_once_with(buffer, False)
+    assert AUDIT_BUFFER_CTX.get() is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("fail, expected_calls", [(False, 1), (True, 0)])
+async def test_get_db_runs_after_commit_hooks_only_on_commit(mocker, fail, expected_calls):
+    _patch_session(mocker, True)
+    mocker.patch("app.core.database.flush_audit_buffer", mocker.AsyncMock())
+    hook = mocker.AsyncMock()
+
+    gen = get_db()
+    await gen.__anext__()
+    await after_commit(hook)
+    hook.assert_not_awaited()
+    if fail:
+        with pytest.raises(RuntimeError):
+            await gen.athrow(RuntimeError("handler failed"))
+    else:
+        with pytest.raises(StopAsyncIteration):
+            await gen.__anext__()
+
+    assert hook.await_count == expected_calls
+
+
+def test_ownership_statements_rebind_ids_per_call(mocker):
+    from sqlalchemy.dialects import postgresql
+    from app.core.dependencies.events import _ticket_type_with_owner_stmt
+
+    def params(event_ticket_type_id, user):
+        return _ticket_type_with_owner_stmt(event_ticket_type_id, user).compile(dialect=postgresql.dialect()).params
+
+    assert params(5, create_user(mocker, id=7, roles=[create_role(mocker, "ORGANIZER")])) == {
+        "user_id_1": 7, "event_ticket_type_id_1": 5
+    }
+    assert params(6, create_user(mocker, id=8, roles=[create_role(mocker, "ORGANIZER")])) == {
+        "user_id_1": 8, "event_ticket_type_id_1": 6
+    }
+    assert params(9, create_user(mocker, id=1, roles=[create_role(mocker, "ADMIN")])) == {"event_ticket_type_id_1": 9}
+
+
+def test_user_role_names_and_organizer_ids_are_computed_once():
+    from app.domain.users.models import User, Role
+    from app.domain.organizers.models import Organizer
+
+    user = User(roles=[Role(name="ORGANIZER")], organizers=[Organizer(id=3)])
+
+    assert user.role_names == frozenset({"ORGANIZER"})
+    assert user.organizer_ids == frozenset({3})
+    assert user.role_names is user.role_names
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_sets_sorted_actor_roles(mocker):
+    user = create_user(mocker, id=7, roles=[create_role(mocker, "ORGANIZER"), create_role(mocker, "CUSTOMER")])
+    db, _ = db_with_scalars_first(mocker, user)
+
+    await get_current_user(_payload(), db)
+
+    assert AUTH_ROLES_CTX.get() == ("CUSTOMER", "ORGANIZER")
@@ -0,0 +1,15 @@
+import pytest
+from types import SimpleNamespace
+from app.core.utils import dto as dto_utils
+from app.domain.venues.schemas import VenueReadDTO
+
+
+@pytest.mark.parametrize("trusted", [True, False])
+def test_from_orm_builds_dto_from_attributes(monkeypatch, trusted):
+    monkeypatch.setattr(dto_utils, "TRUSTED_INTERNAL", trusted)
+    row = SimpleNamespace(id=1, name="Arena", address_id=5, extra="ignored")
+
+    dto = dto_utils.from_orm(VenueReadDTO, row)
+
+    assert dto == VenueReadDTO(id=1, name="Arena", address_id=5)
+    assert dto.model_dump_json() == '{"id":1,"name":"Arena","address_id":5}'
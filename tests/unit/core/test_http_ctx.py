@@ -0,0 +1,78 @@
+import pytest
+from types import SimpleNamespace
+from app.core.ctx import REQUEST_ID_CTX, ROUTE_CTX, CLIENT_IP_CTX, REDIS_CTX
+from app.core.middleware.http_ctx import _client_ip, HttpContextMiddleware
+from app.core.middleware.request_id import RequestIdMiddleware
+
+
+def _scope(headers: list[tuple[bytes, bytes]], client=("10.0.0.9", 1234), state=None) -> dict:
+    return {
+        "type": "http", "method": "GET", "path": "/events", "headers": headers, "client": client,
+        "app": SimpleNamespace(state=state or SimpleNamespace()),
+    }
+
+
+def test_client_ip_takes_first_forwarded_hop():
+    assert _client_ip(_scope([(b"x-forwarded-for", b" 203.0.113.7 , 10.0.0.1, 10.0.0.2")])) == "203.0.113.7"
+
+
+def test_client_ip_single_forwarded_hop():
+    assert _client_ip(_scope([(b"x-forwarded-for", b"203.0.113.7")])) == "203.0.113.7"
+
+
+def test_client_ip_without_forwarded_header_uses_peer():
+    assert _client_ip(_scope([])) == "10.0.0.9"
+    assert _client_ip(_scope([], client=None)) is None
+
+
+@pytest.mark.asyncio
+async def test_http_context_middleware_sets_and_resets_context():
+    seen = {}
+
+    async def app(scope, receive, send):
+        seen.update(rid=REQUEST_ID_CTX.get(), route=ROUTE_CTX.get(), ip=CLIENT_IP_CTX.get(), redis=REDIS_CTX.get())
+
+    redis_client = object()
+    scope = _scope([(b"x-request-id", b"req-1")], state=SimpleNamespace(redis=redis_client))
+    await HttpContextMiddleware(app)(scope, None, None)
+
+    assert seen == {"rid": "req-1", "route": "GET /events", "ip": "10.0.0.9", "redis": redis_client}
+    assert REQUEST_ID_CTX.get() is None
+    assert REDIS_CTX.get() is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("request_headers, response_headers, expected", [
+    ([(b"x-request-id", b"req-1")], [], b"req-1"),
+    ([(b"x-request-id", b"req-1")], [(b"x-request-id", b"from-app")], b"from-app"),
+])
+async def test_request_id_middleware_adds_response_header(request_headers, response_headers, expected):
+    sent = []
+
+    async def app(scope, receive, send):
+        assert REQUEST_ID_CTX.get() == "req-1"
+        await send({"type": "http.response.start", "status": 200, "headers": list(response_headers)})
+        await send({"type": "http.response.body", "body": b""})
+
+    async def send(message):
+        sent.append(message)
+
+    await RequestIdMiddleware(app)(_scope(request_headers), None, send)
+
+    assert dict(sent[0]["headers"])[b"x-request-id"] == expected
+    assert REQUEST_ID_CTX.get() is None
+
+
+@pytest.mark.asyncio
+async def test_request_id_middleware_generates_missing_id():
+    sent = []
+
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+
+    async def send(message):
+        sent.append(message)
+
+    await RequestIdMiddleware(app)(_scope([]), None, send)
+
+    assert len(dict(sent[0]["headers"])[b"x-request-id"]) == 36
@@ -1,5 +1,9 @@
 import pytest
-from app.core.pagination import PageDTO
+from datetime import datetime, timezone
+from sqlalchemy import select
+from app.core.pagination import PageDTO, encode_cursor, next_cursor, _decode_cursor, paginate
+from app.domain.events.models import Event
+from app.domain.exceptions import InvalidInput
 
 
 @pytest.mark.parametrize(
@@ -36,3 +40,94 @@ def test_pages_calculation(total, page_size, expected_pages):
 def test_has_next(total, page_size, page, expected_has_next):
     dto = PageDTO(items=[], total=total, page=page, page_size=page_size)
     assert dto.has_next == expected_has_next
+
+
+def test_cursor_roundtrip_restores_datetimes():
+    ts = datetime(2026, 5, 1, 18, 30, tzinfo=timezone.utc)
+
+    assert _decode_cursor(encode_cursor(ts, 42), [Event.event_start, Event.id]) == [ts, 42]
+
+
+@pytest.mark.parametrize("cursor", ["not-base64!", "W10", "WzFd"])
+def test_invalid_cursor_raises_invalid_input(cursor):
+    with pytest.raises(InvalidInput):
+        _decode_cursor(cursor, [Event.event_start, Event.id])
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        ["2025-01-01T00:00:00+00:00", "x"],
+        ["2025-01-01T00:00:00+00:00", {"id": 1}],
+        ["2025-01-01T00:00:00+00:00", True],
+        [1735689600, 1],
+    ]
+)
+def test_cursor_with_wrong_value_types_raises_invalid_input(values):
+    with pytest.raises(InvalidInput):
+        _decode_cursor(encode_cursor(*values), [Event.event_start, Event.id])
+
+
+def test_next_cursor_only_on_full_page():
+    assert next_cursor([1, 2], 3, lambda i: (i,)) is None
+    assert next_cursor([1, 2, 3], 3, lambda i: (i,)) == encode_cursor(3)
+
+
+def test_derived_fields_ignore_client_values_and_serialize():
+    dto = PageDTO(items=[], total=21, page=1, page_size=10, pages=99, has_next=False)
+
+    assert dto.model_dump() == {"items": [], "total": 21, "page": 1, "page_size": 10, "pages": 3, "has_next": True}
+
+
+def test_uncounted_cursor_page_derives_has_next_from_cursor():
+    last = PageDTO(items=[], total=None, page=1, page_size=10)
+    more = PageDTO(items=[], total=None, page=1, page_size=10, next_cursor="WzFd")
+
+    assert (last.pages, last.has_next) == (None, False)
+    assert (more.pages, more.has_next) == (None, True)
+
+
+def _db_with_window_rows(mocker, data):
+    frozen = mocker.Mock(data=data)
+    frozen.return_value.columns.return_value.all.return_value = [row[:-1] for row in data]
+    result = mocker.Mock()
+    result.keys.return_value = ["id", "name", "total_count"]
+    result.freeze.return_value = frozen
+    db = mocker.AsyncMock()
+    db.execute.return_value = result
+    return db, frozen
+
+
+@pytest.mark.asyncio
+async def test_paginate_reads_total_from_window_count(mocker):
+    db, frozen = _db_with_window_rows(mocker, [(1, "a", 12), (2, "b", 12)])
+
+    items, total = await paginate(db, select(Event.id, Event.name), page=2, page_size=2, scalars=False)
+
+    assert (items, total) == ([(1, "a"), (2, "b")], 12)
+    frozen.return_value.columns.assert_called_once_with(0, 1)
+    db.scalar.assert_not_called()
+    assert "count(*) OVER ()" in str(db.execute.await_args.args[0])
+
+
+@pytest.mark.asyncio
+async def test_paginate_counts_separately_past_last_page(mocker):
+    db, _ = _db_with_window_rows(mocker, [])
+    db.scalar.return_value = 3
+
+    assert await paginate(db, select(Event.id, Event.name), page=1, scalars=False) == ([], 0)
+    assert await paginate(db, select(Event.id, Event.name), page=5, scalars=False) == ([], 3)
+    db.scalar.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_paginate_keyset_page_skips_count(mocker):
+    db = mocker.AsyncMock()
+    db.execute.return_value = mocker.Mock(all=mocker.Mock(return_value=[(11,)]))
+
+    items, total = await paginate(db, select(Event.id), scalars=False, keyset=[Event.id], after=encode_cursor(10))
+
+    assert (items, total) == ([(11,)], None)
+    db.scalar.assert_not_called()
+    db.execute.assert_awaited_once()
+    assert "OVER" not in str(db.execute.await_args.args[0])
@@ -1,6 +1,6 @@
 import app.core.security as security
 import time_machine
-from jose import jwt
+import jwt
 from datetime import datetime, timezone, timedelta
 
 
@@ -25,12 +25,12 @@ def test_verify_password_false_for_incorrect():
 
 @time_machine.travel("2025-01-01 12:00:00", tick=False)
 def test_create_access_token_contains_expected_claims(monkeypatch):
-    monkeypatch.setattr(security, "SECRET_KEY", "fake-key")
+    monkeypatch.setattr(security, "SECRET_KEY", "fake-key-at-least-32-bytes-long!")
 
     token = security.create_access_token(subject=1)
     payload = jwt.decode(
         token,
-        "fake-key",
+        "fake-key-at-least-32-bytes-long!",
         algorithms=[security.ALGORITHM],
         issuer=security.JWT_ISSUER,
         audience=security.JWT_AUDIENCE
@@ -40,3 +40,13 @@ def test_create_access_token_contains_expected_claims(monkeypatch):
     assert payload["iat"] == int(now.timestamp())
     assert payload["exp"] == int((now + timedelta(minutes=security.ACCESS_TOKEN_EXPIRE_MINUTES)).timestamp())
     assert payload["sub"] == '1'
+    assert payload["roles"] == []
+
+
+def test_create_access_token_embeds_sorted_roles(monkeypatch):
+    monkeypatch.setattr(security, "SECRET_KEY", "fake-key-at-least-32-bytes-long!")
+
+    token = security.create_access_token(subject=1, roles=["ORGANIZER", "ADMIN"])
+    payload = jwt.decode(token, options={"verify_signature": False})
+
+    assert payload["roles"] == ["ADMIN", "ORGANIZER"]
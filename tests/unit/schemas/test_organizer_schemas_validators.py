@@ -1,6 +1,8 @@
+import json
 import pytest
+from datetime import datetime, timezone
 from pydantic import ValidationError
-from app.domain.organizers.schemas import OrganizerCreateDTO
+from app.domain.organizers.schemas import OrganizerCreateDTO, OrganizerReadDTO
 
 
 test_org_payload = {
@@ -40,3 +42,14 @@ def test_invalid_phone_number_raises_value_error():
     with pytest.raises(ValueError) as e:
         OrganizerCreateDTO(**test_org_payload, phone_number="90345682")
     assert "Invalid phone number" in str(e.value)
+
+
+def test_read_dto_omits_none_fields_from_json():
+    dto = OrganizerReadDTO(
+        id=1, name="ABC Events", email="abcevents@gmail.com", phone_number="+48600700800", vat_number=None,
+        registration_number="REG12345", iban=None, country_code="PL", address_id=4,
+        created_at=datetime(2026, 1, 1, tzinfo=timezone.utc)
+    )
+    body = json.loads(dto.model_dump_json())
+    assert "vat_number" not in body and "iban" not in body
+    assert body["registration_number"] == "REG12345"
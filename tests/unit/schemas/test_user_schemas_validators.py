@@ -1,6 +1,7 @@
+import json
 import pytest
 from pydantic import ValidationError
-from app.domain.users.schemas import UserCreateDTO
+from app.domain.users.schemas import UserCreateDTO, UserReadDTO
 
 
 test_user_payload = {
@@ -69,3 +70,11 @@ def test_phone_invalid_formats_raise_validation_error(bad_phone_number):
     with pytest.raises(ValidationError) as e:
         UserCreateDTO(**create_payload(phone_number=bad_phone_number))
     assert "Invalid phone number" in str(e.value)
+
+
+def test_read_dto_omits_none_fields_from_json():
+    dto = UserReadDTO(id=1, email="john@gmail.com", first_name="John", last_name="Derek", phone_number=None,
+                      birth_date=None)
+    body = json.loads(dto.model_dump_json())
+    assert "phone_number" not in body and "birth_date" not in body
+    assert body["email"] == "john@gmail.com"
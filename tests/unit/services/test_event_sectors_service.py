@@ -134,13 +134,9 @@ async def test_bulk_create_event_sectors_mixed_payload(mocker):
     event = mocker.Mock(id=10, venue_id=1)
     ga_sector = mocker.Mock(id=1, venue_id=1, is_ga=True, base_capacity=250)
     non_ga_sector = mocker.Mock(id=2, venue_id=1, is_ga=False, base_capacity=300)
-
-    async def get_sector_side_effect(db, sector_id):
-        return ga_sector if sector_id == 1 else non_ga_sector
-
-    mocker.patch(
-        "app.services.event_sectors_service.get_sector",
-        new=mocker.AsyncMock(side_effect=get_sector_side_effect)
+    get_sectors_spy = mocker.patch(
+        "app.services.event_sectors_service.get_sectors",
+        new=mocker.AsyncMock(return_value={1: ga_sector, 2: non_ga_sector})
     )
     sec1 = mocker.Mock(sector_id=1)
     sec2 = mocker.Mock(sector_id=2)
@@ -160,15 +156,16 @@ async def test_bulk_create_event_sectors_mixed_payload(mocker):
             {"sector_id": 2}
         ]
     )
+    get_sectors_spy.assert_awaited_once_with(db, [1, 2])
 
 @pytest.mark.asyncio
 async def test_bulk_create_event_sectors_venue_mismatch_stops_bulk_create_raises_invalid_input(mocker):
     event = mocker.Mock(id=10, venue_id=1)
     bad_sector = mocker.Mock(venue_id=2, is_ga=False)
     good_sector = mocker.Mock(venue_id=1, is_ga=True, base_capacity=250)
-    get_sector_spy = mocker.patch(
-        "app.services.event_sectors_service.get_sector",
-        new=mocker.AsyncMock(side_effect=[bad_sector, good_sector])
+    mocker.patch(
+        "app.services.event_sectors_service.get_sectors",
+        new=mocker.AsyncMock(return_value={1: bad_sector, 2: good_sector})
     )
     sec1 = mocker.Mock(sector_id=1)
     sec2 = mocker.Mock(sector_id=2)
@@ -182,34 +179,43 @@ async def test_bulk_create_event_sectors_venue_mismatch_stops_bulk_create_raises
         await event_sectors_service.bulk_create_event_sectors(db, schema, event)
 
     assert str(e.value) == "Sector does not belong to event venue"
-    get_sector_spy.assert_awaited_once()
     bulk_spy.assert_not_awaited()
 
 
 @pytest.mark.asyncio
 async def test_delete_event_sector_ok(mocker):
-    event_sector = mocker.Mock()
-    get_sector_spy = mocker.patch(
-        "app.services.event_sectors_service.get_event_sector",
-        new=mocker.AsyncMock(return_value=event_sector)
+    delete_spy = mocker.patch(
+        "app.services.event_sectors_service.crud.delete_event_sector",
+        new=mocker.AsyncMock(return_value=7)
     )
-    delete_spy = mocker.patch("app.services.event_sectors_service.crud.delete_event_sector", new=mocker.AsyncMock())
     db = mocker.Mock()
-    db.flush = mocker.AsyncMock()
 
     await event_sectors_service.delete_event_sector(db, 1, 1)
 
-    get_sector_spy.assert_awaited_once_with(db, 1, 1)
-    delete_spy.assert_awaited_once_with(db, event_sector)
-    db.flush.assert_awaited_once()
+    delete_spy.assert_awaited_once_with(db, 1, 1)
+
+
+@pytest.mark.asyncio
+async def test_delete_event_sector_missing_raises_notfound(mocker):
+    mocker.patch(
+        "app.services.event_sectors_service.crud.delete_event_sector",
+        new=mocker.AsyncMock(return_value=None)
+    )
+    db = mocker.Mock()
+
+    with pytest.raises(NotFound) as e:
+        await event_sectors_service.delete_event_sector(db, 1, 1)
+
+    assert str(e.value) == "Event sector not found"
 
 
 @pytest.mark.asyncio
 async def test_delete_event_sector_integrity_error_raises_conflict(mocker):
-    mocker.patch("app.services.event_sectors_service.get_event_sector", new=mocker.AsyncMock())
-    mocker.patch("app.services.event_sectors_service.crud.delete_event_sector", new=mocker.AsyncMock())
+    mocker.patch(
+        "app.services.event_sectors_service.crud.delete_event_sector",
+        new=mocker.AsyncMock(side_effect=IntegrityError("fk", None, None))
+    )
     db = mocker.Mock()
-    db.flush = mocker.AsyncMock(side_effect=IntegrityError("fk", None, None))
 
     with pytest.raises(Conflict) as e:
         await event_sectors_service.delete_event_sector(db, 1, 1)
@@ -0,0 +1,48 @@
+import pytest
+from decimal import Decimal
+from types import SimpleNamespace
+from app.services import event_ticket_type_service
+from app.domain.exceptions import NotFound
+
+
+@pytest.mark.asyncio
+async def test_list_ticket_types_by_event_sector_keys_maps_rows(mocker):
+    row = SimpleNamespace(id=5, event_sector_id=2, ticket_type_id=3, price_net=Decimal("100.00"),
+                          vat_rate=Decimal("1.23"))
+    crud_spy = mocker.patch(
+        "app.services.event_ticket_type_service.crud.list_event_ticket_types_by_event_sector",
+        new=mocker.AsyncMock(return_value=[row])
+    )
+    db = mocker.Mock()
+
+    result = await event_ticket_type_service.list_ticket_types_by_event_sector_keys(db, 1, 7)
+
+    crud_spy.assert_awaited_once_with(db, 1, 7)
+    assert [r.id for r in result] == [5]
+    assert result[0].price_net == Decimal("100.00")
+
+
+@pytest.mark.asyncio
+async def test_list_ticket_types_by_event_sector_keys_sector_without_types_returns_empty(mocker):
+    row = SimpleNamespace(id=None, event_sector_id=None, ticket_type_id=None, price_net=None, vat_rate=None)
+    mocker.patch(
+        "app.services.event_ticket_type_service.crud.list_event_ticket_types_by_event_sector",
+        new=mocker.AsyncMock(return_value=[row])
+    )
+    db = mocker.Mock()
+
+    assert await event_ticket_type_service.list_ticket_types_by_event_sector_keys(db, 1, 7) == []
+
+
+@pytest.mark.asyncio
+async def test_list_ticket_types_by_event_sector_keys_missing_sector_raises_notfound(mocker):
+    mocker.patch(
+        "app.services.event_ticket_type_service.crud.list_event_ticket_types_by_event_sector",
+        new=mocker.AsyncMock(return_value=[])
+    )
+    db = mocker.Mock()
+
+    with pytest.raises(NotFound) as e:
+        await event_ticket_type_service.list_ticket_types_by_event_sector_keys(db, 1, 7)
+
+    assert str(e.value) == "Event sector not found"
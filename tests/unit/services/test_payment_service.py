@@ -0,0 +1,59 @@
+import pytest
+import uuid
+from decimal import Decimal
+from types import SimpleNamespace
+from app.services import payment_service
+from app.domain.payments.models import PaymentStatus
+from app.domain.payments.schemas import PaymentCreateDTO
+
+
+def _db_with_payments(mocker, payments):
+    db = mocker.Mock()
+    result = mocker.Mock()
+    result.all.return_value = payments
+    db.scalars = mocker.AsyncMock(return_value=result)
+    return db
+
+
+def _patch_order_and_method(mocker):
+    order = SimpleNamespace(id=10, total_price=Decimal("50.00"))
+    method = SimpleNamespace(id=3)
+    mocker.patch("app.services.payment_service._require_awaiting_order", new=mocker.AsyncMock(return_value=order))
+    mocker.patch(
+        "app.services.payment_service._require_active_payment_method",
+        new=mocker.AsyncMock(return_value=method)
+    )
+
+
+@pytest.mark.asyncio
+async def test_start_payment_returns_idempotent_hit_from_single_lookup(mocker):
+    _patch_order_and_method(mocker)
+    key = str(uuid.uuid4())
+    hit = SimpleNamespace(id=7, order_id=10, payment_method_id=3, amount=Decimal("50.00"),
+                          status=PaymentStatus.REQUIRES_ACTION, idempotency_key=key)
+    other = SimpleNamespace(id=8, order_id=10, payment_method_id=3, amount=Decimal("50.00"),
+                            status=PaymentStatus.PENDING, idempotency_key=str(uuid.uuid4()))
+    db = _db_with_payments(mocker, [other, hit])
+
+    payment, redirect_url = await payment_service.start_payment(
+        db, SimpleNamespace(id=1), PaymentCreateDTO(payment_method_id=3), key
+    )
+
+    assert payment is hit
+    assert redirect_url == f"/payments/7/redirect?ik={key}"
+    db.scalars.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_start_payment_reuses_active_payment_for_order(mocker):
+    _patch_order_and_method(mocker)
+    active = SimpleNamespace(id=8, order_id=10, payment_method_id=3, amount=Decimal("50.00"),
+                             status=PaymentStatus.PENDING, idempotency_key=str(uuid.uuid4()))
+    db = _db_with_payments(mocker, [active])
+
+    payment, redirect_url = await payment_service.start_payment(
+        db, SimpleNamespace(id=1), PaymentCreateDTO(payment_method_id=3), str(uuid.uuid4())
+    )
+
+    assert payment is active
+    assert redirect_url == f"/payments/8/redirect?ik={active.idempotency_key}"
@@ -0,0 +1,54 @@
+import pytest
+from types import SimpleNamespace
+from sqlalchemy.exc import IntegrityError
+from app.services import venue_service
+from app.core.pagination import encode_cursor
+from app.domain.venues.schemas import SeatReadDTO, SeatsQueryDTO
+from app.domain.exceptions import NotFound, Conflict
+
+
+@pytest.mark.asyncio
+async def test_list_seats_by_sector_returns_page_with_keyset_cursor(mocker):
+    rows = [SimpleNamespace(id=1, sector_id=4, row=1, number=1), SimpleNamespace(id=2, sector_id=4, row=1, number=2)]
+    crud_spy = mocker.patch(
+        "app.services.venue_service.crud.list_seats_by_sector",
+        new=mocker.AsyncMock(return_value=(rows, 5))
+    )
+    db = mocker.Mock()
+
+    page = await venue_service.list_seats_by_sector(db, 4, SeatsQueryDTO(page_size=2))
+
+    crud_spy.assert_awaited_once_with(db, 4, 1, 2, after=None)
+    assert all(isinstance(seat, SeatReadDTO) for seat in page.items)
+    assert [(seat.row, seat.number) for seat in page.items] == [(1, 1), (1, 2)]
+    assert page.next_cursor == encode_cursor(1, 2, 2)
+
+
+@pytest.mark.asyncio
+async def test_delete_seat_missing_raises_not_found(mocker):
+    mocker.patch("app.services.venue_service.crud.delete_seat", new=mocker.AsyncMock(return_value=None))
+
+    with pytest.raises(NotFound):
+        await venue_service.delete_seat(mocker.Mock(), 9)
+
+
+@pytest.mark.asyncio
+async def test_delete_seat_integrity_error_raises_conflict(mocker):
+    mocker.patch(
+        "app.services.venue_service.crud.delete_seat",
+        new=mocker.AsyncMock(side_effect=IntegrityError("DELETE", {}, Exception()))
+    )
+
+    with pytest.raises(Conflict):
+        await venue_service.delete_seat(mocker.Mock(), 9)
+
+
+@pytest.mark.asyncio
+async def test_delete_seat_detaches_ticket_instances_before_delete(mocker):
+    db = mocker.AsyncMock()
+    db.scalar.return_value = 9
+
+    await venue_service.delete_seat(db, 9)
+
+    assert str(db.execute.await_args.args[0]).startswith("UPDATE ticket_instances SET seat_id")
+    assert str(db.scalar.await_args.args[0]).startswith("DELETE FROM seats")
@@ -0,0 +1,70 @@
+import msgpack
+import pytest
+from app.workers import audit_worker
+from app.workers.audit_worker import _process_entries, _payload_from_fields, _params_from_payload
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.acked: list = []
+
+    async def xack(self, stream, group, *ids):
+        self.acked.extend(ids)
+
+
+def _entry(msg_id: bytes, **payload):
+    return msg_id, {b"mp": msgpack.packb(payload)}
+
+
+@pytest.mark.asyncio
+async def test_process_entries_writes_valid_rows_in_one_batch_and_acks_all(mocker):
+    write = mocker.patch.object(audit_worker, "_write_rows", mocker.AsyncMock())
+    r = _FakeRedis()
+
+    await _process_entries(r, None, [
+        _entry(b"1-0", scope="CART", action="CHECKOUT"),
+        _entry(b"2-0", action="CHECKOUT"),
+        _entry(b"3-0", scope="CART", action="RESERVE"),
+    ])
+
+    write.assert_awaited_once()
+    assert [row["action"] for row in write.await_args.args[1]] == ["CHECKOUT", "RESERVE"]
+    assert sorted(r.acked) == [b"1-0", b"2-0", b"3-0"]
+
+
+@pytest.mark.asyncio
+async def test_process_entries_when_batch_fails_keeps_only_failing_rows_pending(mocker):
+    async def _write(session, rows):
+        if len(rows) > 1 or rows[0]["action"] == "BAD":
+            raise RuntimeError("insert failed")
+
+    mocker.patch.object(audit_worker, "_write_rows", side_effect=_write)
+    r = _FakeRedis()
+
+    await _process_entries(r, None, [
+        _entry(b"1-0", scope="CART", action="BAD"),
+        _entry(b"2-0", scope="CART", action="CHECKOUT"),
+    ])
+
+    assert r.acked == [b"2-0"]
+
+
+def test_payload_from_fields_reads_positional_and_legacy_map_frames():
+    frame = msgpack.packb(["req-1", "CART", "CHECKOUT", "SUCCESS"])
+
+    assert _payload_from_fields({b"mp": frame}) == {"request_id": "req-1", "scope": "CART", "action": "CHECKOUT",
+                                                    "status": "SUCCESS"}
+    assert _payload_from_fields({b"mp": msgpack.packb({"scope": "CART"})}) == {"scope": "CART"}
+
+
+@pytest.mark.parametrize("scope, status, success", [(13, True, True), (13, False, False), ("CART", "fail", False)])
+def test_params_from_payload_accepts_compact_and_named_scope_and_status(scope, status, success):
+    params = _params_from_payload({"scope": scope, "action": "CHECKOUT", "status": status})
+
+    assert params["scope"] == 13
+    assert params["success"] is success
+
+
+def test_params_from_payload_rejects_unknown_scope_id():
+    with pytest.raises(ValueError):
+        _params_from_payload({"scope": 99, "action": "CHECKOUT"})